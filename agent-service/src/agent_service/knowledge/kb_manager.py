@@ -1,38 +1,72 @@
+import asyncio
+import hashlib
+import os
+import re
 import uuid
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
-from agent_service.utils import create_llamastack_client
+from agent_service.utils import create_async_llamastack_client
 from shared_models import configure_logging
 
 logger = configure_logging("agent-service")
 
+# Concurrent file uploads across all knowledge bases during async ingestion
+KB_UPLOAD_CONCURRENCY = int(os.getenv("KB_UPLOAD_CONCURRENCY", "8"))
+# Seconds between status checks of a vector store file batch
+KB_BATCH_POLL_INTERVAL = float(os.getenv("KB_BATCH_POLL_INTERVAL", "1.0"))
+# Maximum files per vector store file batch
+KB_BATCH_MAX_FILES = 500
+# Delete older vector stores of a knowledge base after a successful update
+KB_GC_STALE_STORES = os.getenv("KB_GC_STALE_STORES", "true").lower() == "true"
+
+
+class IndexedFile(NamedTuple):
+    """Manifest entry for a file indexed in a vector store."""
+
+    sha256: str
+    file_id: str
+    status: str
+
 
 class KnowledgeBaseManager:
     def __init__(self) -> None:
-        self._llama_client: Any = None
+        self._async_llama_client: Any = None
         self._knowledge_bases_path = Path("config/knowledge_bases")
+        # (relative path, sha256) -> upload of that file during this run, shared
+        # across knowledge bases so an identical file is uploaded once. Files
+        # within one store never share an upload, as each carries its own path.
+        self._file_uploads: Dict[Tuple[str, str], "asyncio.Task[Optional[str]]"] = {}
+        # Files detached from a store or left in a deleted store during this
+        # run; deleted from the Files API once no vector store references them
+        self._released_file_ids: Set[str] = set()
 
-    def connect_to_llamastack_client(self) -> None:
-        """Initialize LlamaStack client for OpenAI-compatible APIs"""
-        if self._llama_client is None:
+    def register_knowledge_bases(self) -> bool:
+        """Synchronous wrapper around ``register_knowledge_bases_async``.
+
+        Returns:
+            bool: True if all knowledge bases were registered successfully, False otherwise.
+        """
+        return asyncio.run(self.register_knowledge_bases_async())
+
+    def connect_to_async_llamastack_client(self) -> None:
+        """Initialize async LlamaStack client for non-blocking ingestion"""
+        if self._async_llama_client is None:
             logger.debug(
-                "Connecting to LlamaStack client for knowledge base operations"
+                "Connecting to async LlamaStack client for knowledge base operations"
             )
-            self._llama_client = create_llamastack_client()
+            self._async_llama_client = create_async_llamastack_client()
         else:
-            logger.debug("Already connected to LlamaStack client")
+            logger.debug("Already connected to async LlamaStack client")
 
-    def register_knowledge_bases(self) -> bool:
-        """Register all knowledge bases by processing directories in knowledge_bases path.
+    async def register_knowledge_bases_async(self) -> bool:
+        """Register all knowledge bases concurrently with bounded parallel uploads.
 
         Returns:
             bool: True if all knowledge bases were registered successfully, False otherwise.
         """
-        if self._llama_client is None:
-            self.connect_to_llamastack_client()
-
-        logger.debug("Registering knowledge bases via LlamaStack OpenAI-compatible API")
+        if self._async_llama_client is None:
+            self.connect_to_async_llamastack_client()
 
         if not self._knowledge_bases_path.exists():
             logger.warning(
@@ -41,74 +75,70 @@ class KnowledgeBaseManager:
             )
             return True  # No knowledge bases to register is not a failure
 
+        # Uploads from an earlier run may have been deleted since
+        self._file_uploads.clear()
+        kb_dirs = [d for d in self._knowledge_bases_path.iterdir() if d.is_dir()]
+        upload_semaphore = asyncio.Semaphore(max(1, KB_UPLOAD_CONCURRENCY))
+        results = await asyncio.gather(
+            *(
+                self.register_knowledge_base_async(kb_dir, upload_semaphore)
+                for kb_dir in kb_dirs
+            )
+        )
+
         success = True
-        # Process each directory in knowledge_bases
-        for kb_dir in self._knowledge_bases_path.iterdir():
-            if kb_dir.is_dir():
-                # Register via LlamaStack OpenAI-compatible API
-                result = self.register_knowledge_base(kb_dir)
-
-                # Log results
-                kb_name = kb_dir.name
-                if result:
-                    logger.info(
-                        "Successfully registered knowledge base via LlamaStack",
-                        kb_name=kb_name,
-                    )
-                else:
-                    logger.error(
-                        "Failed to register knowledge base via LlamaStack",
-                        kb_name=kb_name,
-                    )
-                    success = False
+        for kb_dir, result in zip(kb_dirs, results):
+            if result:
+                logger.info(
+                    "Successfully registered knowledge base via LlamaStack",
+                    kb_name=kb_dir.name,
+                )
+            else:
+                logger.error(
+                    "Failed to register knowledge base via LlamaStack",
+                    kb_name=kb_dir.name,
+                )
+                success = False
 
+        await self._delete_unreferenced_files()
         return success
 
-    def register_knowledge_base(self, kb_directory: Path) -> Optional[str]:
-        """Register a single knowledge base from a directory via LlamaStack OpenAI-compatible API"""
+    async def register_knowledge_base_async(
+        self, kb_directory: Path, upload_semaphore: asyncio.Semaphore
+    ) -> Optional[str]:
+        """Register or incrementally update a single knowledge base.
+
+        The latest existing vector store for the knowledge base is reused and
+        only added, changed or removed files are re-indexed. Older stores for
+        the same knowledge base are deleted once the update succeeds.
+        """
         kb_name = kb_directory.name
 
         logger.info("Registering knowledge base via LlamaStack", kb_name=kb_name)
 
-        if self._llama_client is None:
+        if self._async_llama_client is None:
             logger.error(
                 "LlamaStack client not connected. Cannot register knowledge base."
             )
             return None
 
         try:
-            # Create vector store with unique name using LlamaStack's OpenAI-compatible API
-            # Note: In llama-stack 0.3.3+, provider_id must be specified in extra_body
-            # to associate the vector store with the pgvector provider
-            vector_store_name = f"{kb_name}-kb-{uuid.uuid4().hex[:8]}"
-            vector_store = self._llama_client.vector_stores.create(
-                name=vector_store_name, extra_body={"provider_id": "pgvector"}
+            vector_store_id, stale_store_ids = await self._find_or_create_vector_store(
+                kb_name
             )
-            vector_store_id = vector_store.id
 
-            logger.info(
-                "Created vector store via LlamaStack",
-                vector_store_id=vector_store_id,
-                vector_store_name=vector_store_name,
+            indexed_files = await self._sync_files_to_vector_store(
+                kb_directory, vector_store_id, upload_semaphore
             )
-
-            # Upload files to vector store
-            uploaded_files = self._upload_files_to_vector_store(
-                kb_directory, vector_store_id
-            )
-
-            if uploaded_files > 0:
-                logger.info(
-                    "Successfully uploaded files via LlamaStack to vector store",
-                    uploaded_files=uploaded_files,
-                    vector_store_id=vector_store_id,
-                )
-                return str(vector_store_id)
-            else:
+            if indexed_files == 0:
                 logger.warning(
-                    "No knowledge base files uploaded via LlamaStack - vector store will be empty"
+                    "No knowledge base files indexed via LlamaStack - vector store is empty",
+                    vector_store_id=vector_store_id,
                 )
-                return str(vector_store_id)  # Return ID even if empty for consistency
+
+            if KB_GC_STALE_STORES:
+                await self._delete_vector_stores(stale_store_ids)
+            return vector_store_id
 
         except Exception as e:
             logger.error(
@@ -119,59 +149,364 @@ class KnowledgeBaseManager:
             )
             return None
 
-    def _upload_files_to_vector_store(
-        self, directory: Path, vector_store_id: str
-    ) -> int:
-        """Upload all txt files from a directory to LlamaStack vector store"""
-        if self._llama_client is None:
-            logger.error("LlamaStack client not connected. Cannot upload files.")
-            return 0
+    async def _find_or_create_vector_store(self, kb_name: str) -> Tuple[str, List[str]]:
+        """Return the vector store to update and the stale stores to delete.
 
-        uploaded_count = 0
+        Stores are named ``{kb_name}-kb-{suffix}``; the most recently created
+        one is reused and any others are stale leftovers of earlier runs.
+        """
+        name_pattern = re.compile(rf"{re.escape(kb_name)}-kb-[0-9a-f]{{8}}")
+        stores = [
+            vs
+            async for vs in self._async_llama_client.vector_stores.list()
+            if vs.name and name_pattern.fullmatch(vs.name)
+        ]
+        if stores:
+            stores.sort(key=lambda vs: vs.created_at, reverse=True)
+            latest = stores[0]
+            logger.info(
+                "Reusing existing vector store via LlamaStack",
+                vector_store_id=latest.id,
+                vector_store_name=latest.name,
+                stale_stores=len(stores) - 1,
+            )
+            return str(latest.id), [str(vs.id) for vs in stores[1:]]
 
-        # Find all .txt files in the directory
-        txt_files = list(directory.rglob("*.txt"))
+        # Note: In llama-stack 0.3.3+, provider_id must be specified in extra_body
+        vector_store_name = f"{kb_name}-kb-{uuid.uuid4().hex[:8]}"
+        vector_store = await self._async_llama_client.vector_stores.create(
+            name=vector_store_name, extra_body={"provider_id": "pgvector"}
+        )
+        logger.info(
+            "Created vector store via LlamaStack",
+            vector_store_id=vector_store.id,
+            vector_store_name=vector_store_name,
+        )
+        return str(vector_store.id), []
+
+    async def _delete_vector_stores(self, vector_store_ids: List[str]) -> None:
+        """Delete stale vector stores, logging rather than failing on errors"""
+        for vector_store_id in vector_store_ids:
+            try:
+                file_ids = list(await self._file_statuses(vector_store_id))
+                await self._async_llama_client.vector_stores.delete(
+                    vector_store_id=vector_store_id
+                )
+                self._released_file_ids.update(file_ids)
+                logger.info(
+                    "Deleted stale vector store via LlamaStack",
+                    vector_store_id=vector_store_id,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to delete stale vector store",
+                    vector_store_id=vector_store_id,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+    async def _sync_files_to_vector_store(
+        self,
+        directory: Path,
+        vector_store_id: str,
+        upload_semaphore: asyncio.Semaphore,
+    ) -> int:
+        """Bring the vector store in line with the txt files in a directory.
+
+        The store's manifest (relative path -> sha256 -> file_id) is compared
+        with the files on disk: new and changed files are uploaded in parallel
+        and attached in file batches, then entries for changed, removed or
+        untracked files are detached. Uploads that fail to index are detached
+        instead, leaving the previous version in place. Returns the number of
+        files indexed.
+        """
+        txt_files = sorted(f for f in directory.rglob("*.txt") if f.is_file())
         logger.info(
             "Found knowledge base files",
             file_count=len(txt_files),
             files=[f.name for f in txt_files],
         )
 
+        manifest, untracked_file_ids = await self._load_manifest(vector_store_id)
+        to_upload: List[Tuple[Path, bytes, str]] = []
+        unchanged: Set[str] = set()
         for file_path in txt_files:
-            if file_path.is_file():
-                try:
-                    logger.info(
-                        "Uploading knowledge base file via LlamaStack",
-                        file_path=str(file_path),
-                    )
+            content = await asyncio.to_thread(file_path.read_bytes)
+            sha256 = hashlib.sha256(content).hexdigest()
+            entry = manifest.get(str(file_path.relative_to(directory)))
+            if entry and entry.sha256 == sha256 and entry.status == "completed":
+                unchanged.add(entry.file_id)
+                continue
+            to_upload.append((file_path, content, sha256))
 
-                    # Upload file using LlamaStack's OpenAI-compatible API
-                    with open(file_path, "rb") as f:
-                        file_create_response = self._llama_client.files.create(
-                            file=f, purpose="assistants"
-                        )
+        uploads = await asyncio.gather(
+            *(
+                self._upload_file(
+                    file_path,
+                    str(file_path.relative_to(directory)),
+                    content,
+                    sha256,
+                    upload_semaphore,
+                )
+                for file_path, content, sha256 in to_upload
+            )
+        )
+        uploaded = [
+            (file_id, str(file_path.relative_to(directory)), sha256)
+            for (file_path, _, sha256), file_id in zip(to_upload, uploads)
+            if file_id
+        ]
+        failed_paths = {
+            str(file_path.relative_to(directory))
+            for (file_path, _, _), file_id in zip(to_upload, uploads)
+            if not file_id
+        }
 
-                    file_id = file_create_response.id
+        indexed: List[Tuple[str, str, str]] = []
+        for start in range(0, len(uploaded), KB_BATCH_MAX_FILES):
+            indexed += await self._attach_file_batch(
+                vector_store_id, uploaded[start : start + KB_BATCH_MAX_FILES]
+            )
+        indexed_ids = {file_id for file_id, _, _ in indexed}
+        not_indexed = [
+            file_id for file_id, _, _ in uploaded if file_id not in indexed_ids
+        ]
+        kept_paths = failed_paths | {
+            path for file_id, path, _ in uploaded if file_id not in indexed_ids
+        }
 
-                    # Attach file to vector store using LlamaStack's OpenAI-compatible API
-                    self._llama_client.vector_stores.files.create(
-                        vector_store_id=vector_store_id, file_id=file_id
-                    )
+        # Detach superseded entries only after their replacements are indexed,
+        # keeping the previous version of a file whose upload or indexing failed
+        obsolete = (
+            [
+                entry.file_id
+                for path, entry in manifest.items()
+                if entry.file_id not in unchanged
+                and entry.file_id not in indexed_ids
+                and path not in kept_paths
+            ]
+            + [file_id for file_id in untracked_file_ids if file_id not in indexed_ids]
+            + not_indexed
+        )
+        await self._detach_files(vector_store_id, obsolete, upload_semaphore)
 
-                    uploaded_count += 1
-                    logger.info(
-                        "Successfully uploaded and attached file via LlamaStack",
-                        file_id=file_id,
-                        file_path=str(file_path),
-                    )
+        logger.info(
+            "Synchronized knowledge base files with vector store",
+            vector_store_id=vector_store_id,
+            unchanged=len(unchanged),
+            uploaded=len(uploaded),
+            not_indexed=len(not_indexed),
+            detached=len(obsolete),
+        )
+        return len(unchanged) + len(indexed)
+
+    async def _load_manifest(
+        self, vector_store_id: str
+    ) -> Tuple[Dict[str, IndexedFile], List[str]]:
+        """Build the store's manifest from its file attributes.
 
+        The path and sha256 attributes set at attach time are persisted by
+        LlamaStack alongside the vector store, so the manifest survives
+        init-job restarts without separate storage. Returns the manifest and
+        the file ids of files without those attributes.
+        """
+        manifest: Dict[str, IndexedFile] = {}
+        untracked: List[str] = []
+        async for vs_file in self._async_llama_client.vector_stores.files.list(
+            vector_store_id=vector_store_id
+        ):
+            attributes = getattr(vs_file, "attributes", None) or {}
+            path = attributes.get("path")
+            if not path:
+                untracked.append(str(vs_file.id))
+                continue
+            previous = manifest.get(str(path))
+            if previous is not None:
+                # Duplicate entries for a path: keep one, detach the other
+                untracked.append(previous.file_id)
+            manifest[str(path)] = IndexedFile(
+                sha256=str(attributes.get("sha256", "")),
+                file_id=str(vs_file.id),
+                status=str(vs_file.status),
+            )
+        return manifest, untracked
+
+    async def _detach_files(
+        self,
+        vector_store_id: str,
+        file_ids: List[str],
+        upload_semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Remove files from the vector store, logging rather than failing on errors"""
+
+        async def detach(file_id: str) -> None:
+            async with upload_semaphore:
+                try:
+                    await self._async_llama_client.vector_stores.files.delete(
+                        file_id=file_id, vector_store_id=vector_store_id
+                    )
+                    self._released_file_ids.add(file_id)
                 except Exception as e:
-                    logger.error(
-                        "Failed to upload file to LlamaStack",
-                        file_path=str(file_path),
+                    logger.warning(
+                        "Failed to remove file from vector store",
+                        vector_store_id=vector_store_id,
+                        file_id=file_id,
                         error=str(e),
                         error_type=type(e).__name__,
                     )
-                    continue
 
-        return uploaded_count
+        await asyncio.gather(*(detach(file_id) for file_id in file_ids))
+
+    async def _delete_unreferenced_files(self) -> None:
+        """Delete released files that no vector store references any more.
+
+        Runs after every knowledge base is synced, since an upload can be
+        shared by several stores. Errors are logged rather than raised.
+        """
+        if not self._released_file_ids:
+            return
+        referenced: Set[str] = set()
+        try:
+            async for vector_store in self._async_llama_client.vector_stores.list():
+                referenced.update(await self._file_statuses(str(vector_store.id)))
+        except Exception as e:
+            logger.warning(
+                "Failed to list vector store files, keeping released files",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return
+
+        unreferenced = sorted(self._released_file_ids - referenced)
+        self._released_file_ids.clear()
+        deleted = 0
+        for file_id in unreferenced:
+            try:
+                await self._async_llama_client.files.delete(file_id=file_id)
+                deleted += 1
+            except Exception as e:
+                logger.warning(
+                    "Failed to delete knowledge base file",
+                    file_id=file_id,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+        logger.info(
+            "Deleted unreferenced knowledge base files via LlamaStack",
+            deleted=deleted,
+            failed=len(unreferenced) - deleted,
+        )
+
+    async def _upload_file(
+        self,
+        file_path: Path,
+        relative_path: str,
+        content: bytes,
+        sha256: str,
+        upload_semaphore: asyncio.Semaphore,
+    ) -> Optional[str]:
+        """Upload one file, sharing an identical upload from this run"""
+        upload_key = (relative_path, sha256)
+        upload = self._file_uploads.get(upload_key)
+        if upload is None:
+            upload = asyncio.create_task(
+                self._create_file(file_path, content, upload_semaphore)
+            )
+            self._file_uploads[upload_key] = upload
+        return await upload
+
+    async def _create_file(
+        self, file_path: Path, content: bytes, upload_semaphore: asyncio.Semaphore
+    ) -> Optional[str]:
+        async with upload_semaphore:
+            try:
+                response = await self._async_llama_client.files.create(
+                    file=(file_path.name, content), purpose="assistants"
+                )
+            except Exception as e:
+                logger.error(
+                    "Failed to upload file to LlamaStack",
+                    file_path=str(file_path),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                return None
+
+        file_id = str(response.id)
+        logger.info(
+            "Uploaded knowledge base file via LlamaStack",
+            file_id=file_id,
+            file_path=str(file_path),
+        )
+        return file_id
+
+    async def _attach_file_batch(
+        self, vector_store_id: str, files: List[Tuple[str, str, str]]
+    ) -> List[Tuple[str, str, str]]:
+        """Attach (file_id, path, sha256) files in one batch and wait for indexing.
+
+        A failed or cancelled batch may still have indexed some of its files,
+        so per-file statuses are read back and only completed files returned.
+        File batches apply one set of attributes to every file, so each
+        completed file's path and content hash are set afterwards for change
+        detection.
+        """
+        client = self._async_llama_client
+        batch = await client.vector_stores.file_batches.create(
+            vector_store_id=vector_store_id, file_ids=[f[0] for f in files]
+        )
+        while batch.status == "in_progress":
+            await asyncio.sleep(KB_BATCH_POLL_INTERVAL)
+            batch = await client.vector_stores.file_batches.retrieve(
+                batch_id=batch.id, vector_store_id=vector_store_id
+            )
+
+        statuses = await self._file_statuses(vector_store_id)
+        completed = [f for f in files if statuses.get(f[0]) == "completed"]
+        file_counts = batch.file_counts
+        logger.info(
+            "Attached file batch to vector store via LlamaStack",
+            vector_store_id=vector_store_id,
+            status=batch.status,
+            completed=file_counts.completed,
+            failed=file_counts.failed,
+        )
+        if len(completed) < len(files):
+            # Their previous versions stay attached until a later run succeeds
+            logger.warning(
+                "Knowledge base files failed to index",
+                vector_store_id=vector_store_id,
+                batch_status=batch.status,
+                not_indexed=len(files) - len(completed),
+            )
+
+        results = await asyncio.gather(
+            *(
+                client.vector_stores.files.update(
+                    file_id=file_id,
+                    vector_store_id=vector_store_id,
+                    attributes={"path": path, "sha256": sha256},
+                )
+                for file_id, path, sha256 in completed
+            ),
+            return_exceptions=True,
+        )
+        failed_updates = [r for r in results if isinstance(r, Exception)]
+        if failed_updates:
+            # Untagged files are simply re-indexed on the next run
+            logger.warning(
+                "Failed to set content hash on vector store files",
+                vector_store_id=vector_store_id,
+                failed=len(failed_updates),
+                error=str(failed_updates[0]),
+            )
+        return completed
+
+    async def _file_statuses(self, vector_store_id: str) -> Dict[str, str]:
+        """Map each file in the vector store to its indexing status"""
+        return {
+            str(vs_file.id): str(vs_file.status)
+            async for vs_file in self._async_llama_client.vector_stores.files.list(
+                vector_store_id=vector_store_id
+            )
+        }
@@ -0,0 +1,101 @@
+"""LangGraph state machine timing metrics for observability.
+
+Uses OpenTelemetry metrics API. When a MeterProvider is configured (e.g. OTLP
+exporter via OTEL_EXPORTER_OTLP_ENDPOINT), these metrics are exported.
+Otherwise no-ops via NoOpMeterProvider.
+
+A turn's time splits into graph operations (aget_state, ainvoke,
+aupdate_state), which include checkpoint loads and saves, and node time.
+Within a node, LLM response time is recorded separately; the remainder is
+prompt formatting, routing and state handling.
+"""
+
+import functools
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def _suppress_metrics_errors(func: Callable[..., T]) -> Callable[..., T]:
+    """Suppress exceptions in metrics recording (no-op if MeterProvider not configured)."""
+
+    @functools.wraps(func)
+    def wrapper(*args: object, **kwargs: object) -> T | None:
+        try:
+            return func(*args, **kwargs)
+        except Exception:  # noqa: BLE001
+            return None
+
+    return wrapper  # type: ignore[return-value]
+
+
+try:
+    from opentelemetry import metrics
+    from opentelemetry.metrics import Histogram
+
+    _meter = metrics.get_meter(
+        "agent-service.langgraph",
+        version="0.1.0",
+    )
+    _node_duration: Histogram = _meter.create_histogram(
+        name="agent_service_graph_node_duration_seconds",
+        description="Time spent in one LangGraph state machine node",
+        unit="s",
+    )
+    _llm_response_duration: Histogram = _meter.create_histogram(
+        name="agent_service_llm_response_duration_seconds",
+        description="Time for one LLM response attempt, including moderation",
+        unit="s",
+    )
+    _graph_operation_duration: Histogram = _meter.create_histogram(
+        name="agent_service_graph_operation_duration_seconds",
+        description="Time for one compiled graph call (aget_state, ainvoke, aupdate_state)",
+        unit="s",
+    )
+    _checkpoint_duration: Histogram = _meter.create_histogram(
+        name="agent_service_checkpoint_duration_seconds",
+        description="Time for one checkpointer load or save",
+        unit="s",
+    )
+except Exception:  # noqa: BLE001
+    _node_duration = None
+    _llm_response_duration = None
+    _graph_operation_duration = None
+    _checkpoint_duration = None
+
+
+@_suppress_metrics_errors
+def record_node_duration(
+    seconds: float, state_name: str, state_type: str, agent: str
+) -> None:
+    """Record time spent in a state machine node."""
+    if _node_duration is not None:
+        _node_duration.record(
+            seconds,
+            {"state_name": state_name, "state_type": state_type, "agent": agent},
+        )
+
+
+@_suppress_metrics_errors
+def record_llm_response_duration(seconds: float, state_name: str, agent: str) -> None:
+    """Record one LLM response attempt made from a state."""
+    if _llm_response_duration is not None:
+        _llm_response_duration.record(
+            seconds, {"state_name": state_name, "agent": agent}
+        )
+
+
+@_suppress_metrics_errors
+def record_graph_operation_duration(seconds: float, operation: str, agent: str) -> None:
+    """Record a compiled graph call such as ainvoke or aget_state."""
+    if _graph_operation_duration is not None:
+        _graph_operation_duration.record(
+            seconds, {"operation": operation, "agent": agent}
+        )
+
+
+@_suppress_metrics_errors
+def record_checkpoint_duration(seconds: float, operation: str) -> None:
+    """Record a checkpointer operation (get, put, put_writes)."""
+    if _checkpoint_duration is not None:
+        _checkpoint_duration.record(seconds, {"operation": operation})
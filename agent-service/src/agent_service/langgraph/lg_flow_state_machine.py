@@ -6,6 +6,7 @@ This module contains the StateMachine and AgentSession classes for managing
 conversational flows using LangGraph with persistent checkpoint storage.
 """
 import os
+import time
 from pathlib import Path
 from typing import Annotated, Any, Dict, List, Optional, TypedDict
 
@@ -17,6 +18,8 @@ from langgraph.graph.message import add_messages
 from langgraph.types import Command
 from shared_models import configure_logging
 
+from .graph_metrics import record_graph_operation_duration, record_node_duration
+
 # Import PostgreSQL checkpoint utilities
 from .postgres_checkpoint import get_postgres_checkpointer, reset_postgres_checkpointer
 from .util import resolve_agent_service_path
@@ -1242,6 +1245,7 @@ class ConversationSession:
         states_config = self.state_machine.config.get("states", {})
         settings = self.state_machine.config.get("settings", {})
         initial_state = settings.get("initial_state", "collect_employee_id")
+        agent_name = self.agent.config.get("name", "")
 
         # Add a node for each state in the YAML configuration
         node_names = []
@@ -1322,7 +1326,19 @@ class ConversationSession:
                         # Return Command with routing information
                         return Command(goto=next_node, update=updated_state)
 
-                return node_func
+                async def timed_node_func(
+                    state: dict[str, Any],
+                ) -> Command[Any] | dict[str, Any]:
+                    """Run the node and record its duration by state and agent."""
+                    start = time.perf_counter()
+                    try:
+                        return await node_func(state)
+                    finally:
+                        record_node_duration(
+                            time.perf_counter() - start, name, stype, agent_name
+                        )
+
+                return timed_node_func
 
             workflow.add_node(state_name, make_node_func(state_name, state_type))  # type: ignore[no-untyped-call]
 
@@ -1356,6 +1372,21 @@ class ConversationSession:
         # Compile with checkpointer only
         return workflow.compile(checkpointer=self.checkpointer, debug=False)
 
+    async def _timed_graph_call(self, operation: str, call: Any) -> Any:
+        """Await a compiled graph call and record its duration.
+
+        Graph call time includes checkpoint loads and saves as well as node time.
+        """
+        start = time.perf_counter()
+        try:
+            return await call
+        finally:
+            record_graph_operation_duration(
+                time.perf_counter() - start,
+                operation,
+                self.agent.config.get("name", ""),
+            )
+
     async def get_initial_response(self) -> str | list[str | dict[str, Any]]:
         """Get the initial response from the agent by checking conversation history."""
         try:
@@ -1367,8 +1398,9 @@ class ConversationSession:
             else:
                 # New conversation - initialize and get first response
                 initial_state = self.state_machine.create_initial_state()
-                result = await self.app.ainvoke(
-                    initial_state, config=self.thread_config
+                result = await self._timed_graph_call(
+                    "ainvoke",
+                    self.app.ainvoke(initial_state, config=self.thread_config),
                 )
 
                 if result.get("messages"):
@@ -1392,7 +1424,9 @@ class ConversationSession:
             The current state from LangGraph (has .values attribute)
         """
         try:
-            return await self.app.aget_state(self.thread_config)
+            return await self._timed_graph_call(
+                "aget_state", self.app.aget_state(self.thread_config)
+            )
         except Exception as e:
             error_str = str(e).lower()
             # Check if this is a connection error
@@ -1412,7 +1446,9 @@ class ConversationSession:
                 self.app = self._create_graph()
                 # Retry once
                 try:
-                    return await self.app.aget_state(self.thread_config)
+                    return await self._timed_graph_call(
+                        "aget_state", self.app.aget_state(self.thread_config)
+                    )
                 except Exception as e2:
                     logger.error(
                         "Failed to get state after connection reset",
@@ -1476,8 +1512,9 @@ class ConversationSession:
                 if token_context:
                     self.current_token_context = token_context
 
-                result: Any = await self.app.ainvoke(
-                    initial_state, config=self.thread_config
+                result: Any = await self._timed_graph_call(
+                    "ainvoke",
+                    self.app.ainvoke(initial_state, config=self.thread_config),
                 )
             else:
                 # Existing conversation - add user message and continue
@@ -1496,8 +1533,9 @@ class ConversationSession:
                 if token_context:
                     self.current_token_context = token_context
 
-                result2: Any = await self.app.ainvoke(
-                    current_values, config=self.thread_config
+                result2: Any = await self._timed_graph_call(
+                    "ainvoke",
+                    self.app.ainvoke(current_values, config=self.thread_config),
                 )
 
             # Extract agent response
@@ -1536,8 +1574,11 @@ class ConversationSession:
 
                     # Update the state to clear the data (but don't set current_state)
                     if reset_state_without_current:
-                        await self.app.aupdate_state(
-                            self.thread_config, reset_state_without_current
+                        await self._timed_graph_call(
+                            "aupdate_state",
+                            self.app.aupdate_state(
+                                self.thread_config, reset_state_without_current
+                            ),
                         )
 
                     if agent_response:
@@ -6,14 +6,62 @@ The LangGraph tables are set up by the database migration job, so this module
 just creates AsyncPostgresSaver instances with proper connection management.
 """
 
-from typing import Optional
-
+import time
+from typing import Any, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from shared_models import configure_logging
 from shared_models.database import get_database_manager
 
+from .graph_metrics import record_checkpoint_duration
+
 logger = configure_logging("agent-service")
 
+
+class TimedAsyncPostgresSaver(AsyncPostgresSaver):
+    """AsyncPostgresSaver that records how long each checkpoint load and save takes."""
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        start = time.perf_counter()
+        try:
+            return await super().aget_tuple(config)
+        finally:
+            record_checkpoint_duration(time.perf_counter() - start, "get")
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        start = time.perf_counter()
+        try:
+            return await super().aput(config, checkpoint, metadata, new_versions)
+        finally:
+            record_checkpoint_duration(time.perf_counter() - start, "put")
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        start = time.perf_counter()
+        try:
+            await super().aput_writes(config, writes, task_id, task_path)
+        finally:
+            record_checkpoint_duration(time.perf_counter() - start, "put_writes")
+
+
 # Global checkpointer instance for connection reuse
 _checkpointer: Optional[AsyncPostgresSaver] = None
 
@@ -34,7 +82,7 @@ async def get_postgres_checkpointer() -> AsyncPostgresSaver:
             # Get an async connection from the pool for the checkpointer
             db_manager = get_database_manager()
             conn = await db_manager.get_async_connection()
-            _checkpointer = AsyncPostgresSaver(conn)
+            _checkpointer = TimedAsyncPostgresSaver(conn)
             logger.debug(
                 "Created AsyncPostgresSaver with shared configuration and connection pooling"
             )
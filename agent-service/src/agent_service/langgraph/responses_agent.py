@@ -1,5 +1,6 @@
 import asyncio
 import os
+import time
 from typing import Any, Dict, Optional
 
 import yaml
@@ -8,6 +9,7 @@ from opentelemetry.propagate import inject
 from shared_models import configure_logging
 from tracing_config.auto_tracing import tracingIsActive
 
+from .graph_metrics import record_llm_response_duration
 from .util import load_config_from_path, resolve_agent_service_path
 
 logger = configure_logging("agent-service")
@@ -466,17 +468,25 @@ class Agent:
             retry_reason = None
 
             try:
-                response = await self.create_response(
-                    messages,
-                    temperature=temperature,
-                    additional_system_messages=additional_system_messages,
-                    authoritative_user_id=authoritative_user_id,
-                    allowed_tools=allowed_tools,
-                    skip_all_tools=skip_all_tools,
-                    skip_mcp_servers_only=skip_mcp_servers_only,
-                    current_state_name=current_state_name,
-                    token_context=token_context,
-                )
+                attempt_start = time.perf_counter()
+                try:
+                    response = await self.create_response(
+                        messages,
+                        temperature=temperature,
+                        additional_system_messages=additional_system_messages,
+                        authoritative_user_id=authoritative_user_id,
+                        allowed_tools=allowed_tools,
+                        skip_all_tools=skip_all_tools,
+                        skip_mcp_servers_only=skip_mcp_servers_only,
+                        current_state_name=current_state_name,
+                        token_context=token_context,
+                    )
+                finally:
+                    record_llm_response_duration(
+                        time.perf_counter() - attempt_start,
+                        current_state_name or "",
+                        self.agent_name,
+                    )
 
                 # Check if response is empty or contains error
                 if response and response.strip():
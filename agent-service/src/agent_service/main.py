@@ -16,6 +16,7 @@ from shared_models import (
     CloudEventHandler,
     DatabaseUtils,
     EventTypes,
+    QueryTrackingMiddleware,
     acquire_agent_session_lock,
     configure_logging,
     create_cloudevent_response,
@@ -733,6 +734,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Record database queries and pool waits per request
+app.add_middleware(QueryTrackingMiddleware)
+
 
 @app.get("/health")
 async def health_check() -> Dict[str, Any]:
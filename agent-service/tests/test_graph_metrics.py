@@ -0,0 +1,83 @@
+"""Tests for LangGraph node, graph call and checkpoint timing metrics."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from agent_service.langgraph.lg_flow_state_machine import ConversationSession
+from agent_service.langgraph.postgres_checkpoint import TimedAsyncPostgresSaver
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+FLOW = """
+settings:
+  initial_state: waiting_for_input
+states:
+  waiting_for_input:
+    type: waiting
+    transitions:
+      user_input: end
+  end:
+    type: terminal
+"""
+
+
+@pytest.mark.asyncio
+async def test_nodes_and_graph_calls_are_timed(tmp_path: Path) -> None:
+    """Each node records its duration labelled by state, type and agent."""
+    config_path = tmp_path / "flow.yaml"
+    config_path.write_text(FLOW)
+    agent = SimpleNamespace(
+        config={"name": "test-agent", "lg_state_machine_config": str(config_path)}
+    )
+    session = ConversationSession(agent, checkpointer=InMemorySaver())
+
+    with (
+        patch(
+            "agent_service.langgraph.lg_flow_state_machine.record_node_duration"
+        ) as record_node,
+        patch(
+            "agent_service.langgraph.lg_flow_state_machine.record_graph_operation_duration"
+        ) as record_operation,
+    ):
+        await session.send_message("hello")
+
+    nodes = [call.args[1:] for call in record_node.call_args_list]
+    assert nodes == [
+        ("waiting_for_input", "waiting", "test-agent"),
+        ("end", "terminal", "test-agent"),
+    ]
+    assert all(call.args[0] >= 0 for call in record_node.call_args_list)
+    operations = [call.args[1:] for call in record_operation.call_args_list]
+    assert operations == [("aget_state", "test-agent"), ("ainvoke", "test-agent")]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_operations_are_timed() -> None:
+    """Checkpoint loads and saves record their duration by operation."""
+    saver = TimedAsyncPostgresSaver(MagicMock())
+    config = RunnableConfig(configurable={"thread_id": "t1"})
+
+    with (
+        patch.object(AsyncPostgresSaver, "aget_tuple", AsyncMock(return_value=None)),
+        patch.object(AsyncPostgresSaver, "aput", AsyncMock(return_value=config)),
+        patch.object(
+            AsyncPostgresSaver, "aput_writes", AsyncMock(side_effect=RuntimeError)
+        ),
+        patch(
+            "agent_service.langgraph.postgres_checkpoint.record_checkpoint_duration"
+        ) as record,
+    ):
+        assert await saver.aget_tuple(config) is None
+        assert await saver.aput(config, MagicMock(), MagicMock(), {}) == config
+        with pytest.raises(RuntimeError):
+            await saver.aput_writes(config, [], "task-1")
+
+    # Failed operations are still timed
+    assert [call.args[1] for call in record.call_args_list] == [
+        "get",
+        "put",
+        "put_writes",
+    ]
@@ -0,0 +1,224 @@
+"""Tests for async, incremental knowledge base ingestion."""
+
+import asyncio
+import hashlib
+from collections import defaultdict
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Set
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from agent_service.knowledge import KnowledgeBaseManager
+
+
+def _sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _indexed(file_id: str, path: str, content: bytes) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=file_id,
+        status="completed",
+        attributes={"path": path, "sha256": _sha256(content)},
+    )
+
+
+def _fake_client(
+    stores: List[Any],
+    files_by_store: Dict[str, List[Any]],
+    batch_status: str = "completed",
+) -> MagicMock:
+    """Fake async client; batch-attached files are indexed with ``batch_status``."""
+    client = MagicMock()
+    uploads = iter(range(1, 100))
+    store_files: Dict[str, List[Any]] = defaultdict(list, files_by_store)
+
+    async def create_file(file: Any, purpose: str) -> SimpleNamespace:
+        await asyncio.sleep(0)
+        return SimpleNamespace(id=f"file-{next(uploads)}")
+
+    async def list_stores() -> AsyncIterator[Any]:
+        for store in list(stores):
+            yield store
+
+    async def create_store(name: str, extra_body: Any) -> SimpleNamespace:
+        store = SimpleNamespace(id="vs-new", name=name, created_at=100)
+        stores.append(store)
+        return store
+
+    async def delete_store(vector_store_id: str) -> None:
+        stores[:] = [store for store in stores if store.id != vector_store_id]
+        store_files.pop(vector_store_id, None)
+
+    async def list_files(vector_store_id: str) -> AsyncIterator[Any]:
+        for vs_file in list(store_files[vector_store_id]):
+            yield vs_file
+
+    async def detach_file(file_id: str, vector_store_id: str) -> None:
+        store_files[vector_store_id] = [
+            f for f in store_files[vector_store_id] if f.id != file_id
+        ]
+
+    async def create_batch(vector_store_id: str, file_ids: List[str]) -> Any:
+        store_files[vector_store_id].extend(
+            SimpleNamespace(id=file_id, status=batch_status, attributes={})
+            for file_id in file_ids
+        )
+        return SimpleNamespace(id="batch-1", status="in_progress")
+
+    client.files.create = AsyncMock(side_effect=create_file)
+    client.files.delete = AsyncMock()
+    client.vector_stores.list = MagicMock(side_effect=list_stores)
+    client.vector_stores.create = AsyncMock(side_effect=create_store)
+    client.vector_stores.delete = AsyncMock(side_effect=delete_store)
+    client.vector_stores.files.list = MagicMock(side_effect=list_files)
+    client.vector_stores.files.update = AsyncMock()
+    client.vector_stores.files.delete = AsyncMock(side_effect=detach_file)
+    client.vector_stores.file_batches.create = AsyncMock(side_effect=create_batch)
+    completed = 2 if batch_status == "completed" else 0
+    client.vector_stores.file_batches.retrieve = AsyncMock(
+        return_value=SimpleNamespace(
+            id="batch-1",
+            status=batch_status,
+            file_counts=SimpleNamespace(completed=completed, failed=2 - completed),
+        )
+    )
+    return client
+
+
+def _deleted_files(client: MagicMock) -> Set[str]:
+    return {call.kwargs["file_id"] for call in client.files.delete.await_args_list}
+
+
+def _manager(tmp_path: Path, client: MagicMock) -> KnowledgeBaseManager:
+    manager = KnowledgeBaseManager()
+    manager._knowledge_bases_path = tmp_path / "knowledge_bases"
+    manager._async_llama_client = client
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_incremental_update_reuses_store(tmp_path: Path) -> None:
+    """Only changed files are re-indexed and stale entries and stores removed."""
+    kb_dir = tmp_path / "knowledge_bases" / "laptop-refresh"
+    (kb_dir / "nested").mkdir(parents=True)
+    (kb_dir / "policy.txt").write_text("unchanged policy")
+    (kb_dir / "nested" / "changed.txt").write_text("new content")
+    (kb_dir / "nested" / "added.txt").write_text("added")
+
+    stores = [
+        SimpleNamespace(id="vs-old", name="laptop-refresh-kb-00000000", created_at=1),
+        SimpleNamespace(id="vs-cur", name="laptop-refresh-kb-11111111", created_at=2),
+        SimpleNamespace(
+            id="vs-x", name="laptop-refresh-extra-kb-22222222", created_at=3
+        ),
+    ]
+    existing = [
+        _indexed("file-policy", "policy.txt", b"unchanged policy"),
+        _indexed("file-changed", "nested/changed.txt", b"old content"),
+        _indexed("file-removed", "removed.txt", b"gone"),
+        SimpleNamespace(id="file-untracked", status="completed", attributes={}),
+    ]
+    other_kb = [_indexed("file-untracked", "shared.txt", b"shared")]
+    client = _fake_client(
+        stores,
+        {
+            "vs-old": [_indexed("file-stale", "policy.txt", b"stale")],
+            "vs-cur": existing,
+            "vs-x": other_kb,
+        },
+    )
+    manager = _manager(tmp_path, client)
+
+    with patch("agent_service.knowledge.kb_manager.KB_BATCH_POLL_INTERVAL", 0):
+        assert await manager.register_knowledge_bases_async() is True
+
+    client.vector_stores.create.assert_not_awaited()
+    assert client.files.create.await_count == 2
+    batch_call = client.vector_stores.file_batches.create.await_args
+    assert batch_call.kwargs["vector_store_id"] == "vs-cur"
+    assert len(batch_call.kwargs["file_ids"]) == 2
+    tagged = {
+        call.kwargs["attributes"]["path"]
+        for call in client.vector_stores.files.update.await_args_list
+    }
+    assert tagged == {"nested/added.txt", "nested/changed.txt"}
+    detached = {
+        call.kwargs["file_id"]
+        for call in client.vector_stores.files.delete.await_args_list
+    }
+    assert detached == {"file-changed", "file-removed", "file-untracked"}
+    client.vector_stores.delete.assert_awaited_once_with(vector_store_id="vs-old")
+    # Released files are deleted unless another store still references them
+    assert _deleted_files(client) == {"file-changed", "file-removed", "file-stale"}
+
+
+@pytest.mark.asyncio
+async def test_first_run_creates_store(tmp_path: Path) -> None:
+    """Without an existing store one is created and every file indexed."""
+    kb_dir = tmp_path / "knowledge_bases" / "laptop-refresh"
+    kb_dir.mkdir(parents=True)
+    (kb_dir / "a.txt").write_text("same content")
+    (kb_dir / "b.txt").write_text("same content")
+    client = _fake_client([], {})
+    manager = _manager(tmp_path, client)
+
+    with patch("agent_service.knowledge.kb_manager.KB_BATCH_POLL_INTERVAL", 0):
+        assert await manager.register_knowledge_bases_async() is True
+
+    client.vector_stores.create.assert_awaited_once()
+    # Identical content at different paths is still indexed per path
+    assert client.vector_stores.file_batches.create.await_args.kwargs == {
+        "vector_store_id": "vs-new",
+        "file_ids": ["file-1", "file-2"],
+    }
+    client.vector_stores.files.delete.assert_not_awaited()
+    client.vector_stores.delete.assert_not_awaited()
+    client.files.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_keeps_previous_versions(tmp_path: Path) -> None:
+    """Files whose replacement failed to index keep their old version attached."""
+    kb_dir = tmp_path / "knowledge_bases" / "laptop-refresh"
+    kb_dir.mkdir(parents=True)
+    (kb_dir / "changed.txt").write_text("new content")
+    (kb_dir / "added.txt").write_text("added")
+    stores = [
+        SimpleNamespace(id="vs-cur", name="laptop-refresh-kb-11111111", created_at=1)
+    ]
+    existing = [_indexed("file-changed", "changed.txt", b"old content")]
+    client = _fake_client(stores, {"vs-cur": existing}, batch_status="failed")
+    manager = _manager(tmp_path, client)
+
+    with patch("agent_service.knowledge.kb_manager.KB_BATCH_POLL_INTERVAL", 0):
+        assert await manager.register_knowledge_bases_async() is True
+
+    # Failed uploads are neither tagged nor left attached; the old copy stays
+    client.vector_stores.files.update.assert_not_awaited()
+    detached = {
+        call.kwargs["file_id"]
+        for call in client.vector_stores.files.delete.await_args_list
+    }
+    assert detached == {"file-1", "file-2"}
+    assert _deleted_files(client) == {"file-1", "file-2"}
+
+
+def test_sync_entry_point_reuses_store(tmp_path: Path) -> None:
+    """register_knowledge_bases runs the incremental sync, not a fresh store."""
+    kb_dir = tmp_path / "knowledge_bases" / "laptop-refresh"
+    kb_dir.mkdir(parents=True)
+    (kb_dir / "policy.txt").write_text("policy")
+    stores = [
+        SimpleNamespace(id="vs-cur", name="laptop-refresh-kb-11111111", created_at=1)
+    ]
+    client = _fake_client(
+        stores, {"vs-cur": [_indexed("file-policy", "policy.txt", b"policy")]}
+    )
+    manager = _manager(tmp_path, client)
+
+    assert manager.register_knowledge_bases() is True
+
+    client.vector_stores.create.assert_not_awaited()
+    client.files.create.assert_not_awaited()
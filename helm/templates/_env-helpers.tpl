@@ -52,6 +52,16 @@ Generate database environment variables from pgvector secret
   value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.syncPoolMaxSize | default "5" | quote }}{{ else }}"5"{{ end }}
 - name: DB_SYNC_POOL_TIMEOUT
   value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.syncPoolTimeout | default "30" | quote }}{{ else }}"30"{{ end }}
+- name: DB_SYNC_POOL_MAX_IDLE
+  value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.syncPoolMaxIdle | default "600" | quote }}{{ else }}"600"{{ end }}
+- name: DB_ASYNC_POOL_MIN_SIZE
+  value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.asyncPoolMinSize | default .Values.requestManagement.database.syncPoolMinSize | default "1" | quote }}{{ else }}"1"{{ end }}
+- name: DB_ASYNC_POOL_MAX_SIZE
+  value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.asyncPoolMaxSize | default .Values.requestManagement.database.syncPoolMaxSize | default "5" | quote }}{{ else }}"5"{{ end }}
+- name: DB_ASYNC_POOL_TIMEOUT
+  value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.asyncPoolTimeout | default .Values.requestManagement.database.syncPoolTimeout | default "30" | quote }}{{ else }}"30"{{ end }}
+- name: DB_ASYNC_POOL_MAX_IDLE
+  value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.asyncPoolMaxIdle | default "600" | quote }}{{ else }}"600"{{ end }}
 {{- end }}
 
 {{/*
@@ -103,6 +113,16 @@ Database env vars WITHOUT DB_STATEMENT_TIMEOUT (request-manager adds its own ove
   value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.syncPoolMaxSize | default "5" | quote }}{{ else }}"5"{{ end }}
 - name: DB_SYNC_POOL_TIMEOUT
   value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.syncPoolTimeout | default "30" | quote }}{{ else }}"30"{{ end }}
+- name: DB_SYNC_POOL_MAX_IDLE
+  value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.syncPoolMaxIdle | default "600" | quote }}{{ else }}"600"{{ end }}
+- name: DB_ASYNC_POOL_MIN_SIZE
+  value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.asyncPoolMinSize | default .Values.requestManagement.database.syncPoolMinSize | default "1" | quote }}{{ else }}"1"{{ end }}
+- name: DB_ASYNC_POOL_MAX_SIZE
+  value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.asyncPoolMaxSize | default .Values.requestManagement.database.syncPoolMaxSize | default "5" | quote }}{{ else }}"5"{{ end }}
+- name: DB_ASYNC_POOL_TIMEOUT
+  value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.asyncPoolTimeout | default .Values.requestManagement.database.syncPoolTimeout | default "30" | quote }}{{ else }}"30"{{ end }}
+- name: DB_ASYNC_POOL_MAX_IDLE
+  value: {{ if hasKey .Values.requestManagement "database" }}{{ .Values.requestManagement.database.asyncPoolMaxIdle | default "600" | quote }}{{ else }}"600"{{ end }}
 {{- end }}
 
 {{/*
@@ -304,6 +324,9 @@ Generate Agent Service specific environment variables
 - name: SAFETY_URL
   value: {{ $safetyUrl | quote }}
 {{- end }}
+{{/* Pre-warm the checkpointer's async connection pool at startup */}}
+- name: DB_ASYNC_POOL_PREWARM
+  value: {{ .Values.requestManagement.agentService.asyncPoolPrewarm | default false | quote }}
 {{/* Fault Injection Configuration (for testing) */}}
 {{- if hasKey .Values.requestManagement.agentService "faultInjection" }}
 - name: FAULT_INJECTION_ENABLED
@@ -6,11 +6,13 @@ import imaplib
 import os
 import re
 import socket
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from email import message_from_bytes
+from email.message import Message
 from email.utils import parseaddr
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import aioimaplib
 from shared_models import (
@@ -31,6 +33,11 @@ from .user_mapping_utils import resolve_user_id_from_email
 
 logger = configure_logging("integration-dispatcher")
 
+# Pieces of a UID FETCH response: "* N FETCH (UID U INTERNALDATE \"...\" BODY[] {size}"
+_FETCH_START_RE = re.compile(rb"\d+\s+FETCH\s+\(")
+_FETCH_UID_RE = re.compile(rb"\bUID\s+(\d+)")
+_FETCH_INTERNALDATE_RE = re.compile(rb"INTERNALDATE\s+\"([^\"]+)\"")
+
 
 class EmailService:
     """Service for handling incoming emails via IMAP polling."""
@@ -45,6 +52,23 @@ class EmailService:
         self.imap_mailbox = os.getenv("IMAP_MAILBOX", "INBOX")
         self.poll_interval = int(os.getenv("IMAP_POLL_INTERVAL", "60"))
         self.imap_use_ssl = os.getenv("IMAP_USE_SSL", "true").lower() == "true"
+        # With IDLE the leader is notified of new mail immediately; poll_interval
+        # then only bounds how often a full UNSEEN search runs as a safety net
+        self.imap_idle_enabled = (
+            os.getenv("IMAP_IDLE_ENABLED", "true").lower() == "true"
+        )
+        # Messages processed concurrently (one ordered lane per sender)
+        self.imap_process_concurrency = max(
+            1, int(os.getenv("IMAP_PROCESS_CONCURRENCY", "4"))
+        )
+        # Minimum spacing between emails from the same user
+        self.user_cooldown = float(os.getenv("IMAP_USER_COOLDOWN", "2.0"))
+        # Messages fetched per UID FETCH (bounds memory when many are unread)
+        self.imap_fetch_batch_size = max(
+            1, int(os.getenv("IMAP_FETCH_BATCH_SIZE", "50"))
+        )
+        # Leader's persistent IMAP connection (reused across polls and IDLE)
+        self._imap_client: Optional[Any] = None
 
         # Email addresses to ignore (system email addresses)
         # Get FROM_EMAIL if configured, otherwise use SMTP_USERNAME as fallback
@@ -193,68 +217,74 @@ class EmailService:
                     # Track last poll time to respect poll_interval
                     last_poll_time = None
                     last_lease_renewal_time = None
+                    new_mail = False
 
-                    while self._is_leader:
-                        try:
-                            now = datetime.now(timezone.utc)
-
-                            # Renew lease if needed (every lease_renewal_interval)
-                            if (
-                                last_lease_renewal_time is None
-                                or (now - last_lease_renewal_time).total_seconds()
-                                >= self.lease_renewal_interval
-                            ):
-                                if not await self._renew_lease():
-                                    logger.warning(
-                                        "Failed to renew lease - losing leadership",
-                                        pod_id=self.pod_id,
-                                    )
-                                    # _renew_lease() already calls _release_leadership() internally
-                                    # which sets self._is_leader = False, so the loop will exit
-                                    break
-                                last_lease_renewal_time = now
-
-                            # Poll mailbox if poll_interval has elapsed
-                            if (
-                                last_poll_time is None
-                                or (now - last_poll_time).total_seconds()
-                                >= self.poll_interval
-                            ):
-                                await self._poll_mailbox()
-                                last_poll_time = now
-
-                            # Sleep until next polling cycle or lease renewal
-                            # Wake up at the earlier of: next poll time or next lease renewal time
-                            time_until_next_poll = (
-                                self.poll_interval
-                                - (now - last_poll_time).total_seconds()
-                                if last_poll_time
-                                else self.poll_interval
-                            )
-                            time_until_next_renewal = (
-                                self.lease_renewal_interval
-                                - (now - last_lease_renewal_time).total_seconds()
-                                if last_lease_renewal_time
-                                else self.lease_renewal_interval
-                            )
-                            sleep_time = min(
-                                time_until_next_poll, time_until_next_renewal
-                            )
-                            # Ensure we sleep at least 1 second to avoid busy loop
-                            sleep_time = max(1.0, sleep_time)
-                            await asyncio.sleep(sleep_time)
-                        except Exception as e:
-                            logger.error(
-                                "Error during leader polling",
-                                error=str(e),
-                                error_type=type(e).__name__,
-                                pod_id=self.pod_id,
-                                exc_info=True,
-                            )
-                            # If we lose leadership due to error, release and retry
-                            await self._release_leadership()
-                            await asyncio.sleep(5)  # Brief pause before retrying
-                            break
+                    try:
+                        while self._is_leader:
+                            try:
+                                now = datetime.now(timezone.utc)
+
+                                # Renew lease if needed (every lease_renewal_interval)
+                                if (
+                                    last_lease_renewal_time is None
+                                    or (now - last_lease_renewal_time).total_seconds()
+                                    >= self.lease_renewal_interval
+                                ):
+                                    if not await self._renew_lease():
+                                        logger.warning(
+                                            "Failed to renew lease - losing leadership",
+                                            pod_id=self.pod_id,
+                                        )
+                                        # _renew_lease() already calls _release_leadership() internally
+                                        # which sets self._is_leader = False, so the loop will exit
+                                        break
+                                    last_lease_renewal_time = now
+
+                                # Poll mailbox if IDLE reported new mail or poll_interval has elapsed
+                                if (
+                                    new_mail
+                                    or last_poll_time is None
+                                    or (now - last_poll_time).total_seconds()
+                                    >= self.poll_interval
+                                ):
+                                    await self._poll_mailbox()
+                                    last_poll_time = now
+
+                                # Wait until next polling cycle or lease renewal
+                                # Wake up at the earlier of: next poll time or next lease renewal time
+                                time_until_next_poll = (
+                                    self.poll_interval
+                                    - (now - last_poll_time).total_seconds()
+                                    if last_poll_time
+                                    else self.poll_interval
+                                )
+                                time_until_next_renewal = (
+                                    self.lease_renewal_interval
+                                    - (now - last_lease_renewal_time).total_seconds()
+                                    if last_lease_renewal_time
+                                    else self.lease_renewal_interval
+                                )
+                                wait_time = min(
+                                    time_until_next_poll, time_until_next_renewal
+                                )
+                                # Ensure we wait at least 1 second to avoid busy loop
+                                wait_time = max(1.0, wait_time)
+                                new_mail = await self._wait_for_new_mail(wait_time)
+                            except Exception as e:
+                                logger.error(
+                                    "Error during leader polling",
+                                    error=str(e),
+                                    error_type=type(e).__name__,
+                                    pod_id=self.pod_id,
+                                    exc_info=True,
+                                )
+                                # If we lose leadership due to error, release and retry
+                                await self._release_leadership()
+                                await asyncio.sleep(5)  # Brief pause before retrying
+                                break
+                    finally:
+                        # Only the leader holds an IMAP connection
+                        await self._close_imap()
                 else:
                     # Not the leader - wait and periodically check for leadership
                     logger.debug(
@@ -431,113 +461,204 @@ class EmailService:
                 return self.pod_id
         return None
 
-    async def _sort_email_ids_by_received_time(
-        self, imap_client: Any, email_ids: list[str]
-    ) -> list[str]:
-        """Sort email IDs by INTERNALDATE (server receive time) for FIFO processing.
+    async def _connect_imap(self) -> Any:
+        """Open, authenticate and SELECT a new IMAP connection."""
+        # Create IMAP client based on SSL configuration
+        if self.imap_use_ssl:
+            imap_client = aioimaplib.IMAP4_SSL(self.imap_host, self.imap_port)
+        else:
+            imap_client = aioimaplib.IMAP4(self.imap_host, self.imap_port)
 
-        Falls back to numeric sort if INTERNALDATE fetch fails.
-        """
-        if len(email_ids) <= 1:
-            return email_ids
         try:
-            message_set = ",".join(email_ids)
-            typ, data = await imap_client.fetch(message_set, "(INTERNALDATE)")
-            if typ != "OK" or not data:
-                logger.debug(
-                    "INTERNALDATE fetch failed, falling back to numeric sort",
-                    typ=typ,
-                    mailbox=self.imap_mailbox,
-                )
-                return sorted(email_ids, key=int)
-            # Parse FETCH response: "* N FETCH (INTERNALDATE \"DD-Mon-YYYY HH:MM:SS +HHMM\")"
-            id_to_date: Dict[str, tuple[Any, ...]] = {}
-            internaldate_re = re.compile(
-                rb"(\d+)\s+FETCH\s+\(INTERNALDATE\s+\"([^\"]+)\""
-            )
-            for item in data:
-                if isinstance(item, bytes):
-                    match = internaldate_re.search(item)
-                    if match:
-                        msg_id = match.group(1).decode("utf-8")
-                        date_str = match.group(2).decode("utf-8")
-                        try:
-                            parsed = imaplib.Internaldate2tuple(
-                                date_str.encode("utf-8")
-                            )
-                            if parsed is not None:
-                                id_to_date[msg_id] = parsed
-                        except (ValueError, TypeError):
-                            pass
-            if len(id_to_date) < len(email_ids):
-                logger.debug(
-                    "Could not parse INTERNALDATE for all messages, falling back to numeric sort",
-                    parsed=len(id_to_date),
-                    total=len(email_ids),
+            # Wait for server greeting before sending commands
+            await imap_client.wait_hello_from_server()
+
+            await imap_client.login(self.imap_username, self.imap_password)
+
+            # Select mailbox and verify success
+            select_typ, select_data = await imap_client.select(self.imap_mailbox)
+            if select_typ != "OK":
+                raise RuntimeError(
+                    f"IMAP SELECT {self.imap_mailbox} failed: {select_typ} "
+                    f"{select_data if select_data else ''}"
                 )
-                return sorted(email_ids, key=int)
-            # Use (9999,...) for missing so unparsed IDs sort to end
-            return sorted(
-                email_ids,
-                key=lambda eid: id_to_date.get(
-                    eid, (9999, 12, 31, 23, 59, 59, 0, 0, 0)
-                ),
-            )
-        except Exception as e:
-            logger.warning(
-                "Error sorting by INTERNALDATE, falling back to numeric sort",
-                error=str(e),
+        except Exception:
+            await self._logout_quietly(imap_client)
+            raise
+
+        logger.debug(
+            "IMAP connection opened",
+            imap_host=self.imap_host,
+            mailbox=self.imap_mailbox,
+            idle_supported=imap_client.has_capability("IDLE"),
+        )
+        return imap_client
+
+    async def _get_imap_client(self) -> Any:
+        """Return the leader's IMAP connection, reconnecting if it was lost."""
+        imap_client = self._imap_client
+        if imap_client is not None:
+            transport = getattr(imap_client.protocol, "transport", None)
+            if (
+                imap_client.protocol.state == "SELECTED"
+                and transport is not None
+                and not transport.is_closing()
+            ):
+                return imap_client
+            logger.info(
+                "IMAP connection no longer usable - reconnecting",
+                state=imap_client.protocol.state,
                 mailbox=self.imap_mailbox,
             )
-            return sorted(email_ids, key=int)
+            await self._close_imap()
 
-    async def _poll_mailbox(self) -> None:
-        """Poll IMAP mailbox for new emails.
+        self._imap_client = await self._connect_imap()
+        return self._imap_client
 
-        This is only called by the leader pod. No locks needed since
-        only one pod polls at a time via leader election.
+    async def _close_imap(self) -> None:
+        """Log out and drop the leader's IMAP connection, if any."""
+        imap_client, self._imap_client = self._imap_client, None
+        if imap_client is not None:
+            await self._logout_quietly(imap_client)
+
+    @staticmethod
+    async def _logout_quietly(imap_client: Any) -> None:
+        try:
+            await imap_client.logout()
+        except Exception:
+            pass  # Ignore errors during cleanup
+
+    async def _wait_for_new_mail(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for new mail.
+
+        Uses IMAP IDLE on the leader's connection when the server supports it,
+        returning True as soon as the server pushes EXISTS/RECENT. Otherwise
+        sleeps for the full timeout and returns False.
         """
-        imap_client = None
+        imap_client = self._imap_client
+        if (
+            not self.imap_idle_enabled
+            or imap_client is None
+            or not imap_client.has_capability("IDLE")
+        ):
+            await asyncio.sleep(timeout)
+            return False
+
         try:
-            # Create IMAP client based on SSL configuration
-            if self.imap_use_ssl:
-                imap_client = aioimaplib.IMAP4_SSL(self.imap_host, self.imap_port)
-            else:
-                imap_client = aioimaplib.IMAP4(self.imap_host, self.imap_port)
+            # idle_start schedules a stop push after timeout, which ends the wait
+            idle = await imap_client.idle_start(timeout=timeout)
+            new_mail = False
+            while imap_client.has_pending_idle() and not new_mail:
+                push = await imap_client.wait_server_push(timeout=timeout + 5)
+                if push == aioimaplib.STOP_WAIT_SERVER_PUSH:
+                    break
+                new_mail = self._is_new_mail_push(push)
+            imap_client.idle_done()
+            await asyncio.wait_for(idle, timeout=imap_client.timeout)
+            if new_mail:
+                logger.debug("IMAP IDLE reported new mail", mailbox=self.imap_mailbox)
+            return new_mail
+        except Exception as e:
+            # Reconnect on the next poll; the connection state after a failed IDLE is unknown
+            logger.warning(
+                "IMAP IDLE failed - falling back to polling",
+                error=str(e) if str(e) else repr(e),
+                error_type=type(e).__name__,
+                mailbox=self.imap_mailbox,
+            )
+            await self._close_imap()
+            await asyncio.sleep(timeout)
+            return True
+
+    @staticmethod
+    def _is_new_mail_push(push: Any) -> bool:
+        """Return True if an IDLE server push announces new messages."""
+        for line in push or []:
+            if isinstance(line, str):
+                line = line.encode("utf-8", errors="replace")
+            if isinstance(line, (bytes, bytearray)) and line.rstrip().upper().endswith(
+                (b" EXISTS", b" RECENT")
+            ):
+                return True
+        return False
 
-            # Wait for server greeting before sending commands
-            await imap_client.wait_hello_from_server()
+    def _parse_fetch_response(self, data: List[Any]) -> List[Tuple[str, bytes]]:
+        """Parse a ``UID FETCH (UID INTERNALDATE BODY.PEEK[])`` response.
 
-            await imap_client.login(self.imap_username, self.imap_password)
+        aioimaplib returns each message as a header line followed by the
+        literal body, e.g. ``[b'1 FETCH (UID 5 INTERNALDATE "..." BODY[] {310}',
+        bytearray(b'...'), b')', ..., b'FETCH completed.']``. Some servers send
+        UID/INTERNALDATE after the literal, so the closing line is parsed too.
 
-            # Select mailbox and verify success
-            select_typ, select_data = await imap_client.select(self.imap_mailbox)
-            if select_typ != "OK":
-                logger.error(
-                    "IMAP SELECT failed",
-                    status=select_typ,
+        Returns (uid, message bytes) pairs sorted by INTERNALDATE (server receive
+        time) for FIFO processing, falling back to UID order if any date is missing.
+        """
+        records: List[Dict[str, Any]] = []
+        current: Optional[Dict[str, Any]] = None
+        for item in data:
+            if isinstance(item, bytearray):
+                if current is not None and current.get("body") is None:
+                    current["body"] = bytes(item)
+                continue
+            if not isinstance(item, bytes):
+                continue
+            if _FETCH_START_RE.match(item):
+                current = {"uid": None, "date": None, "body": None}
+                records.append(current)
+            elif current is None:
+                continue
+            if current["uid"] is None:
+                uid_match = _FETCH_UID_RE.search(item)
+                if uid_match:
+                    current["uid"] = uid_match.group(1).decode("utf-8")
+            if current["date"] is None:
+                date_match = _FETCH_INTERNALDATE_RE.search(item)
+                if date_match:
+                    try:
+                        current["date"] = imaplib.Internaldate2tuple(
+                            b'INTERNALDATE "' + date_match.group(1) + b'"'
+                        )
+                    except (ValueError, TypeError):
+                        pass
+
+        messages = []
+        for record in records:
+            if record["uid"] is None or not record["body"]:
+                logger.warning(
+                    "Incomplete message in IMAP FETCH response - skipping",
+                    uid=record["uid"],
+                    has_body=bool(record["body"]),
                     mailbox=self.imap_mailbox,
-                    response=str(select_data) if select_data else None,
                 )
-                return  # Can't proceed without mailbox selection
+                continue
+            messages.append(record)
+
+        if all(record["date"] is not None for record in messages):
+            messages.sort(key=lambda r: (r["date"], int(r["uid"])))
+        else:
+            logger.debug(
+                "Could not parse INTERNALDATE for all messages, falling back to UID sort",
+                mailbox=self.imap_mailbox,
+            )
+            messages.sort(key=lambda r: int(r["uid"]))
+        return [(record["uid"], record["body"]) for record in messages]
+
+    async def _poll_mailbox(self) -> None:
+        """Fetch and process unread emails on the leader's IMAP connection.
+
+        This is only called by the leader pod. No locks needed since
+        only one pod polls at a time via leader election. Unread messages
+        are fetched in UID order, ``imap_fetch_batch_size`` at a time, with a
+        UID FETCH using BODY.PEEK[] (which does not set \\Seen). Each batch is
+        processed concurrently and then marked as read with a single UID STORE.
+        """
+        try:
+            imap_client = await self._get_imap_client()
 
             # Search for unread emails
             # For flag-based searches like UNSEEN, charset parameter shouldn't be included
-            # aioimaplib's search() method includes charset if charset is not None
-            # Pass charset=None explicitly to omit charset parameter for flag searches
-            try:
-                # Pass charset=None to omit charset parameter (aioimaplib only includes it if charset is not None)
-                typ, data = await imap_client.search("UNSEEN", charset=None)
-            except Exception as e:
-                logger.error(
-                    "Failed to send IMAP search command",
-                    error=str(e),
-                    mailbox=self.imap_mailbox,
-                )
-                raise
-            email_ids_to_process = []
-
-            # Check if search was successful
+            # Pass charset=None to omit charset parameter (aioimaplib only includes it if charset is not None)
+            typ, data = await imap_client.uid_search("UNSEEN", charset=None)
             if typ != "OK":
                 logger.error(
                     "IMAP search failed",
@@ -545,69 +666,42 @@ class EmailService:
                     mailbox=self.imap_mailbox,
                     response=str(data) if data else None,
                 )
-            elif data and data[0]:
-                # Normalize email IDs and validate they are numeric
-                if isinstance(data[0], bytes):
-                    email_ids_str = data[0].decode("utf-8")
-                else:
-                    email_ids_str = str(data[0])
+                return
 
-                # Split and filter to only valid numeric email IDs
-                email_ids = []
-                for email_id in email_ids_str.split():
-                    # Validate that it's a numeric email ID
-                    try:
-                        int(email_id)  # Validate it's a number
-                        email_ids.append(email_id)
-                    except ValueError:
+            uids = []
+            if data and data[0]:
+                if isinstance(data[0], (bytes, bytearray)):
+                    uids_str = bytes(data[0]).decode("utf-8")
+                else:
+                    uids_str = str(data[0])
+                for uid in uids_str.split():
+                    # Validate that it's a numeric UID
+                    if uid.isdigit():
+                        uids.append(uid)
+                    else:
                         logger.warning(
-                            "Invalid email ID from IMAP search - skipping",
-                            email_id=email_id,
+                            "Invalid UID from IMAP search - skipping",
+                            uid=uid,
                             mailbox=self.imap_mailbox,
                         )
-                        continue
 
-                if email_ids:
-                    logger.debug(
-                        "Found unread emails",
-                        count=len(email_ids),
-                        mailbox=self.imap_mailbox,
-                    )
-                    # Sort by received time (INTERNALDATE) for FIFO processing
-                    email_ids_to_process = await self._sort_email_ids_by_received_time(
-                        imap_client, email_ids
-                    )
-                else:
-                    logger.debug("No unread emails found", mailbox=self.imap_mailbox)
-            else:
+            if not uids:
                 logger.debug("No unread emails found", mailbox=self.imap_mailbox)
+                return
 
-            # Process emails (mark as read only after successful processing)
-            for email_id in email_ids_to_process:
-                success = await self._process_email(email_id, imap_client)
-                if success:
-                    # Mark as read only after successful processing
-                    # This allows retries if processing fails
-                    try:
-                        await imap_client.store(email_id, "+FLAGS", "\\Seen")
-                        logger.debug(
-                            "Email processed and marked as read",
-                            email_id=email_id,
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to mark email as read after processing",
-                            email_id=email_id,
-                            error=str(e),
-                        )
-                        # Processing succeeded, so continue even if mark failed
-                else:
-                    logger.debug(
-                        "Email processing failed - leaving unread for retry",
-                        email_id=email_id,
-                    )
+            logger.debug(
+                "Found unread emails",
+                count=len(uids),
+                mailbox=self.imap_mailbox,
+            )
 
-            await imap_client.logout()
+            # UIDs increase with arrival, so batches are fetched oldest first
+            uids.sort(key=int)
+            for start in range(0, len(uids), self.imap_fetch_batch_size):
+                batch = uids[start : start + self.imap_fetch_batch_size]
+                if not await self._fetch_and_process_batch(imap_client, batch):
+                    # Stop so later mail is not processed ahead of this batch
+                    return
 
         except Exception as e:
             logger.error(
@@ -618,63 +712,125 @@ class EmailService:
                 exc_info=True,
             )
             # Ensure connection is closed on error
-            if imap_client:
-                try:
-                    await imap_client.logout()
-                except Exception:
-                    pass  # Ignore errors during cleanup
+            await self._close_imap()
             raise
 
-    async def _process_email(self, email_id: str, imap_client: Any) -> bool:
-        """Process a single email."""
-        db_manager = get_database_manager()
-        async with db_manager.get_session() as db:
+    async def _fetch_and_process_batch(self, imap_client: Any, uids: List[str]) -> bool:
+        """Fetch, process and mark as read one batch of unread messages.
+
+        Returns False if the fetch failed.
+        """
+        typ, data = await imap_client.uid(
+            "fetch", ",".join(uids), "(UID INTERNALDATE BODY.PEEK[])"
+        )
+        if typ != "OK" or not data:
+            logger.error(
+                "IMAP fetch failed",
+                status=typ,
+                count=len(uids),
+                mailbox=self.imap_mailbox,
+            )
+            return False
+        messages = self._parse_fetch_response(data)
+
+        # Mark as read only after successful processing
+        # This allows retries if processing fails
+        seen_uids = await self._process_messages(messages)
+        if seen_uids:
             try:
-                # Fetch email - aioimaplib expects string email IDs
-                typ, data = await imap_client.fetch(email_id, "(RFC822)")
-                if not data or len(data) < 2:
-                    logger.warning(
-                        "Failed to fetch email",
-                        email_id=email_id,
-                        data_len=len(data) if data else 0,
-                    )
-                    return False
+                await imap_client.uid(
+                    "store", ",".join(seen_uids), "+FLAGS", "(\\Seen)"
+                )
+                logger.debug(
+                    "Emails processed and marked as read",
+                    count=len(seen_uids),
+                    mailbox=self.imap_mailbox,
+                )
+            except Exception as e:
+                # Processing succeeded; duplicates are caught by the event claim on retry
+                logger.warning(
+                    "Failed to mark emails as read after processing",
+                    uids=seen_uids,
+                    error=str(e),
+                )
+        return True
 
-                # aioimaplib returns FETCH RFC822 responses as a list:
-                # [b'1 FETCH (RFC822 {length}', message_bytes, b')', b'FETCH completed.']
-                # The actual message content is in data[1]
-                email_body = data[1]
+    async def _process_messages(self, messages: List[Tuple[str, bytes]]) -> List[str]:
+        """Process fetched messages through a bounded concurrent pipeline.
 
-                # Convert bytearray to bytes if needed
-                if isinstance(email_body, bytearray):
-                    email_body = bytes(email_body)
+        Messages are grouped into one lane per sender and each lane is processed
+        in receive order, so emails in the same thread (whose thread keys are
+        scoped by sender) are forwarded in order. Up to
+        ``imap_process_concurrency`` messages are processed at once.
 
-                if not isinstance(email_body, bytes):
-                    logger.error(
-                        "Unexpected email body type from FETCH response",
-                        email_id=email_id,
-                        body_type=type(email_body).__name__,
-                    )
-                    return False
+        Returns the UIDs that should be marked as read.
+        """
+        lanes: Dict[str, List[Tuple[str, Message]]] = {}
+        for uid, raw in messages:
+            email_message = self._parse_email(uid, raw)
+            if email_message is None:
+                continue
+            lane_key = parseaddr(email_message.get("From", ""))[1].lower()
+            lanes.setdefault(lane_key, []).append((uid, email_message))
+
+        semaphore = asyncio.Semaphore(self.imap_process_concurrency)
+        seen_uids: List[str] = []
+
+        async def _run_lane(sender: str, lane: List[Tuple[str, Message]]) -> None:
+            for uid, email_message in lane:
+                # Wait out the sender's cooldown before taking a processing slot
+                # (and a DB connection) so a busy sender does not starve others
+                await self._wait_for_sender_cooldown(sender)
+                async with semaphore:
+                    if await self._process_email(uid, email_message):
+                        seen_uids.append(uid)
+
+        await asyncio.gather(
+            *(_run_lane(sender, lane) for sender, lane in lanes.items())
+        )
+        return sorted(seen_uids, key=int)
+
+    async def _wait_for_sender_cooldown(self, sender: str) -> None:
+        """Wait until ``user_cooldown`` has passed since the sender's last email."""
+        elapsed = time.time() - self._last_request_time.get(sender, 0)
+        if elapsed < self.user_cooldown:
+            sleep_time = self.user_cooldown - elapsed
+            logger.debug(
+                "Rate limiting: waiting before processing same-sender email",
+                from_addr=sender,
+                sleep_seconds=round(sleep_time, 1),
+            )
+            await asyncio.sleep(sleep_time)
 
-                if not email_body or len(email_body) == 0:
-                    logger.error(
-                        "Email body is empty",
-                        email_id=email_id,
-                    )
-                    return False
+    def _parse_email(self, email_id: str, email_body: bytes) -> Optional[Message]:
+        """Parse raw message bytes, returning None if the message is unusable."""
+        if not email_body:
+            logger.error(
+                "Email body is empty",
+                email_id=email_id,
+            )
+            return None
 
-                # Parse email message from bytes
-                try:
-                    email_message = message_from_bytes(email_body)
-                except Exception as e:
-                    logger.error(
-                        "Failed to parse email message from bytes",
-                        email_id=email_id,
-                        error=str(e),
-                    )
-                    return False
+        try:
+            return message_from_bytes(email_body)
+        except Exception as e:
+            logger.error(
+                "Failed to parse email message from bytes",
+                email_id=email_id,
+                error=str(e),
+            )
+            return None
+
+    async def _process_email(self, email_id: str, email_message: Message) -> bool:
+        """Process a single email.
 
+        Returns True if the email should be marked as read: it was forwarded,
+        it came from a system address, or it was already claimed. Failed or
+        skipped emails return False and stay unread for retry.
+        """
+        db_manager = get_database_manager()
+        async with db_manager.get_session() as db:
+            try:
                 # Extract email data
                 from_header = email_message.get("From", "")
 
@@ -750,11 +906,7 @@ class EmailService:
                         system_addresses=list(self._ignore_addresses),
                     )
                     # Mark as read to avoid reprocessing
-                    try:
-                        await imap_client.store(email_id, "+FLAGS", "\\Seen")
-                    except Exception:
-                        pass  # Ignore errors when marking as read
-                    return False
+                    return True
 
                 # Create unique identifier for deduplication
                 email_message_id = self._create_email_message_id(
@@ -775,23 +927,9 @@ class EmailService:
                 # Resolve user_id
                 user_id = await self._resolve_user_id(from_addr, db)
 
-                # Rate limiting: wait (not skip) to preserve 2s cooldown while processing all emails in order
-                import time
-
-                current_time = time.time()
-                last_request_time = self._last_request_time.get(user_id, 0)
-                elapsed = current_time - last_request_time
-
-                if elapsed < 2.0:  # 2 second cooldown per user
-                    sleep_time = 2.0 - elapsed
-                    logger.debug(
-                        "Rate limiting: waiting before processing same-user email",
-                        user_id=user_id,
-                        sleep_seconds=round(sleep_time, 1),
-                    )
-                    await asyncio.sleep(sleep_time)
-
-                self._last_request_time[user_id] = time.time()
+                # Start of the sender's cooldown; the next email from this sender
+                # waits for it in _process_messages before taking a slot
+                self._last_request_time[from_addr_lower] = time.time()
 
                 logger.info(
                     "Processing incoming email",
@@ -815,11 +953,8 @@ class EmailService:
                         email_message_id=email_message_id,
                         from_addr=from_addr,
                     )
-                    try:
-                        await imap_client.store(email_id, "+FLAGS", "\\Seen")
-                    except Exception:
-                        pass
-                    return False
+                    # Mark as read to avoid reprocessing
+                    return True
 
                 # Forward to Request Manager
                 success = await self._forward_to_request_manager(
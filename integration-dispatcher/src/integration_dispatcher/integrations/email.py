@@ -11,6 +11,7 @@ import aiosmtplib
 from shared_models import configure_logging
 from shared_models.models import DeliveryRequest, DeliveryStatus, UserIntegrationConfig
 
+from ..smtp_pool import SMTPConnectionPool
 from .base import BaseIntegrationHandler, IntegrationResult
 
 logger = configure_logging("integration-dispatcher")
@@ -130,6 +131,26 @@ class EmailIntegrationHandler(BaseIntegrationHandler):
         self.from_email = os.getenv("FROM_EMAIL", "noreply@selfservice.local")
         self.from_name = os.getenv("FROM_NAME", "Self-Service Agent")
 
+        # Pooled SMTP connections shared by all deliveries (0 disables pooling)
+        self.smtp_pool: Optional[SMTPConnectionPool] = None
+        smtp_pool_size = int(os.getenv("SMTP_POOL_SIZE", "4"))
+        if smtp_pool_size > 0:
+            # Port 587 starts plain and upgrades via STARTTLS; others follow SMTP_USE_TLS
+            starttls = self.smtp_port == 587 and self.smtp_use_tls
+            self.smtp_pool = SMTPConnectionPool(
+                hostname=self.smtp_host,
+                port=self.smtp_port,
+                username=self.smtp_username,
+                password=self.smtp_password,
+                use_tls=False if starttls else self.smtp_use_tls,
+                start_tls=True if starttls else None,
+                max_size=smtp_pool_size,
+                idle_timeout=float(os.getenv("SMTP_POOL_IDLE_TIMEOUT", "60")),
+                health_check_interval=float(
+                    os.getenv("SMTP_POOL_HEALTH_CHECK_INTERVAL", "10")
+                ),
+            )
+
         # IMAP configuration (receiving) - reuses SMTP credentials by default
         self.imap_host = os.getenv("IMAP_HOST")
         self.imap_port = int(os.getenv("IMAP_PORT", "993"))
@@ -207,10 +228,12 @@ class EmailIntegrationHandler(BaseIntegrationHandler):
                 )
                 msg.attach(MIMEText(text_content, "plain"))
 
-            # Send email
+            # Send email over a pooled connection unless pooling is disabled
             # For port 587, we need to use STARTTLS (plain connection first, then upgrade to TLS)
             # For port 465, we use SSL/TLS from the start
-            if self.smtp_port == 587 and self.smtp_use_tls:
+            if self.smtp_pool is not None:
+                await self.smtp_pool.send_message(msg)
+            elif self.smtp_port == 587 and self.smtp_use_tls:
                 # Port 587 with STARTTLS
                 await aiosmtplib.send(
                     msg,
@@ -256,6 +279,11 @@ class EmailIntegrationHandler(BaseIntegrationHandler):
                 message=f"Unexpected error: {str(e)}",
             )
 
+    async def close(self) -> None:
+        """Close pooled SMTP connections."""
+        if self.smtp_pool is not None:
+            await self.smtp_pool.close()
+
     async def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate email configuration."""
         email_address = config.get("email_address")
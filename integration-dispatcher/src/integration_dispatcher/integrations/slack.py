@@ -8,6 +8,7 @@ from shared_models.models import DeliveryRequest, DeliveryStatus, UserIntegratio
 from slack_sdk.errors import SlackApiError
 from slack_sdk.web.async_client import AsyncWebClient
 
+from ..ttl_cache import AsyncTTLCache
 from .base import BaseIntegrationHandler, IntegrationResult
 
 logger = configure_logging("integration-dispatcher")
@@ -29,6 +30,20 @@ class SlackIntegrationHandler(BaseIntegrationHandler):
         else:
             self.bot_token = None
             self.client = None
+        # Process-local lookups for DM delivery (users.lookupByEmail and
+        # conversations.open are rate limited; DM channel IDs are stable)
+        cache_size = int(os.getenv("SLACK_USER_CACHE_SIZE", "10000"))
+        negative_ttl = float(os.getenv("SLACK_NEGATIVE_CACHE_TTL", "60"))
+        self._user_id_by_email_cache: AsyncTTLCache[str, str] = AsyncTTLCache(
+            max_size=cache_size,
+            ttl=float(os.getenv("SLACK_USER_CACHE_TTL", "300")),
+            negative_ttl=negative_ttl,
+        )
+        self._dm_channel_cache: AsyncTTLCache[str, str] = AsyncTTLCache(
+            max_size=cache_size,
+            ttl=float(os.getenv("SLACK_DM_CHANNEL_CACHE_TTL", "3600")),
+            negative_ttl=negative_ttl,
+        )
 
     async def deliver(
         self,
@@ -209,19 +224,13 @@ class SlackIntegrationHandler(BaseIntegrationHandler):
             raise Exception("Slack client not initialized")
         try:
             # Find user by email
-            users_response = await self.client.users_lookupByEmail(email=user_email)
-            if not users_response["ok"]:
+            user_id = await self._user_id_by_email_cache.get_or_load(
+                user_email.lower(), lambda: self._lookup_user_id_by_email(user_email)
+            )
+            if not user_id:
                 raise Exception(f"User not found: {user_email}")
 
-            user_id = users_response["user"]["id"]
-
-            # Open DM channel
-            dm_response = await self.client.conversations_open(users=[user_id])
-            if not dm_response["ok"]:
-                raise Exception("Failed to open DM channel")
-
-            channel_id = dm_response["channel"]["id"]
-            return str(channel_id) if channel_id is not None else ""
+            return await self._get_user_dm_channel_by_id(user_id)
 
         except Exception as e:
             raise Exception(f"Failed to get DM channel: {str(e)}")
@@ -231,17 +240,48 @@ class SlackIntegrationHandler(BaseIntegrationHandler):
         if not self.client:
             raise Exception("Slack client not initialized")
         try:
-            # Open DM channel directly with user ID
-            dm_response = await self.client.conversations_open(users=[user_id])
-            if not dm_response["ok"]:
-                raise Exception("Failed to open DM channel")
-
-            channel_id = dm_response["channel"]["id"]
-            return str(channel_id) if channel_id is not None else ""
+            channel_id = await self._dm_channel_cache.get_or_load(
+                user_id, lambda: self._open_dm_channel(user_id)
+            )
+            if channel_id is None:
+                raise Exception("User not found")
+            return channel_id
 
         except Exception as e:
             raise Exception(f"Failed to get DM channel for user {user_id}: {str(e)}")
 
+    async def _lookup_user_id_by_email(self, user_email: str) -> Optional[str]:
+        """Look up a Slack user ID by email; None if no such user."""
+        assert self.client is not None
+        try:
+            users_response = await self.client.users_lookupByEmail(email=user_email)
+        except SlackApiError as e:
+            if e.response.get("error") == "users_not_found":
+                return None
+            raise
+        if not users_response["ok"]:
+            return None
+        return str(users_response["user"]["id"])
+
+    async def _open_dm_channel(self, user_id: str) -> Optional[str]:
+        """Open (or reopen) the DM channel with a user; None if no such user."""
+        assert self.client is not None
+        try:
+            # Open DM channel directly with user ID
+            dm_response = await self.client.conversations_open(users=[user_id])
+        except SlackApiError as e:
+            if e.response.get("error") in ("user_not_found", "user_disabled"):
+                return None
+            raise
+        if not dm_response["ok"]:
+            raise Exception("Failed to open DM channel")
+
+        channel_id = dm_response["channel"].get("id")
+        if not channel_id:
+            # Raised rather than returned so an empty id is not cached
+            raise Exception("Failed to open DM channel: no channel id returned")
+        return str(channel_id)
+
     def _build_message_blocks(
         self,
         content: str,
@@ -13,6 +13,7 @@ from shared_models import (
     DatabaseUtils,
     EventTypes,
     HealthChecker,
+    QueryTrackingMiddleware,
     configure_logging,
     create_cloudevent_response,
     create_health_check_endpoint,
@@ -54,7 +55,7 @@ from .schemas import (
     UserIntegrationConfigUpdate,
 )
 from .slack_schemas import SlackChallenge, SlackInteractionPayload, SlackSlashCommand
-from .slack_service import SlackService
+from .slack_service import SlackService, create_slack_http_client
 from .template_engine import TemplateEngine
 
 # Configure structured logging and auto tracing
@@ -415,6 +416,9 @@ async def _integration_dispatcher_startup() -> None:
         logger.error("Failed to initialize integration defaults", error=str(e))
         raise
 
+    # Shared pooled HTTP client for Slack broker publishes and response_url posts
+    slack_service.set_http_client(create_slack_http_client())
+
     # Start IMAP email polling if configured
     if os.getenv("IMAP_HOST") and os.getenv("SMTP_USERNAME"):
         logger.info("Starting IMAP email polling")
@@ -438,12 +442,25 @@ async def _integration_dispatcher_startup() -> None:
     logger.info("Integration Dispatcher startup validation completed")
 
 
+async def _integration_dispatcher_shutdown() -> None:
+    """Custom shutdown logic for Integration Dispatcher."""
+    email_handler = dispatcher.handlers.get(IntegrationType.EMAIL)
+    if isinstance(email_handler, EmailIntegrationHandler):
+        await email_handler.close()
+
+    http_client = slack_service.http_client
+    if http_client is not None:
+        slack_service.set_http_client(None)
+        await http_client.aclose()
+
+
 # Create lifespan using shared utility with custom startup
 def lifespan(app: FastAPI) -> Any:
     return create_shared_lifespan(
         service_name="integration-dispatcher",
         version=__version__,
         custom_startup=_integration_dispatcher_startup,
+        custom_shutdown=_integration_dispatcher_shutdown,
     )
 
 
@@ -474,6 +491,9 @@ if os.getenv("LOG_LEVEL", "INFO").upper() == "DEBUG":
         return response
 
 
+# Record database queries and pool waits per request
+app.add_middleware(QueryTrackingMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
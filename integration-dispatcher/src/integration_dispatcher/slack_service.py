@@ -30,6 +30,7 @@ from sqlalchemy import select
 
 from .slack_schemas import SlackInteractionPayload, SlackSlashCommand
 from .thread_lock import build_slack_thread_key, with_thread_lock
+from .ttl_cache import AsyncTTLCache
 from .user_mapping_utils import (
     ensure_email_mapping_consistency,
     resolve_user_id_from_email,
@@ -39,14 +40,38 @@ from .user_mapping_utils import (
 
 logger = configure_logging("integration-dispatcher")
 
+# Delivery modes for SlackService.stream_slack_message
+STREAM_MODE_FINAL = "final"  # one CloudEvent carrying the whole response
+STREAM_MODE_CHUNKED = "chunked"  # legacy: one CloudEvent per chunk
+STREAM_MODES = (STREAM_MODE_FINAL, STREAM_MODE_CHUNKED)
+
+
+def create_slack_http_client() -> httpx.AsyncClient:
+    """Create the application-scoped HTTP client used by SlackService.
+
+    Keep-alive pooling avoids a TCP/TLS handshake per broker publish or
+    response_url post, which matters under Slack's 3-second ack deadline.
+    """
+    return httpx.AsyncClient(
+        timeout=float(os.getenv("SLACK_HTTP_TIMEOUT", "15.0")),
+        limits=httpx.Limits(
+            max_connections=int(os.getenv("SLACK_HTTP_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(
+                os.getenv("SLACK_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+            ),
+            keepalive_expiry=float(os.getenv("SLACK_HTTP_KEEPALIVE_EXPIRY", "30.0")),
+        ),
+    )
+
 
 class SlackService:
     """Service for handling Slack events and interactions."""
 
     bot_token: Optional[str]
     slack_client: Optional[AsyncWebClient]
+    http_client: Optional[httpx.AsyncClient]
 
-    def __init__(self) -> None:
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None) -> None:
         self.signing_secret = os.getenv("SLACK_SIGNING_SECRET")
         # Simple rate limiting: track last request time per user
         self._last_request_time: Dict[str, float] = {}
@@ -57,8 +82,10 @@ class SlackService:
                 "BROKER_URL is required but not configured. "
                 "Slack service cannot forward requests to Request Manager without it."
             )
+        # Shared HTTP client (injected from the FastAPI lifespan via set_http_client)
+        self.http_client = http_client
         self.cloudevent_sender = CloudEventSender(
-            self.broker_url, "integration-dispatcher"
+            self.broker_url, "integration-dispatcher", http_client=http_client
         )
         # Slack client for API calls
         bot_token = os.getenv("SLACK_BOT_TOKEN")
@@ -69,6 +96,42 @@ class SlackService:
         else:
             self.bot_token = None
             self.slack_client = None
+        # Process-local Slack user -> email caches (users.info is rate limited)
+        cache_size = int(os.getenv("SLACK_USER_CACHE_SIZE", "10000"))
+        cache_ttl = float(os.getenv("SLACK_USER_CACHE_TTL", "300"))
+        self._user_email_cache: AsyncTTLCache[str, str] = AsyncTTLCache(
+            max_size=cache_size,
+            ttl=cache_ttl,
+            negative_ttl=float(os.getenv("SLACK_NEGATIVE_CACHE_TTL", "60")),
+        )
+        # DB mapping lookups are not negatively cached: a miss is followed by
+        # fetching from Slack and creating the mapping
+        self._mapping_email_cache: AsyncTTLCache[str, str] = AsyncTTLCache(
+            max_size=cache_size, ttl=cache_ttl, negative_ttl=0
+        )
+        self._integration_defaults_service: Optional[Any] = None
+        # Streaming delivery: one CloudEvent per response instead of per chunk
+        stream_mode = os.getenv("SLACK_STREAM_DELIVERY_MODE", STREAM_MODE_FINAL)
+        if stream_mode not in STREAM_MODES:
+            logger.warning(
+                "Unknown SLACK_STREAM_DELIVERY_MODE, using default",
+                configured=stream_mode,
+                default=STREAM_MODE_FINAL,
+            )
+            stream_mode = STREAM_MODE_FINAL
+        self.stream_delivery_mode = stream_mode
+
+    def set_http_client(self, http_client: Optional[httpx.AsyncClient]) -> None:
+        """Use a shared, pooled HTTP client for broker and response_url posts."""
+        self.http_client = http_client
+        self.cloudevent_sender.http_client = http_client
+
+    async def _post(self, url: str, timeout: float, **kwargs: Any) -> httpx.Response:
+        """POST via the shared client, or a short-lived one if none is injected."""
+        if self.http_client is not None:
+            return await self.http_client.post(url, timeout=timeout, **kwargs)
+        async with httpx.AsyncClient() as client:
+            return await client.post(url, timeout=timeout, **kwargs)
 
     def _create_slack_message_id(
         self, event: Dict[str, Any], event_id: str | None = None
@@ -134,14 +197,13 @@ class SlackService:
                     self.broker_url is not None
                 ), "broker_url should be validated in __init__"
                 headers, body = to_structured(event)
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        self.broker_url,
-                        headers=headers,
-                        content=body,
-                        timeout=15.0,
-                    )
-                    response.raise_for_status()
+                response = await self._post(
+                    self.broker_url,
+                    headers=headers,
+                    content=body,
+                    timeout=15.0,
+                )
+                response.raise_for_status()
 
                 logger.info(
                     "CloudEvent sent successfully",
@@ -477,17 +539,16 @@ class SlackService:
 
                     # Post to response URL
                     try:
-                        async with httpx.AsyncClient() as client:
-                            response = await client.post(
-                                payload.response_url,
-                                json=session_info_message,
-                                timeout=5.0,  # Reduced from 10s for faster failure detection
-                            )
-                            logger.debug(
-                                "Session info response URL post completed",
-                                status_code=response.status_code,
-                            )
-                            response.raise_for_status()
+                        response = await self._post(
+                            payload.response_url,
+                            json=session_info_message,
+                            timeout=5.0,  # Reduced from 10s for faster failure detection
+                        )
+                        logger.debug(
+                            "Session info response URL post completed",
+                            status_code=response.status_code,
+                        )
+                        response.raise_for_status()
                     except Exception as e:
                         logger.error(
                             "Failed to post session info",
@@ -566,17 +627,16 @@ class SlackService:
                         }
 
                         try:
-                            async with httpx.AsyncClient() as client:
-                                response = await client.post(
-                                    payload.response_url,
-                                    json=success_message,
-                                    timeout=5.0,
-                                )
-                                logger.debug(
-                                    "New session success response posted",
-                                    status_code=response.status_code,
-                                )
-                                response.raise_for_status()
+                            response = await self._post(
+                                payload.response_url,
+                                json=success_message,
+                                timeout=5.0,
+                            )
+                            logger.debug(
+                                "New session success response posted",
+                                status_code=response.status_code,
+                            )
+                            response.raise_for_status()
                         except Exception as response_e:
                             logger.error(
                                 "Failed to post new session success message",
@@ -609,17 +669,16 @@ class SlackService:
                         }
 
                         try:
-                            async with httpx.AsyncClient() as client:
-                                response = await client.post(
-                                    payload.response_url,
-                                    json=fallback_message,
-                                    timeout=5.0,  # Reduced from 10s for faster failure detection
-                                )
-                                logger.debug(
-                                    "Fallback new session response URL post completed",
-                                    status_code=response.status_code,
-                                )
-                                response.raise_for_status()
+                            response = await self._post(
+                                payload.response_url,
+                                json=fallback_message,
+                                timeout=5.0,  # Reduced from 10s for faster failure detection
+                            )
+                            logger.debug(
+                                "Fallback new session response URL post completed",
+                                status_code=response.status_code,
+                            )
+                            response.raise_for_status()
                         except Exception as fallback_e:
                             logger.error(
                                 "Failed to post fallback new session message",
@@ -710,11 +769,30 @@ class SlackService:
             }
 
     async def _get_user_email(self, slack_user_id: str) -> Optional[str]:
-        """Fetch user email address from Slack API and update last_validated_at."""
+        """Get user email address from Slack, cached per Slack user ID.
+
+        Users without an email (or unknown to Slack) are cached as negative
+        entries; API errors are not cached.
+        """
         if not self.slack_client:
             logger.warning("Slack client not available - cannot fetch user email")
             return None
 
+        try:
+            return await self._user_email_cache.get_or_load(
+                slack_user_id, lambda: self._fetch_user_email(slack_user_id)
+            )
+        except Exception:
+            # Already logged by _fetch_user_email
+            return None
+
+    async def _fetch_user_email(self, slack_user_id: str) -> Optional[str]:
+        """Fetch user email address from Slack API and update last_validated_at.
+
+        Returns None if the user has no email or does not exist; raises on
+        other API errors so they are not cached.
+        """
+        assert self.slack_client is not None
         try:
             response = await self.slack_client.users_info(user=slack_user_id)
             if response["ok"]:
@@ -742,67 +820,48 @@ class SlackService:
                         slack_user_id=slack_user_id,
                         user_info=user_info,
                     )
+                    return None
             else:
                 logger.error(
                     "Failed to fetch user info from Slack",
                     slack_user_id=slack_user_id,
                     error=response.get("error"),
                 )
+                if response.get("error") == "user_not_found":
+                    return None
+                raise SlackApiError(  # type: ignore[no-untyped-call]
+                    "users.info failed", response
+                )
         except SlackApiError as e:
             logger.error(
                 "Slack API error fetching user info",
                 slack_user_id=slack_user_id,
                 error=str(e),
             )
+            if e.response.get("error") == "user_not_found":
+                return None
+            raise
         except Exception as e:
             logger.error(
                 "Unexpected error fetching user info",
                 slack_user_id=slack_user_id,
                 error=str(e),
             )
-
-        return None
+            raise
 
     async def _get_cached_email_from_slack_user_id(
         self, slack_user_id: str
     ) -> Optional[str]:
-        """Get email from Slack user ID using cached mapping with TTL validation."""
-        try:
-            db_manager = get_database_manager()
-            async with db_manager.get_session() as db:
-                # Find mapping by Slack user ID
-                stmt = select(UserIntegrationMapping).where(
-                    UserIntegrationMapping.integration_user_id == slack_user_id,
-                    UserIntegrationMapping.integration_type == IntegrationType.SLACK,
-                )
-                result = await db.execute(stmt)
-                mapping = result.scalar_one_or_none()
-
-                if not mapping:
-                    logger.debug(
-                        "No cached mapping found for Slack user ID",
-                        slack_user_id=slack_user_id,
-                    )
-                    return None
-
-                # Use shared TTL validation logic
-                from .integrations.defaults import IntegrationDefaultsService
-
-                integration_defaults_service = IntegrationDefaultsService()
-
-                is_valid = (
-                    await integration_defaults_service._validate_mapping_with_ttl(
-                        mapping, "slack user lookup"
-                    )
-                )
-
-                if is_valid:
-                    await db.commit()
-                    return str(mapping.user_email)
-                else:
-                    await db.commit()
-                    return None
+        """Get email from Slack user ID using cached mapping with TTL validation.
 
+        Valid mappings are also kept in a process-local cache so repeat
+        messages from the same user skip the database.
+        """
+        try:
+            return await self._mapping_email_cache.get_or_load(
+                slack_user_id,
+                lambda: self._load_email_from_mapping(slack_user_id),
+            )
         except Exception as e:
             logger.error(
                 "Error getting cached email from Slack user ID",
@@ -811,6 +870,43 @@ class SlackService:
             )
             return None
 
+    async def _load_email_from_mapping(self, slack_user_id: str) -> Optional[str]:
+        db_manager = get_database_manager()
+        async with db_manager.get_session() as db:
+            # Find mapping by Slack user ID
+            stmt = select(UserIntegrationMapping).where(
+                UserIntegrationMapping.integration_user_id == slack_user_id,
+                UserIntegrationMapping.integration_type == IntegrationType.SLACK,
+            )
+            result = await db.execute(stmt)
+            mapping = result.scalar_one_or_none()
+
+            if not mapping:
+                logger.debug(
+                    "No cached mapping found for Slack user ID",
+                    slack_user_id=slack_user_id,
+                )
+                return None
+
+            # Use shared TTL validation logic
+            if self._integration_defaults_service is None:
+                from .integrations.defaults import IntegrationDefaultsService
+
+                self._integration_defaults_service = IntegrationDefaultsService()
+
+            is_valid = (
+                await self._integration_defaults_service._validate_mapping_with_ttl(
+                    mapping, "slack user lookup"
+                )
+            )
+
+            if is_valid:
+                await db.commit()
+                return str(mapping.user_email)
+            else:
+                await db.commit()
+                return None
+
     async def _try_resolve_from_existing_mapping(
         self, slack_user_id: str, context: str, db: Any
     ) -> Optional[str]:
@@ -1231,36 +1327,61 @@ class SlackService:
             return f"Error fetching session details: {str(e)}"
 
     async def stream_slack_message(
-        self, channel: str, content: str, thread_ts: Optional[str] = None
+        self,
+        channel: str,
+        content: str,
+        thread_ts: Optional[str] = None,
+        mode: Optional[str] = None,
     ) -> bool:
-        """Stream a message to Slack using optimized streaming."""
-        try:
-            # Use optimized streaming configuration
-            config = LlamaStackStreamProcessor.get_optimal_stream_config(len(content))
-            chunk_size = config["chunk_size"]
+        """Stream a message to Slack.
 
-            # Send in optimized chunks for better user experience
-            for i in range(0, len(content), chunk_size):
-                chunk = content[i : i + chunk_size]
+        Modes (default from SLACK_STREAM_DELIVERY_MODE):
+            final (default): send the whole response as a single CloudEvent.
+            chunked: legacy behaviour, one CloudEvent per chunk.
+        """
+        mode = mode or self.stream_delivery_mode
+        chunk_size: Optional[int] = None
 
-                # Send chunk to Slack
-                await self._send_cloudevent(
-                    {
-                        "channel": channel,
-                        "text": chunk,
-                        "thread_ts": thread_ts,
-                    },
-                    "slack.message.stream",
+        try:
+            if mode == STREAM_MODE_CHUNKED:
+                # Use optimized streaming configuration
+                config = LlamaStackStreamProcessor.get_optimal_stream_config(
+                    len(content)
                 )
+                chunk_size = config["chunk_size"]
+                api_calls = 0
+                # Send in optimized chunks for better user experience
+                for i in range(0, len(content), chunk_size):
+                    chunk = content[i : i + chunk_size]
+
+                    # Send chunk to Slack
+                    await self._send_cloudevent(
+                        {
+                            "channel": channel,
+                            "text": chunk,
+                            "thread_ts": thread_ts,
+                        },
+                        "slack.message.stream",
+                    )
+                    api_calls += 1
 
-                # Small delay between chunks for better UX
-                await asyncio.sleep(0.001)
+                    # Small delay between chunks for better UX
+                    await asyncio.sleep(0.001)
+            else:
+                if not await self._send_cloudevent(
+                    {"channel": channel, "text": content, "thread_ts": thread_ts},
+                    "slack.message.stream",
+                ):
+                    return False
+                api_calls = 1
 
             logger.info(
                 "Slack message streamed successfully",
                 channel=channel,
                 content_length=len(content),
                 chunk_size=chunk_size,
+                mode=mode,
+                api_calls=api_calls,
             )
             return True
 
@@ -1268,6 +1389,7 @@ class SlackService:
             logger.error(
                 "Failed to stream Slack message",
                 channel=channel,
+                mode=mode,
                 error=str(e),
             )
             return False
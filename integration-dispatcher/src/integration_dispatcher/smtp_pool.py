@@ -0,0 +1,194 @@
+"""Pool of authenticated SMTP connections shared by email deliveries."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from email.message import Message
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+import aiosmtplib
+from shared_models import configure_logging
+
+logger = configure_logging("integration-dispatcher")
+
+# Errors after which the connection can no longer be trusted and is reopened
+_CONNECTION_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPConnectError,
+    aiosmtplib.SMTPTimeoutError,
+    OSError,
+)
+
+
+class _PooledSMTP(aiosmtplib.SMTP):
+    """SMTP connection that records whether the server accepted MAIL FROM."""
+
+    transaction_started = False
+
+    async def mail(self, *args: Any, **kwargs: Any) -> aiosmtplib.SMTPResponse:
+        response = await super().mail(*args, **kwargs)
+        self.transaction_started = True
+        return response
+
+
+class SMTPConnectionPool:
+    """Reuse connected, STARTTLS-upgraded and logged-in SMTP sessions.
+
+    Each send borrows a connection instead of paying TCP connect, TLS and
+    AUTH per message. Connections idle longer than ``idle_timeout`` are
+    evicted, connections idle longer than ``health_check_interval`` are
+    probed with NOOP before reuse, and a send whose connection breaks before
+    the server accepted MAIL FROM is retried once on a fresh one. Failures
+    after that are not retried, as the message may already have been
+    delivered.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = False,
+        start_tls: Optional[bool] = None,
+        max_size: int = 4,
+        idle_timeout: float = 60.0,
+        health_check_interval: float = 10.0,
+        timeout: float = 30.0,
+    ) -> None:
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.start_tls = start_tls
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+        # (connection, last_used monotonic time); most recently used at the end
+        self._idle: List[Tuple[_PooledSMTP, float]] = []
+        self._semaphore = asyncio.Semaphore(self.max_size)
+        self._closed = False
+        self.connections_opened = 0
+
+    @property
+    def idle_count(self) -> int:
+        """Number of idle connections currently held."""
+        return len(self._idle)
+
+    async def send_message(self, message: Message) -> None:
+        """Send a message over a pooled connection.
+
+        Reconnects once if the connection fails before the transaction starts.
+        """
+        for attempt in range(2):
+            async with self._acquire(fresh=attempt > 0) as smtp:
+                smtp.transaction_started = False
+                try:
+                    await smtp.send_message(message)
+                    return
+                except _CONNECTION_ERRORS as e:
+                    # Closed connections are not returned to the pool
+                    await self._quit(smtp)
+                    if attempt > 0 or smtp.transaction_started:
+                        raise
+                    logger.info(
+                        "SMTP connection failed before sending, reconnecting",
+                        smtp_host=self.hostname,
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
+                except aiosmtplib.SMTPException:
+                    # Transaction state is unknown after a server rejection
+                    await self._quit(smtp)
+                    raise
+
+    async def close(self) -> None:
+        """Close all idle connections and refuse further use."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            await self._quit(smtp)
+
+    @asynccontextmanager
+    async def _acquire(self, fresh: bool = False) -> AsyncIterator[_PooledSMTP]:
+        if self._closed:
+            raise RuntimeError("SMTP connection pool is closed")
+
+        async with self._semaphore:
+            smtp = None if fresh else await self._take_idle()
+            if smtp is None:
+                smtp = await self._connect()
+            try:
+                yield smtp
+            finally:
+                if smtp.is_connected and not self._closed:
+                    self._idle.append((smtp, time.monotonic()))
+                else:
+                    await self._quit(smtp)
+
+    async def _take_idle(self) -> Optional[_PooledSMTP]:
+        """Pop the freshest usable idle connection, evicting stale ones."""
+        now = time.monotonic()
+        while self._idle:
+            smtp, last_used = self._idle.pop()
+            idle_for = now - last_used
+            if idle_for > self.idle_timeout or not smtp.is_connected:
+                await self._quit(smtp)
+                continue
+            if idle_for > self.health_check_interval:
+                try:
+                    await smtp.noop()
+                except Exception as e:
+                    logger.debug(
+                        "Pooled SMTP connection failed NOOP, discarding",
+                        error=str(e),
+                    )
+                    await self._quit(smtp)
+                    continue
+            # Anything older than the one we picked has been idle even longer
+            await self._evict_expired(now)
+            return smtp
+        return None
+
+    async def _evict_expired(self, now: float) -> None:
+        keep: List[Tuple[_PooledSMTP, float]] = []
+        for smtp, last_used in self._idle:
+            if now - last_used > self.idle_timeout:
+                await self._quit(smtp)
+            else:
+                keep.append((smtp, last_used))
+        self._idle = keep
+
+    async def _connect(self) -> _PooledSMTP:
+        smtp = _PooledSMTP(
+            hostname=self.hostname,
+            port=self.port,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await smtp.connect()
+        if self.username and self.password:
+            try:
+                await smtp.login(self.username, self.password)
+            except Exception:
+                await self._quit(smtp)
+                raise
+        self.connections_opened += 1
+        logger.debug(
+            "Opened pooled SMTP connection",
+            smtp_host=self.hostname,
+            smtp_port=self.port,
+            connections_opened=self.connections_opened,
+        )
+        return smtp
+
+    async def _quit(self, smtp: aiosmtplib.SMTP) -> None:
+        if not smtp.is_connected:
+            return
+        try:
+            await smtp.quit()
+        except Exception:
+            smtp.close()
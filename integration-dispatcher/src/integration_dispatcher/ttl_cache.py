@@ -0,0 +1,120 @@
+"""Process-local TTL/LRU cache with single-flight loading."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class AsyncTTLCache(Generic[K, V]):
+    """Size-bounded cache whose entries expire after a TTL.
+
+    ``None`` values are cached as negative entries (e.g. "user not found")
+    with their own, usually shorter, ``negative_ttl``. Concurrent misses for
+    the same key share a single loader call. Loader exceptions are not
+    cached, so transient errors are retried on the next lookup.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 300.0,
+        negative_ttl: float = 60.0,
+    ) -> None:
+        self.max_size = max(1, max_size)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # key -> (value, expires_at monotonic time); least recently used first
+        self._entries: "OrderedDict[K, Tuple[Optional[V], float]]" = OrderedDict()
+        self._inflight: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Tuple[bool, Optional[V]]:
+        """Return (found, value); a found negative entry returns (True, None)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: K, value: Optional[V]) -> None:
+        """Store a value (or a negative entry for None), evicting the LRU entry."""
+        ttl = self.ttl if value is not None else self.negative_ttl
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """Drop a cached entry so the next lookup reloads it."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    async def get_or_load(
+        self, key: K, loader: Callable[[], Awaitable[Optional[V]]]
+    ) -> Optional[V]:
+        """Return the cached value or load it, sharing one load per key."""
+        while True:
+            found, value = self.get(key)
+            if found:
+                self.hits += 1
+                return value
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                # Shield so a cancelled waiter does not cancel the shared load
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The loading task was cancelled; retry the lookup ourselves
+
+        self.misses += 1
+        future: "asyncio.Future[Optional[V]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged by asyncio
+            future.exception()
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
@@ -0,0 +1,227 @@
+"""Tests for EmailService IMAP fetching and the processing pipeline."""
+
+import asyncio
+import time
+from email.message import Message
+from typing import Any, List, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from integration_dispatcher.email_service import EmailService
+
+
+def _raw_email(sender: str, subject: str) -> bytes:
+    return (
+        f"From: {sender}\r\nSubject: {subject}\r\n"
+        f"Message-ID: <{subject}@example.com>\r\n\r\nbody of {subject}\r\n"
+    ).encode()
+
+
+@pytest.fixture
+def email_service(monkeypatch: pytest.MonkeyPatch) -> EmailService:
+    """EmailService with a broker URL and no IMAP server configured."""
+    monkeypatch.setenv("BROKER_URL", "http://broker.example/")
+    monkeypatch.setenv("IMAP_PROCESS_CONCURRENCY", "2")
+    return EmailService()
+
+
+class TestParseFetchResponse:
+    """Tests for parsing batched UID FETCH responses."""
+
+    def test_sorted_by_internaldate(self, email_service: EmailService) -> None:
+        """Messages are returned in server receive order, not UID order."""
+        first = _raw_email("a@example.com", "first")
+        second = _raw_email("b@example.com", "second")
+        data = [
+            b'1 FETCH (UID 7 INTERNALDATE "02-Jan-2025 10:00:00 +0000" BODY[] {%d}'
+            % len(second),
+            bytearray(second),
+            b")",
+            b'2 FETCH (UID 9 INTERNALDATE "01-Jan-2025 10:00:00 +0000" BODY[] {%d}'
+            % len(first),
+            bytearray(first),
+            b")",
+            b"FETCH completed.",
+        ]
+
+        messages = email_service._parse_fetch_response(data)
+
+        assert messages == [("9", first), ("7", second)]
+
+    def test_uid_after_literal(self, email_service: EmailService) -> None:
+        """UID sent after the literal is still picked up."""
+        raw = _raw_email("a@example.com", "late-uid")
+        data = [
+            b"3 FETCH (BODY[] {%d}" % len(raw),
+            bytearray(raw),
+            b" UID 12)",
+            b"FETCH completed.",
+        ]
+
+        assert email_service._parse_fetch_response(data) == [("12", raw)]
+
+    def test_missing_dates_fall_back_to_uid_order(
+        self, email_service: EmailService
+    ) -> None:
+        """Without INTERNALDATE the UID order is used."""
+        a = _raw_email("a@example.com", "a")
+        b = _raw_email("b@example.com", "b")
+        data = [
+            b"1 FETCH (UID 20 BODY[] {%d}" % len(a),
+            bytearray(a),
+            b")",
+            b"2 FETCH (UID 4 BODY[] {%d}" % len(b),
+            bytearray(b),
+            b")",
+        ]
+
+        assert [uid for uid, _ in email_service._parse_fetch_response(data)] == [
+            "4",
+            "20",
+        ]
+
+    def test_new_mail_push(self) -> None:
+        """EXISTS/RECENT pushes signal new mail; EXPUNGE does not."""
+        assert EmailService._is_new_mail_push([b"5 EXISTS"])
+        assert EmailService._is_new_mail_push([b"3 EXPUNGE", b"1 RECENT"])
+        assert not EmailService._is_new_mail_push([b"3 EXPUNGE"])
+
+
+class TestProcessingPipeline:
+    """Tests for concurrent processing with per-sender ordering."""
+
+    @pytest.mark.asyncio
+    async def test_per_sender_order_and_bounded_concurrency(
+        self, email_service: EmailService
+    ) -> None:
+        """Same-sender emails stay ordered; different senders overlap up to the limit."""
+        order: List[str] = []
+        active = 0
+        max_active = 0
+
+        async def fake_process(uid: str, email_message: Message) -> bool:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            order.append(f"{email_message['From']}:{uid}")
+            active -= 1
+            return uid != "3"
+
+        email_service.user_cooldown = 0
+        messages = [
+            ("1", _raw_email("alice@example.com", "a1")),
+            ("2", _raw_email("bob@example.com", "b1")),
+            ("3", _raw_email("Alice@Example.com", "a2")),
+            ("4", _raw_email("carol@example.com", "c1")),
+            ("5", _raw_email("alice@example.com", "a3")),
+        ]
+
+        with patch.object(email_service, "_process_email", fake_process):
+            seen = await email_service._process_messages(messages)
+
+        alice = [entry for entry in order if entry.lower().startswith("alice")]
+        assert [entry.split(":")[1] for entry in alice] == ["1", "3", "5"]
+        assert max_active == 2
+        assert seen == ["1", "2", "4", "5"]
+
+    @pytest.mark.asyncio
+    async def test_cooldown_does_not_hold_a_slot(
+        self, email_service: EmailService
+    ) -> None:
+        """A sender in cooldown waits without a slot; other senders proceed."""
+        order: List[str] = []
+
+        async def fake_process(uid: str, email_message: Message) -> bool:
+            order.append(uid)
+            return True
+
+        email_service.imap_process_concurrency = 1
+        email_service.user_cooldown = 0.1
+        email_service._last_request_time["alice@example.com"] = time.time()
+        messages = [
+            ("1", _raw_email("alice@example.com", "a1")),
+            ("2", _raw_email("bob@example.com", "b1")),
+        ]
+
+        with patch.object(email_service, "_process_email", fake_process):
+            await email_service._process_messages(messages)
+
+        assert order == ["2", "1"]
+
+
+class TestPollMailbox:
+    """Tests for the batched search/fetch/store cycle."""
+
+    @pytest.mark.asyncio
+    async def test_single_fetch_and_store(self, email_service: EmailService) -> None:
+        """One UID FETCH with BODY.PEEK[] and one UID STORE per batch."""
+        raw = _raw_email("alice@example.com", "hello")
+        imap = MagicMock()
+        imap.uid_search = AsyncMock(return_value=("OK", [b"3 8", b"SEARCH done"]))
+        imap.uid = AsyncMock(
+            side_effect=[
+                (
+                    "OK",
+                    [
+                        b"1 FETCH (UID 3 BODY[] {%d}" % len(raw),
+                        bytearray(raw),
+                        b")",
+                        b"2 FETCH (UID 8 BODY[] {%d}" % len(raw),
+                        bytearray(raw),
+                        b")",
+                    ],
+                ),
+                ("OK", []),
+            ]
+        )
+        email_service._get_imap_client = AsyncMock(return_value=imap)  # type: ignore[method-assign]
+        email_service._process_email = AsyncMock(side_effect=[True, False])  # type: ignore[method-assign]
+
+        await email_service._poll_mailbox()
+
+        fetch_call, store_call = imap.uid.await_args_list
+        assert fetch_call.args == ("fetch", "3,8", "(UID INTERNALDATE BODY.PEEK[])")
+        assert store_call.args == ("store", "3", "+FLAGS", "(\\Seen)")
+
+    @pytest.mark.asyncio
+    async def test_fetches_in_uid_batches(self, email_service: EmailService) -> None:
+        """Unread UIDs are fetched oldest first, at most a batch at a time."""
+        email_service.imap_fetch_batch_size = 2
+        raw = _raw_email("alice@example.com", "hello")
+
+        def fetch_response(uids: str) -> Tuple[str, List[Any]]:
+            data: List[Any] = []
+            for n, uid in enumerate(uids.split(","), start=1):
+                data += [
+                    b"%d FETCH (UID %s BODY[] {%d}" % (n, uid.encode(), len(raw)),
+                    bytearray(raw),
+                    b")",
+                ]
+            return "OK", data
+
+        async def uid(command: str, uids: str, *args: str) -> Tuple[str, List[Any]]:
+            return fetch_response(uids) if command == "fetch" else ("OK", [])
+
+        imap = MagicMock()
+        imap.uid_search = AsyncMock(return_value=("OK", [b"12 3 8 5 21"]))
+        imap.uid = AsyncMock(side_effect=uid)
+        email_service._get_imap_client = AsyncMock(return_value=imap)  # type: ignore[method-assign]
+        email_service._process_email = AsyncMock(return_value=True)  # type: ignore[method-assign]
+
+        await email_service._poll_mailbox()
+
+        calls = [call.args[:2] for call in imap.uid.await_args_list]
+        assert calls == [
+            ("fetch", "3,5"),
+            ("store", "3,5"),
+            ("fetch", "8,12"),
+            ("store", "8,12"),
+            ("fetch", "21"),
+            ("store", "21"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_wait_without_idle_sleeps(self, email_service: EmailService) -> None:
+        """Without an IDLE-capable connection the wait is a plain sleep."""
+        assert await email_service._wait_for_new_mail(0.01) is False
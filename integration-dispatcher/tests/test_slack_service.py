@@ -0,0 +1,147 @@
+"""Tests for SlackService HTTP client handling and user lookup caches."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from integration_dispatcher.slack_service import SlackService, create_slack_http_client
+
+
+@pytest.fixture
+def slack_service(monkeypatch: pytest.MonkeyPatch) -> SlackService:
+    """SlackService with a broker URL and no Slack bot token."""
+    monkeypatch.setenv("BROKER_URL", "http://broker.example/")
+    monkeypatch.delenv("SLACK_BOT_TOKEN", raising=False)
+    return SlackService()
+
+
+class TestSlackServiceHttpClient:
+    """Tests for the shared, lifespan-injected HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_create_slack_http_client(self) -> None:
+        """Factory returns a usable AsyncClient."""
+        client = create_slack_http_client()
+        try:
+            assert isinstance(client, httpx.AsyncClient)
+        finally:
+            await client.aclose()
+
+    def test_set_http_client_shares_with_sender(
+        self, slack_service: SlackService
+    ) -> None:
+        """The injected client is also used by the CloudEventSender."""
+        shared = MagicMock(spec=httpx.AsyncClient)
+        slack_service.set_http_client(shared)
+        assert slack_service.http_client is shared
+        assert slack_service.cloudevent_sender.http_client is shared
+
+    @pytest.mark.asyncio
+    async def test_send_cloudevent_reuses_shared_client(
+        self, slack_service: SlackService
+    ) -> None:
+        """Non-request events are posted via the shared client."""
+        resp = MagicMock(raise_for_status=MagicMock())
+        shared = MagicMock(post=AsyncMock(return_value=resp))
+        slack_service.set_http_client(shared)
+
+        with patch("httpx.AsyncClient") as client_cls:
+            for _ in range(3):
+                assert await slack_service._send_cloudevent(
+                    {"channel": "C1", "text": "hi"}, "slack.message.stream"
+                )
+
+        assert shared.post.await_count == 3
+        client_cls.assert_not_called()
+
+
+class TestSlackUserLookupCaches:
+    """Tests for cached Slack user -> email and DM channel lookups."""
+
+    @pytest.mark.asyncio
+    async def test_user_email_cached(self, slack_service: SlackService) -> None:
+        """Repeat lookups for the same user call users.info once."""
+        slack_service.slack_client = MagicMock()
+        slack_service._fetch_user_email = AsyncMock(  # type: ignore[method-assign]
+            return_value="alice@example.com"
+        )
+
+        for _ in range(3):
+            assert await slack_service._get_user_email("U1") == "alice@example.com"
+
+        slack_service._fetch_user_email.assert_awaited_once_with("U1")
+
+    @pytest.mark.asyncio
+    async def test_user_not_found_negatively_cached(
+        self, slack_service: SlackService
+    ) -> None:
+        """A user_not_found response is cached; other errors are retried."""
+        from slack_sdk.errors import SlackApiError
+
+        slack_service.slack_client = MagicMock()
+        slack_service.slack_client.users_info = AsyncMock(
+            side_effect=[
+                SlackApiError(  # type: ignore[no-untyped-call]
+                    "rate limited", {"ok": False, "error": "ratelimited"}
+                ),
+                SlackApiError(  # type: ignore[no-untyped-call]
+                    "not found", {"ok": False, "error": "user_not_found"}
+                ),
+            ]
+        )
+
+        assert await slack_service._get_user_email("U2") is None
+        assert await slack_service._get_user_email("U2") is None
+        assert await slack_service._get_user_email("U2") is None
+
+        assert slack_service.slack_client.users_info.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_dm_channel_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """DM delivery resolves the user and opens the channel once per user."""
+        from integration_dispatcher.integrations.slack import SlackIntegrationHandler
+
+        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+        handler = SlackIntegrationHandler()
+        client = MagicMock()
+        client.users_lookupByEmail = AsyncMock(
+            return_value={"ok": True, "user": {"id": "U3"}}
+        )
+        client.conversations_open = AsyncMock(
+            return_value={"ok": True, "channel": {"id": "D3"}}
+        )
+        handler.client = client
+
+        results = await asyncio.gather(
+            handler._get_user_dm_channel("Carol@example.com"),
+            handler._get_user_dm_channel("carol@example.com"),
+            handler._get_user_dm_channel_by_id("U3"),
+        )
+
+        assert list(results) == ["D3", "D3", "D3"]
+        client.users_lookupByEmail.assert_awaited_once()
+        client.conversations_open.assert_awaited_once_with(users=["U3"])
+
+    @pytest.mark.asyncio
+    async def test_dm_channel_failure_not_cached(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A conversations.open response without a channel id is retried."""
+        from integration_dispatcher.integrations.slack import SlackIntegrationHandler
+
+        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+        handler = SlackIntegrationHandler()
+        client = MagicMock()
+        client.conversations_open = AsyncMock(
+            side_effect=[
+                {"ok": True, "channel": {}},
+                {"ok": True, "channel": {"id": "D4"}},
+            ]
+        )
+        handler.client = client
+
+        with pytest.raises(Exception, match="Failed to open DM channel"):
+            await handler._get_user_dm_channel_by_id("U4")
+        assert await handler._get_user_dm_channel_by_id("U4") == "D4"
+        assert client.conversations_open.await_count == 2
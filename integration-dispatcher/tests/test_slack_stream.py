@@ -0,0 +1,53 @@
+"""Tests for Slack streamed message delivery."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from integration_dispatcher.slack_service import SlackService
+
+
+class TestStreamSlackMessageModes:
+    """Tests for SlackService.stream_slack_message delivery modes."""
+
+    @pytest.fixture
+    def slack_service(self, monkeypatch: pytest.MonkeyPatch) -> SlackService:
+        monkeypatch.setenv("BROKER_URL", "http://broker.example/")
+        monkeypatch.delenv("SLACK_BOT_TOKEN", raising=False)
+        return SlackService()
+
+    @pytest.mark.asyncio
+    async def test_final_mode_sends_single_event(
+        self, slack_service: SlackService
+    ) -> None:
+        """Final mode publishes the whole response as one CloudEvent."""
+        slack_service._send_cloudevent = AsyncMock(return_value=True)  # type: ignore[method-assign]
+        content = "x" * 1500
+
+        assert await slack_service.stream_slack_message("C1", content, mode="final")
+        slack_service._send_cloudevent.assert_awaited_once()
+        call_args = slack_service._send_cloudevent.await_args
+        assert call_args is not None
+        assert call_args.args[0]["text"] == content
+
+    @pytest.mark.asyncio
+    async def test_default_mode_uses_broker(
+        self, slack_service: SlackService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """By default a single CloudEvent is sent even with a bot token."""
+        monkeypatch.delenv("SLACK_STREAM_DELIVERY_MODE", raising=False)
+        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+        service = SlackService()
+        service._send_cloudevent = AsyncMock(return_value=True)  # type: ignore[method-assign]
+
+        assert await service.stream_slack_message("C1", "v" * 1500)
+        service._send_cloudevent.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_chunked_mode_sends_event_per_chunk(
+        self, slack_service: SlackService
+    ) -> None:
+        """Legacy chunked mode is still available."""
+        slack_service._send_cloudevent = AsyncMock(return_value=True)  # type: ignore[method-assign]
+
+        assert await slack_service.stream_slack_message("C1", "w" * 150, mode="chunked")
+        assert slack_service._send_cloudevent.await_count == 3
@@ -0,0 +1,187 @@
+"""Tests for the pooled SMTP sender against a local aiosmtpd server."""
+
+import asyncio
+import socket
+from email.message import EmailMessage
+from typing import Any, Iterator, List
+from unittest.mock import AsyncMock
+
+import aiosmtplib
+import pytest
+from aiosmtpd.controller import Controller
+from integration_dispatcher.smtp_pool import SMTPConnectionPool
+
+
+class RecordingHandler:
+    """aiosmtpd handler that records delivered envelopes."""
+
+    def __init__(self) -> None:
+        self.messages: List[Any] = []
+
+    async def handle_DATA(self, server: Any, session: Any, envelope: Any) -> str:
+        self.messages.append(envelope)
+        return "250 OK"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+@pytest.fixture
+def smtp_server() -> Iterator[tuple[Controller, RecordingHandler]]:
+    """Run a local SMTP server on an ephemeral port."""
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    try:
+        yield controller, handler
+    finally:
+        controller.stop()
+
+
+def _message(n: int) -> EmailMessage:
+    msg = EmailMessage()
+    msg["From"] = "agent@example.com"
+    msg["To"] = "user@example.com"
+    msg["Subject"] = f"Ticket update {n}"
+    msg.set_content("body")
+    return msg
+
+
+def _pool(controller: Controller, **kwargs: Any) -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        hostname="127.0.0.1",
+        port=controller.port,
+        start_tls=False,
+        **kwargs,
+    )
+
+
+class TestSMTPConnectionPool:
+    """Tests for SMTPConnectionPool."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_sends_reuse_one_connection(
+        self, smtp_server: tuple[Controller, RecordingHandler]
+    ) -> None:
+        """Sequential sends share a single connection."""
+        controller, handler = smtp_server
+        pool = _pool(controller)
+        try:
+            for n in range(5):
+                await pool.send_message(_message(n))
+        finally:
+            await pool.close()
+
+        assert len(handler.messages) == 5
+        assert pool.connections_opened == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_bounded_by_pool_size(
+        self, smtp_server: tuple[Controller, RecordingHandler]
+    ) -> None:
+        """Concurrent sends never open more than max_size connections."""
+        controller, handler = smtp_server
+        pool = _pool(controller, max_size=2)
+        try:
+            await asyncio.gather(*(pool.send_message(_message(n)) for n in range(10)))
+            assert pool.idle_count <= 2
+        finally:
+            await pool.close()
+
+        assert len(handler.messages) == 10
+        assert pool.connections_opened <= 2
+
+    @pytest.mark.asyncio
+    async def test_idle_connections_are_evicted(
+        self, smtp_server: tuple[Controller, RecordingHandler]
+    ) -> None:
+        """Connections idle past idle_timeout are closed rather than reused."""
+        controller, handler = smtp_server
+        pool = _pool(controller, idle_timeout=0.0)
+        try:
+            await pool.send_message(_message(1))
+            stale = pool._idle[0][0]
+            await asyncio.sleep(0.01)
+            await pool.send_message(_message(2))
+        finally:
+            await pool.close()
+
+        assert not stale.is_connected
+        assert pool.connections_opened == 2
+        assert len(handler.messages) == 2
+
+    @pytest.mark.asyncio
+    async def test_noop_health_check_before_reuse(
+        self, smtp_server: tuple[Controller, RecordingHandler]
+    ) -> None:
+        """A connection failing NOOP is replaced before sending."""
+        controller, handler = smtp_server
+        pool = _pool(controller, health_check_interval=0.0)
+        try:
+            await pool.send_message(_message(1))
+            stale = pool._idle[0][0]
+            stale.noop = AsyncMock(  # type: ignore[method-assign]
+                side_effect=aiosmtplib.SMTPServerDisconnected("gone")
+            )
+            await pool.send_message(_message(2))
+        finally:
+            await pool.close()
+
+        stale.noop.assert_awaited_once()
+        assert pool.connections_opened == 2
+        assert len(handler.messages) == 2
+
+    @pytest.mark.asyncio
+    async def test_reconnects_when_connection_drops_before_transaction(
+        self, smtp_server: tuple[Controller, RecordingHandler]
+    ) -> None:
+        """A send on a connection that drops at MAIL FROM is retried once."""
+        controller, handler = smtp_server
+        pool = _pool(controller)
+        try:
+            await pool.send_message(_message(1))
+            broken = pool._idle[0][0]
+            broken.mail = AsyncMock(  # type: ignore[method-assign]
+                side_effect=aiosmtplib.SMTPServerDisconnected("dropped")
+            )
+            await pool.send_message(_message(2))
+        finally:
+            await pool.close()
+
+        assert pool.connections_opened == 2
+        assert len(handler.messages) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_retry_once_transaction_started(
+        self, smtp_server: tuple[Controller, RecordingHandler]
+    ) -> None:
+        """A timeout after MAIL FROM is raised rather than risking a duplicate."""
+        controller, handler = smtp_server
+        pool = _pool(controller)
+        try:
+            await pool.send_message(_message(1))
+            slow = pool._idle[0][0]
+            slow.data = AsyncMock(  # type: ignore[method-assign]
+                side_effect=aiosmtplib.SMTPTimeoutError("no reply to DATA")
+            )
+            with pytest.raises(aiosmtplib.SMTPTimeoutError):
+                await pool.send_message(_message(2))
+        finally:
+            await pool.close()
+
+        assert pool.connections_opened == 1
+        assert len(handler.messages) == 1
+
+    @pytest.mark.asyncio
+    async def test_closed_pool_rejects_sends(
+        self, smtp_server: tuple[Controller, RecordingHandler]
+    ) -> None:
+        """Sending after close() raises."""
+        controller, _ = smtp_server
+        pool = _pool(controller)
+        await pool.close()
+        with pytest.raises(RuntimeError):
+            await pool.send_message(_message(1))
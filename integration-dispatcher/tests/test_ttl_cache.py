@@ -0,0 +1,95 @@
+"""Tests for the process-local TTL/LRU cache."""
+
+import asyncio
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+from integration_dispatcher.ttl_cache import AsyncTTLCache
+
+
+class TestAsyncTTLCache:
+    """Tests for expiry, eviction and single-flight loading."""
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used entry is evicted past max_size."""
+        cache: AsyncTTLCache[str, int] = AsyncTTLCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == (True, 1)
+        cache.set("c", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert len(cache) == 2
+
+    def test_expiry_and_negative_ttl(self) -> None:
+        """Positive and negative entries expire after their own TTLs."""
+        cache: AsyncTTLCache[str, int] = AsyncTTLCache(ttl=10, negative_ttl=1)
+        with patch("integration_dispatcher.ttl_cache.time.monotonic") as now:
+            now.return_value = 100.0
+            cache.set("found", 1)
+            cache.set("missing", None)
+            assert cache.get("missing") == (True, None)
+
+            now.return_value = 105.0
+            assert cache.get("found") == (True, 1)
+            assert cache.get("missing") == (False, None)
+
+            now.return_value = 111.0
+            assert cache.get("found") == (False, None)
+
+    def test_negative_caching_disabled(self) -> None:
+        """negative_ttl=0 does not store None results."""
+        cache: AsyncTTLCache[str, int] = AsyncTTLCache(negative_ttl=0)
+        cache.set("missing", None)
+        assert cache.get("missing") == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self) -> None:
+        """Concurrent misses for one key share a single load."""
+        cache: AsyncTTLCache[str, str] = AsyncTTLCache()
+        calls = 0
+
+        async def loader() -> Optional[str]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(
+            *(cache.get_or_load("key", loader) for _ in range(5))
+        )
+
+        assert results == ["value"] * 5
+        assert calls == 1
+        assert await cache.get_or_load("key", loader) == "value"
+        assert calls == 1
+        assert cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self) -> None:
+        """A failed load propagates to all waiters and is retried next time."""
+        cache: AsyncTTLCache[str, str] = AsyncTTLCache()
+        calls = 0
+
+        async def failing() -> Optional[str]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("rate_limited")
+
+        results = await asyncio.gather(
+            cache.get_or_load("key", failing),
+            cache.get_or_load("key", failing),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert calls == 1
+        assert cache.get("key") == (False, None)
+
+        async def succeeding() -> Optional[str]:
+            return "ok"
+
+        assert await cache.get_or_load("key", succeeding) == "ok"
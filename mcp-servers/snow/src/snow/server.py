@@ -11,7 +11,7 @@ from typing import Any, AsyncGenerator, Literal
 from mcp.server.fastmcp import Context, FastMCP
 from shared_models import configure_logging
 from snow.servicenow import headers
-from snow.servicenow.client import ServiceNowClient
+from snow.servicenow.client import ServiceNowClient, close_http_client
 from snow.servicenow.models import OpenServiceNowLaptopRefreshRequestParams
 from snow.tracing import trace_mcp_tool
 from starlette.responses import JSONResponse
@@ -72,6 +72,7 @@ async def lifespan(app: FastMCP) -> AsyncGenerator[None, None]:
     finally:
         # Cleanup
         logger.info("Shutting down ServiceNow MCP server")
+        await close_http_client()
 
 
 MCP_TRANSPORT: Literal["stdio", "sse", "streamable-http"] = os.environ.get("MCP_TRANSPORT", "sse")  # type: ignore[assignment]
@@ -95,7 +96,7 @@ async def health(request: Any) -> JSONResponse:
 
 @mcp.tool()
 @trace_mcp_tool()
-def open_laptop_refresh_ticket(
+async def open_laptop_refresh_ticket(
     employee_name: str,
     business_justification: str,
     servicenow_laptop_code: str,
@@ -157,7 +158,7 @@ def open_laptop_refresh_ticket(
             tool="open_laptop_refresh_ticket",
             email=authoritative_user_id,
         )
-        user_result = client.get_user_by_email(authoritative_user_id)
+        user_result = await client.get_user_by_email(authoritative_user_id)
         if user_result.get("success") and user_result.get("user"):
             user_sys_id = user_result["user"].get("sys_id")
             if not user_sys_id:
@@ -180,7 +181,7 @@ def open_laptop_refresh_ticket(
             laptop_choices=servicenow_laptop_code,
         )
 
-        result = client.open_laptop_refresh_request(params)
+        result = await client.open_laptop_refresh_request(params)
 
         # Extract the required fields from the result
         if result.get("success") and result.get("data", {}).get("result"):
@@ -210,7 +211,7 @@ def open_laptop_refresh_ticket(
 
 @mcp.tool()
 @trace_mcp_tool()
-def get_employee_laptop_info(
+async def get_employee_laptop_info(
     ctx: Context[Any, Any],
     dummy_parameter: str = "",
 ) -> str:
@@ -239,7 +240,7 @@ def get_employee_laptop_info(
 
     Examples:
         >>> # With AUTHORITATIVE_USER_ID header set to "alice.johnson@company.com"
-        >>> get_employee_laptop_info(ctx)
+        >>> await get_employee_laptop_info(ctx)
         # Returns laptop info for alice.johnson@company.com
     """
     try:
@@ -267,7 +268,7 @@ def get_employee_laptop_info(
             getattr(mcp, "laptop_avoid_duplicates"),
         )
 
-        laptop_info = client.get_employee_laptop_info(authoritative_user_id)
+        laptop_info = await client.get_employee_laptop_info(authoritative_user_id)
         if laptop_info:
             result = laptop_info
         else:
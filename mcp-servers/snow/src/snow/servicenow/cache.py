@@ -0,0 +1,115 @@
+"""
+TTL cache for read-only ServiceNow Table API responses.
+"""
+
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# (API key identity, endpoint, sorted query params)
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+def api_key_identity(api_key: str) -> str:
+    """Return a stable identity for an API key without keeping the key itself."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+class ResponseCache:
+    """
+    Size-bounded cache of ServiceNow GET responses that expire after a TTL.
+
+    Entries are keyed by API key identity, endpoint and query parameters, so
+    callers with different ServiceNow credentials never share results. Cached
+    responses are copied on read and write so callers cannot mutate them.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 1024) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a response stays cached. 0 or less disables caching.
+            max_entries: Maximum number of cached responses; the least recently
+                         used entry is evicted beyond this.
+        """
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        # key -> (response, expires_at monotonic time); least recently used first
+        self._entries: "OrderedDict[CacheKey, Tuple[Dict[str, Any], float]]" = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached at all."""
+        return self.ttl > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        identity: str, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> CacheKey:
+        """Build a cache key from the request identity, endpoint and params."""
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return identity, endpoint, items
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached response, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        response, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(response)
+
+    def set(self, key: CacheKey, response: Dict[str, Any]) -> None:
+        """Cache a response, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+        self._entries[key] = (copy.deepcopy(response), time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, identity: str, user_sys_id: str) -> int:
+        """
+        Drop cached responses whose query references the given user.
+
+        Args:
+            identity: API key identity the responses were cached under.
+            user_sys_id: The sys_id of the user whose data changed.
+
+        Returns:
+            Number of entries dropped.
+        """
+        if not user_sys_id:
+            return 0
+        stale = [
+            key
+            for key in self._entries
+            if key[0] == identity
+            and any(
+                name == "sysparm_query" and user_sys_id in value
+                for name, value in key[2]
+            )
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
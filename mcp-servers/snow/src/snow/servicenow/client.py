@@ -6,11 +6,12 @@ import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-import requests
+import httpx
 from shared_models import configure_logging
-from snow.servicenow.utils import _calculate_laptop_age
+from snow.servicenow.utils import _calculate_laptop_age, _parse_date
 
 from .auth import AuthManager
+from .cache import ResponseCache, api_key_identity
 from .models import (
     ApiKeyConfig,
     AuthConfig,
@@ -21,6 +22,67 @@ from .models import (
 
 logger = configure_logging("snow-mcp-server")
 
+# cmdb_ci_computer fields used for laptop info
+COMPUTER_FIELDS = "sys_id,name,asset_tag,serial_number,model_id,assigned_to,purchase_date,warranty_expiration,install_status,operational_status"
+# Dot-walked sys_user fields of the computer's assigned user
+ASSIGNED_USER_FIELDS = "assigned_to.sys_id,assigned_to.name,assigned_to.location"
+
+# Process-wide pooled HTTP client shared by all ServiceNowClient instances
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared ServiceNow HTTP client, creating it on first use.
+
+    A ServiceNowClient is built per tool call (the API token comes from the
+    request headers), so connections are pooled here instead: keep-alive
+    avoids a TCP/TLS handshake on every ServiceNow call.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=float(os.getenv("SERVICENOW_TIMEOUT", "30")),
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("SERVICENOW_HTTP_MAX_CONNECTIONS", "50")),
+                max_keepalive_connections=int(
+                    os.getenv("SERVICENOW_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+                ),
+                keepalive_expiry=float(
+                    os.getenv("SERVICENOW_HTTP_KEEPALIVE_EXPIRY", "30")
+                ),
+            ),
+        )
+    return _http_client
+
+
+# Process-wide cache of read-only Table API responses
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Return the shared ServiceNow response cache, creating it on first use.
+
+    Agents often re-check the same employee's laptop within one conversation,
+    and every lookup counts against the instance's rate limits.
+    """
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            ttl=float(os.getenv("SERVICENOW_CACHE_TTL", "60")),
+            max_entries=int(os.getenv("SERVICENOW_CACHE_MAX_ENTRIES", "1024")),
+        )
+    return _response_cache
+
+
+async def close_http_client() -> None:
+    """Close the shared ServiceNow HTTP client (called at server shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class ServiceNowClient:
     """
@@ -33,6 +95,8 @@ class ServiceNowClient:
         laptop_refresh_id: str | None = None,
         laptop_request_limits: int | None = None,
         laptop_avoid_duplicates: bool = False,
+        http_client: httpx.AsyncClient | None = None,
+        response_cache: ResponseCache | None = None,
     ) -> None:
         """
         Initialize the ServiceNow client with API token and laptop refresh ID.
@@ -46,6 +110,10 @@ class ServiceNowClient:
                                  If None, no limits are enforced. Defaults to None.
             laptop_avoid_duplicates: Whether to avoid creating duplicate laptop requests
                                    for the same laptop model. Defaults to False.
+            http_client: HTTP client to send requests with. Defaults to the shared
+                         pooled client from get_http_client().
+            response_cache: Cache for read-only GET responses. Defaults to the
+                            shared cache from get_response_cache().
 
         Raises:
             ValueError: If api_token or laptop_refresh_id is not provided.
@@ -60,6 +128,11 @@ class ServiceNowClient:
         self.laptop_avoid_duplicates = laptop_avoid_duplicates
         self.config = self._load_config(api_token=api_token)
         self.auth_manager = AuthManager(self.config.auth, self.config.instance_url)
+        self.http_client = http_client or get_http_client()
+        self.response_cache = (
+            response_cache if response_cache is not None else get_response_cache()
+        )
+        self.cache_identity = api_key_identity(api_token)
 
     def _load_config(self, api_token: str) -> ServerConfig:
         """
@@ -159,7 +232,7 @@ class ServiceNowClient:
             return True
         return False
 
-    def open_laptop_refresh_request(
+    async def open_laptop_refresh_request(
         self, params: OpenServiceNowLaptopRefreshRequestParams
     ) -> Dict[str, Any]:
         """
@@ -178,7 +251,9 @@ class ServiceNowClient:
         user_sys_id = params.who_is_this_request_for
         logger.info("Checking for existing open requests", user_sys_id=user_sys_id)
 
-        existing_requests_result = self.get_open_laptop_requests_for_user(user_sys_id)
+        existing_requests_result = await self.get_open_laptop_requests_for_user(
+            user_sys_id
+        )
         if not existing_requests_result["success"]:
             return existing_requests_result
 
@@ -246,7 +321,7 @@ class ServiceNowClient:
         logger.info("Request body", body=body)
 
         try:
-            response = requests.post(
+            response = await self.http_client.post(
                 url, headers=headers, json=body, timeout=self.config.timeout
             )
 
@@ -262,6 +337,11 @@ class ServiceNowClient:
             # Log the complete response for debugging
             logger.info("Full ServiceNow response", response=result)
 
+            # Cached open requests for this user are now stale
+            self.response_cache.invalidate_user(
+                self.cache_identity, params.who_is_this_request_for
+            )
+
             return {
                 "success": True,
                 "message": "Successfully opened laptop refresh request",
@@ -269,7 +349,7 @@ class ServiceNowClient:
                 "existing_ticket": False,
             }
 
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
             logger.error(
                 "Error opening laptop refresh request",
                 error=str(e),
@@ -281,29 +361,42 @@ class ServiceNowClient:
                 "data": None,
             }
 
-    def _get(
+    async def _get(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
     ) -> Optional[Dict[str, Any]]:
-        """Internal method for making GET requests to ServiceNow API."""
+        """
+        Internal method for making GET requests to ServiceNow API.
+
+        Successful responses are served from and stored in the response cache.
+        """
+        cache_key = self.response_cache.make_key(self.cache_identity, endpoint, params)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("ServiceNow response cache hit", endpoint=endpoint)
+            return cached
+
         full_url = f"{self.config.instance_url}{endpoint}"
         headers = self.auth_manager.get_headers()
         headers["Accept"] = "application/json"
 
         try:
-            response = requests.get(
+            response = await self.http_client.get(
                 full_url, headers=headers, params=params, timeout=self.config.timeout
             )
             response.raise_for_status()
             result = response.json()
-            return result if isinstance(result, dict) else None
+            if not isinstance(result, dict):
+                return None
+            self.response_cache.set(cache_key, result)
+            return result
 
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
             logger.error(
                 "ServiceNow API Error", error=str(e), error_type=type(e).__name__
             )
             return None
 
-    def get_user_by_email(self, email: str) -> Dict[str, Any]:
+    async def get_user_by_email(self, email: str) -> Dict[str, Any]:
         """
         Fetches a user record from ServiceNow by email.
 
@@ -325,7 +418,7 @@ class ServiceNowClient:
         }
 
         try:
-            data = self._get("/api/now/table/sys_user", params)
+            data = await self._get("/api/now/table/sys_user", params)
 
             if not data:
                 return {
@@ -359,7 +452,7 @@ class ServiceNowClient:
                 "message": f"Failed to get user by email: {str(e)}",
             }
 
-    def get_computer_by_user_sys_id(self, user_sys_id: str) -> Dict[str, Any]:
+    async def get_computer_by_user_sys_id(self, user_sys_id: str) -> Dict[str, Any]:
         """
         Fetches computer records assigned to a specific user sys_id.
 
@@ -376,11 +469,11 @@ class ServiceNowClient:
         params = {
             "sysparm_query": f"assigned_to={user_sys_id}",
             "sysparm_display_value": "true",
-            "sysparm_fields": "sys_id,name,asset_tag,serial_number,model_id,assigned_to,purchase_date,warranty_expiration,install_status,operational_status",
+            "sysparm_fields": COMPUTER_FIELDS,
         }
 
         try:
-            data = self._get("/api/now/table/cmdb_ci_computer", params)
+            data = await self._get("/api/now/table/cmdb_ci_computer", params)
 
             if not data:
                 return {
@@ -412,7 +505,67 @@ class ServiceNowClient:
             )
             return {"success": False, "message": f"Failed to get computers: {str(e)}"}
 
-    def get_employee_laptop_info(self, employee_identifier: str) -> str:
+    async def get_computers_by_user_email(self, email: str) -> Dict[str, Any]:
+        """
+        Fetches computer records assigned to the user with the given email.
+
+        Dot-walks ``assigned_to`` so each record also carries the assigned user's
+        sys_id, name and location, avoiding a separate sys_user lookup.
+
+        Args:
+            email: The email address of the assigned user.
+
+        Returns:
+            Dictionary containing the result of the operation with success, message, and computers data.
+        """
+        if not email:
+            return {"success": False, "message": "Email parameter is required"}
+
+        params = {
+            "sysparm_query": f"assigned_to.email={email}",
+            "sysparm_display_value": "true",
+            "sysparm_fields": f"{COMPUTER_FIELDS},{ASSIGNED_USER_FIELDS}",
+        }
+
+        try:
+            data = await self._get("/api/now/table/cmdb_ci_computer", params)
+
+            if not data:
+                return {
+                    "success": False,
+                    "message": "Failed to connect to ServiceNow API",
+                }
+
+            computers = data.get("result") or []
+            return {
+                "success": True,
+                "message": f"Found {len(computers)} computer(s) for user",
+                "computers": computers,
+            }
+
+        except Exception as e:
+            logger.error(
+                "Failed to get computers for user email",
+                email=email,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return {"success": False, "message": f"Failed to get computers: {str(e)}"}
+
+    @staticmethod
+    def _user_from_computer(computer: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build user data from a computer's dot-walked assigned_to fields."""
+        if not computer.get("assigned_to.sys_id") or not computer.get(
+            "assigned_to.name"
+        ):
+            return None
+        return {
+            "sys_id": computer["assigned_to.sys_id"],
+            "name": computer["assigned_to.name"],
+            "location": computer.get("assigned_to.location"),
+        }
+
+    async def get_employee_laptop_info(self, employee_identifier: str) -> str:
         """
         Orchestrates fetching user and their assigned computer details from ServiceNow.
 
@@ -427,25 +580,36 @@ class ServiceNowClient:
         if not employee_identifier:
             return "Error: Employee identifier is required"
 
-        # Step 1: Get user data (currently only supports email lookup)
-        user_result = self.get_user_by_email(employee_identifier)
-        if not user_result["success"]:
-            return f"Error: {user_result['message']}"
-
-        user_data = user_result["user"]
-
-        # Step 2: Get computer data
-        user_sys_id = user_data.get("sys_id")
-        if not user_sys_id:
-            return f"Error: User {user_data.get('name', 'Unknown')} has no sys_id in ServiceNow"
-
-        computers_result = self.get_computer_by_user_sys_id(user_sys_id)
-        if not computers_result["success"]:
-            return f"Error: {computers_result['message']}"
-
-        computers_data = computers_result["computers"]
-        if not computers_data:
-            return f"User {user_data.get('name')} found, but no laptops are assigned to them in ServiceNow."
+        # Step 1: Get computers together with their assigned user in one request
+        # by dot-walking assigned_to.email
+        user_data: Optional[Dict[str, Any]] = None
+        computers_data: List[Dict[str, Any]] = []
+        computers_result = await self.get_computers_by_user_email(employee_identifier)
+        if computers_result["success"] and computers_result["computers"]:
+            computers_data = computers_result["computers"]
+            user_data = self._user_from_computer(computers_data[0])
+
+        # Step 2: Fall back to separate user and computer lookups when no laptop
+        # was found (to tell "unknown user" from "no laptop") or the instance
+        # did not return the dot-walked user fields
+        if user_data is None:
+            user_result = await self.get_user_by_email(employee_identifier)
+            if not user_result["success"]:
+                return f"Error: {user_result['message']}"
+
+            user_data = user_result["user"]
+
+            user_sys_id = user_data.get("sys_id")
+            if not user_sys_id:
+                return f"Error: User {user_data.get('name', 'Unknown')} has no sys_id in ServiceNow"
+
+            computers_result = await self.get_computer_by_user_sys_id(user_sys_id)
+            if not computers_result["success"]:
+                return f"Error: {computers_result['message']}"
+
+            computers_data = computers_result["computers"]
+            if not computers_data:
+                return f"User {user_data.get('name')} found, but no laptops are assigned to them in ServiceNow."
 
         # Step 3: Format response using first laptop only (matching mock data format)
         try:
@@ -480,14 +644,9 @@ class ServiceNowClient:
             )
             normalized_purchase_date = purchase_date
             if purchase_date and purchase_date != "N/A":
-                # Try to normalize date format
-                for date_format in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"]:
-                    try:
-                        parsed_date = datetime.strptime(purchase_date, date_format)
-                        normalized_purchase_date = parsed_date.strftime("%Y-%m-%d")
-                        break
-                    except ValueError:
-                        continue
+                parsed_date = _parse_date(purchase_date, "purchase_date")
+                if parsed_date:
+                    normalized_purchase_date = parsed_date.strftime("%Y-%m-%d")
 
             # Calculate laptop age
             laptop_age = _calculate_laptop_age(normalized_purchase_date)
@@ -498,18 +657,12 @@ class ServiceNowClient:
             warranty_status = "Unknown"
 
             if warranty_expiry and warranty_expiry != "N/A":
-                # Try to normalize date format and calculate warranty status
-                for date_format in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"]:
-                    try:
-                        expiry_date = datetime.strptime(warranty_expiry, date_format)
-                        normalized_warranty_expiry = expiry_date.strftime("%Y-%m-%d")
-                        current_date = datetime.now()
-                        warranty_status = (
-                            "Active" if expiry_date > current_date else "Expired"
-                        )
-                        break
-                    except ValueError:
-                        continue
+                expiry_date = _parse_date(warranty_expiry, "warranty_expiration")
+                if expiry_date:
+                    normalized_warranty_expiry = expiry_date.strftime("%Y-%m-%d")
+                    warranty_status = (
+                        "Active" if expiry_date > datetime.now() else "Expired"
+                    )
 
             # Format output to match mock data format exactly
             laptop_info = f"""
@@ -533,7 +686,9 @@ class ServiceNowClient:
             )
             return f"Error: Failed to format laptop information - {str(e)}"
 
-    def get_open_laptop_requests_for_user(self, user_sys_id: str) -> Dict[str, Any]:
+    async def get_open_laptop_requests_for_user(
+        self, user_sys_id: str
+    ) -> Dict[str, Any]:
         """
         Fetches open laptop refresh requests for a specific user.
 
@@ -557,7 +712,7 @@ class ServiceNowClient:
         }
 
         try:
-            data = self._get("/api/now/table/sc_req_item", params)
+            data = await self._get("/api/now/table/sc_req_item", params)
 
             if not data:
                 return {
@@ -1,6 +1,83 @@
 """Utility functions for ServiceNow operations."""
 
+import calendar
+import re
 from datetime import datetime
+from typing import Callable, Dict, Optional
+
+# ServiceNow date formats, checked without raising on a mismatch
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_SLASH_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+
+
+def _make_date(year: int, month: int, day: int) -> Optional[datetime]:
+    """Build a datetime if year/month/day form a valid date, else None."""
+    if not 1 <= month <= 12 or not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return datetime(year, month, day)
+
+
+def _parse_iso_date(value: str) -> Optional[datetime]:
+    """Parse YYYY-MM-DD."""
+    match = _ISO_DATE_RE.fullmatch(value)
+    if not match:
+        return None
+    year, month, day = (int(part) for part in match.groups())
+    return _make_date(year, month, day)
+
+
+def _parse_slash_date(value: str) -> Optional[datetime]:
+    """Parse MM/DD/YYYY, falling back to DD/MM/YYYY when that is not a valid date."""
+    match = _SLASH_DATE_RE.fullmatch(value)
+    if not match:
+        return None
+    first, second, year = (int(part) for part in match.groups())
+    return _make_date(year, first, second) or _make_date(year, second, first)
+
+
+_DATE_PARSERS: Dict[str, Callable[[str], Optional[datetime]]] = {
+    "iso": _parse_iso_date,
+    "slash": _parse_slash_date,
+}
+
+# Format last detected per record field, tried first on the next value
+_detected_date_formats: Dict[str, str] = {}
+
+
+def _parse_date(value: str, field: Optional[str] = None) -> Optional[datetime]:
+    """Parse a ServiceNow date in YYYY-MM-DD, MM/DD/YYYY or DD/MM/YYYY format.
+
+    Formats are matched with precompiled regexes instead of trying strptime
+    and catching ValueError for each miss. The format detected for ``field``
+    is remembered and tried first for later values of the same field, since
+    an instance returns every record's dates in the same format.
+
+    Args:
+        value: The date string to parse
+        field: Record field the value came from, used to remember its format
+
+    Returns:
+        The parsed datetime, or None if the value is not a supported date
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    preferred = _detected_date_formats.get(field) if field else None
+    if preferred:
+        parsed = _DATE_PARSERS[preferred](value)
+        if parsed:
+            return parsed
+
+    for name, parser in _DATE_PARSERS.items():
+        if name == preferred:
+            continue
+        parsed = parser(value)
+        if parsed:
+            if field:
+                _detected_date_formats[field] = name
+            return parsed
+    return None
 
 
 def _calculate_laptop_age(purchase_date_str: str) -> str:
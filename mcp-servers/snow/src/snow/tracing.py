@@ -1,7 +1,9 @@
 """Tracing utilities for MCP tools."""
 
 import functools
-from typing import Any, Callable, TypeVar, cast
+import inspect
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar, cast
 
 from opentelemetry import context, trace
 from opentelemetry.propagate import extract
@@ -92,12 +94,62 @@ def _extract_context_from_request(args: tuple[Any, ...], kwargs: dict[str, Any])
     return context.get_current()
 
 
+@contextmanager
+def _tool_span(
+    span_name: str,
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Iterator[Any]:
+    """Start a span for an MCP tool call, parented on the request's trace context."""
+    # Extract tracing context from incoming request headers
+    parent_context = _extract_context_from_request(args, kwargs)
+
+    # Get the tracer
+    tracer = trace.get_tracer(__name__)
+
+    logger.debug("Starting span", span_name=span_name, context=str(parent_context))
+
+    # Start a new span for this tool call with the extracted parent context
+    with tracer.start_as_current_span(span_name, context=parent_context) as span:
+        logger.debug(
+            "Created span",
+            trace_id=span.get_span_context().trace_id,
+            span_id=span.get_span_context().span_id,
+        )
+        try:
+            # Add tool metadata as span attributes
+            span.set_attribute("mcp.tool.name", func.__name__)
+
+            # Add function parameters as attributes (excluding sensitive data)
+            for i, arg in enumerate(args):
+                # Skip Context objects and other non-primitive types
+                if not isinstance(arg, (str, int, float, bool)):
+                    continue
+                span.set_attribute(f"mcp.tool.arg.{i}", str(arg))
+
+            for key, value in kwargs.items():
+                # Skip Context objects and other non-primitive types
+                if not isinstance(value, (str, int, float, bool)):
+                    continue
+                span.set_attribute(f"mcp.tool.param.{key}", str(value))
+
+            yield span
+
+        except Exception as e:
+            # Record the exception and set error status
+            span.record_exception(e)
+            span.set_status(Status(StatusCode.ERROR, str(e)))
+            raise
+
+
 def trace_mcp_tool(tool_name: str | None = None) -> Callable[[F], F]:
     """Decorator to trace MCP tool calls with OpenTelemetry.
 
     This decorator creates a span for each MCP tool call and ensures that
     the tracing context is propagated to child operations like HTTP requests
-    made by HTTPXClientInstrumentor.
+    made by HTTPXClientInstrumentor. Both sync and async tool functions
+    are supported.
 
     Args:
         tool_name: Optional name for the tool. If not provided, uses the function name.
@@ -107,72 +159,44 @@ def trace_mcp_tool(tool_name: str | None = None) -> Callable[[F], F]:
 
     Example:
         @trace_mcp_tool()
-        def my_tool(param1: str, param2: int) -> str:
+        async def my_tool(param1: str, param2: int) -> str:
             # Tool implementation
             return "result"
     """
 
     def decorator(func: F) -> F:
-        @functools.wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Skip tracing if not active
-            if not tracingIsActive():
-                return func(*args, **kwargs)
-
-            # Extract tracing context from incoming request headers
-            parent_context = _extract_context_from_request(args, kwargs)
+        # Use provided tool name or function name
+        span_name = tool_name or f"mcp.tool.{func.__name__}"
 
-            # Get the tracer
-            tracer = trace.get_tracer(__name__)
+        if inspect.iscoroutinefunction(func):
 
-            # Use provided tool name or function name
-            span_name = tool_name or f"mcp.tool.{func.__name__}"
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                # Skip tracing if not active
+                if not tracingIsActive():
+                    return await func(*args, **kwargs)
 
-            logger.debug(
-                "Starting span", span_name=span_name, context=str(parent_context)
-            )
-
-            # Start a new span for this tool call with the extracted parent context
-            with tracer.start_as_current_span(
-                span_name, context=parent_context
-            ) as span:
-                logger.debug(
-                    "Created span",
-                    trace_id=span.get_span_context().trace_id,
-                    span_id=span.get_span_context().span_id,
-                )
-                try:
-                    # Add tool metadata as span attributes
-                    span.set_attribute("mcp.tool.name", func.__name__)
-
-                    # Add function parameters as attributes (excluding sensitive data)
-                    for i, arg in enumerate(args):
-                        # Skip Context objects and other non-primitive types
-                        if not isinstance(arg, (str, int, float, bool)):
-                            continue
-                        span.set_attribute(f"mcp.tool.arg.{i}", str(arg))
-
-                    for key, value in kwargs.items():
-                        # Skip Context objects and other non-primitive types
-                        if not isinstance(value, (str, int, float, bool)):
-                            continue
-                        span.set_attribute(f"mcp.tool.param.{key}", str(value))
-
-                    # Execute the tool function
+                with _tool_span(span_name, func, args, kwargs) as span:
                     # The span context will automatically propagate to any
-                    # instrumented HTTP calls made within this function
-                    result = func(*args, **kwargs)
-
-                    # Mark span as successful
+                    # instrumented HTTP calls awaited within this function
+                    result = await func(*args, **kwargs)
                     span.set_status(Status(StatusCode.OK))
-
                     return result
 
-                except Exception as e:
-                    # Record the exception and set error status
-                    span.record_exception(e)
-                    span.set_status(Status(StatusCode.ERROR, str(e)))
-                    raise
+            return cast(F, async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Skip tracing if not active
+            if not tracingIsActive():
+                return func(*args, **kwargs)
+
+            with _tool_span(span_name, func, args, kwargs) as span:
+                # The span context will automatically propagate to any
+                # instrumented HTTP calls made within this function
+                result = func(*args, **kwargs)
+                span.set_status(Status(StatusCode.OK))
+                return result
 
         return cast(F, wrapper)
 
@@ -1,13 +1,23 @@
 """Tests for Snow Server MCP server."""
 
 from typing import Any, Dict, List
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import httpx
+import pytest
 
 from snow.server import get_employee_laptop_info, open_laptop_refresh_ticket
-from snow.servicenow.client import ServiceNowClient
+from snow.servicenow.cache import ResponseCache
+from snow.servicenow.client import ServiceNowClient, get_response_cache
 from snow.servicenow.models import OpenServiceNowLaptopRefreshRequestParams
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache() -> None:
+    """Keep cached ServiceNow responses from leaking between tests."""
+    get_response_cache().clear()
+
+
 class MockRequest:
     """Mock request object with headers."""
 
@@ -31,7 +41,7 @@ class MockContext:
 
 @patch("snow.server.mcp")
 @patch("snow.server.ServiceNowClient")
-def test_open_laptop_refresh_ticket_success(
+async def test_open_laptop_refresh_ticket_success(
     mock_servicenow_client: Mock, mock_mcp: Mock
 ) -> None:
     """Test successful ticket creation."""
@@ -45,7 +55,7 @@ def test_open_laptop_refresh_ticket_success(
     mock_mcp.laptop_avoid_duplicates = False
 
     # Mock ServiceNow client responses
-    mock_client_instance = MagicMock()
+    mock_client_instance = AsyncMock()
     mock_servicenow_client.return_value = mock_client_instance
 
     # Mock user lookup response
@@ -63,7 +73,7 @@ def test_open_laptop_refresh_ticket_success(
     # Create mock context with AUTHORITATIVE_USER_ID header
     ctx = MockContext({"AUTHORITATIVE_USER_ID": "alice.johnson@company.com"})
 
-    result = open_laptop_refresh_ticket(
+    result = await open_laptop_refresh_ticket(
         employee_name=employee_name,
         business_justification=business_justification,
         servicenow_laptop_code=servicenow_laptop_code,
@@ -79,7 +89,7 @@ def test_open_laptop_refresh_ticket_success(
 
 @patch("snow.server.mcp")
 @patch("snow.server.ServiceNowClient")
-def test_open_laptop_refresh_ticket_required_model(
+async def test_open_laptop_refresh_ticket_required_model(
     mock_servicenow_client: Mock,
     mock_mcp: Mock,
 ) -> None:
@@ -94,7 +104,7 @@ def test_open_laptop_refresh_ticket_required_model(
     mock_mcp.laptop_avoid_duplicates = False
 
     # Mock ServiceNow client responses
-    mock_client_instance = MagicMock()
+    mock_client_instance = AsyncMock()
     mock_servicenow_client.return_value = mock_client_instance
 
     # Mock user lookup response
@@ -112,7 +122,7 @@ def test_open_laptop_refresh_ticket_required_model(
     # Create mock context with AUTHORITATIVE_USER_ID header
     ctx = MockContext({"AUTHORITATIVE_USER_ID": "alice.johnson@company.com"})
 
-    result = open_laptop_refresh_ticket(
+    result = await open_laptop_refresh_ticket(
         employee_name=employee_name,
         business_justification=business_justification,
         servicenow_laptop_code=servicenow_laptop_code,
@@ -126,10 +136,10 @@ def test_open_laptop_refresh_ticket_required_model(
     assert "REQ" in result  # Ticket number format
 
 
-def test_open_laptop_refresh_ticket_empty_employee_name() -> None:
+async def test_open_laptop_refresh_ticket_empty_employee_name() -> None:
     """Test error handling for empty employee name."""
     ctx = MockContext({"AUTHORITATIVE_USER_ID": "alice.johnson@company.com"})
-    result = open_laptop_refresh_ticket(
+    result = await open_laptop_refresh_ticket(
         employee_name="",
         business_justification="Need new laptop",
         servicenow_laptop_code="apple_mac_book_air_m_3",
@@ -141,10 +151,10 @@ def test_open_laptop_refresh_ticket_empty_employee_name() -> None:
     )
 
 
-def test_open_laptop_refresh_ticket_empty_justification() -> None:
+async def test_open_laptop_refresh_ticket_empty_justification() -> None:
     """Test error handling for empty business justification."""
     ctx = MockContext({"AUTHORITATIVE_USER_ID": "alice.johnson@company.com"})
-    result = open_laptop_refresh_ticket(
+    result = await open_laptop_refresh_ticket(
         employee_name="John Doe",
         business_justification="",
         servicenow_laptop_code="apple_mac_book_air_m_3",
@@ -156,10 +166,10 @@ def test_open_laptop_refresh_ticket_empty_justification() -> None:
     )
 
 
-def test_open_laptop_refresh_ticket_empty_servicenow_code() -> None:
+async def test_open_laptop_refresh_ticket_empty_servicenow_code() -> None:
     """Test error handling for empty ServiceNow laptop code."""
     ctx = MockContext({"AUTHORITATIVE_USER_ID": "alice.johnson@company.com"})
-    result = open_laptop_refresh_ticket(
+    result = await open_laptop_refresh_ticket(
         employee_name="John Doe",
         business_justification="Need new laptop",
         servicenow_laptop_code="",
@@ -173,7 +183,7 @@ def test_open_laptop_refresh_ticket_empty_servicenow_code() -> None:
 
 @patch("snow.server.mcp")
 @patch("snow.server.ServiceNowClient")
-def test_get_employee_laptop_info_success(
+async def test_get_employee_laptop_info_success(
     mock_servicenow_client: Mock, mock_mcp: Mock
 ) -> None:
     """Test successful laptop info retrieval."""
@@ -183,7 +193,7 @@ def test_get_employee_laptop_info_success(
     mock_mcp.laptop_avoid_duplicates = False
 
     # Mock ServiceNow client responses
-    mock_client_instance = MagicMock()
+    mock_client_instance = AsyncMock()
     mock_servicenow_client.return_value = mock_client_instance
 
     # Mock laptop info response
@@ -203,7 +213,7 @@ def test_get_employee_laptop_info_success(
     # Create mock context with AUTHORITATIVE_USER_ID header
     ctx = MockContext({"AUTHORITATIVE_USER_ID": "alice.johnson@company.com"})
 
-    result = get_employee_laptop_info(ctx=ctx)
+    result = await get_employee_laptop_info(ctx=ctx)
 
     # Check that result contains expected information
     assert "Alice Johnson" in result
@@ -212,7 +222,7 @@ def test_get_employee_laptop_info_success(
     assert "DL7420001" in result
 
     # Verify the ServiceNow client was called with the correct user ID
-    mock_client_instance.get_employee_laptop_info.assert_called_once_with(
+    mock_client_instance.get_employee_laptop_info.assert_awaited_once_with(
         "alice.johnson@company.com"
     )
 
@@ -220,11 +230,12 @@ def test_get_employee_laptop_info_success(
 # Tests for open_laptop_refresh_request function
 
 
-@patch("snow.servicenow.client.requests.post")
-def test_open_laptop_refresh_request_same_laptop_existing_request(
-    mock_post: Mock,
-) -> None:
+async def test_open_laptop_refresh_request_same_laptop_existing_request() -> None:
     """Test returning existing ticket when same laptop model request already exists."""
+    # Mock the shared HTTP client
+    mock_post = AsyncMock()
+    http_client = MagicMock(spec=httpx.AsyncClient, post=mock_post)
+
     # Setup test data
     api_token = "test_token"
     laptop_refresh_id = "test_refresh_id"
@@ -252,6 +263,7 @@ def test_open_laptop_refresh_request_same_laptop_existing_request(
         laptop_refresh_id=laptop_refresh_id,
         laptop_request_limits=laptop_request_limits,
         laptop_avoid_duplicates=True,
+        http_client=http_client,
     )
 
     # Mock get_open_laptop_requests_for_user to return existing requests
@@ -262,7 +274,7 @@ def test_open_laptop_refresh_request_same_laptop_existing_request(
         }
 
         # Call the function
-        result = client.open_laptop_refresh_request(params)
+        result = await client.open_laptop_refresh_request(params)
 
         # Assertions
         assert result["success"] is True
@@ -280,11 +292,12 @@ def test_open_laptop_refresh_request_same_laptop_existing_request(
         mock_get_requests.assert_called_once_with("user123")
 
 
-@patch("snow.servicenow.client.requests.post")
-def test_open_laptop_refresh_request_exceeds_limit(
-    mock_post: Mock,
-) -> None:
+async def test_open_laptop_refresh_request_exceeds_limit() -> None:
     """Test error when adding new request would exceed the laptop request limit."""
+    # Mock the shared HTTP client
+    mock_post = AsyncMock()
+    http_client = MagicMock(spec=httpx.AsyncClient, post=mock_post)
+
     # Setup test data
     api_token = "test_token"
     laptop_refresh_id = "test_refresh_id"
@@ -318,6 +331,7 @@ def test_open_laptop_refresh_request_exceeds_limit(
         laptop_refresh_id=laptop_refresh_id,
         laptop_request_limits=laptop_request_limits,
         laptop_avoid_duplicates=False,
+        http_client=http_client,
     )
 
     # Mock get_open_laptop_requests_for_user to return existing requests
@@ -328,7 +342,7 @@ def test_open_laptop_refresh_request_exceeds_limit(
         }
 
         # Call the function
-        result = client.open_laptop_refresh_request(params)
+        result = await client.open_laptop_refresh_request(params)
 
         # Assertions
         assert result["success"] is False
@@ -347,11 +361,12 @@ def test_open_laptop_refresh_request_exceeds_limit(
         mock_get_requests.assert_called_once_with("user123")
 
 
-@patch("snow.servicenow.client.requests.post")
-def test_open_laptop_refresh_request_within_limits_creates_new_ticket(
-    mock_post: Mock,
-) -> None:
+async def test_open_laptop_refresh_request_within_limits_creates_new_ticket() -> None:
     """Test creating new ticket when different laptop requested and within limits."""
+    # Mock the shared HTTP client
+    mock_post = AsyncMock()
+    http_client = MagicMock(spec=httpx.AsyncClient, post=mock_post)
+
     # Setup test data
     api_token = "test_token"
     laptop_refresh_id = "test_refresh_id"
@@ -387,6 +402,7 @@ def test_open_laptop_refresh_request_within_limits_creates_new_ticket(
         laptop_refresh_id=laptop_refresh_id,
         laptop_request_limits=laptop_request_limits,
         laptop_avoid_duplicates=False,
+        http_client=http_client,
     )
 
     # Mock get_open_laptop_requests_for_user to return existing requests
@@ -397,7 +413,7 @@ def test_open_laptop_refresh_request_within_limits_creates_new_ticket(
         }
 
         # Call the function
-        result = client.open_laptop_refresh_request(params)
+        result = await client.open_laptop_refresh_request(params)
 
         # Assertions
         assert result["success"] is True
@@ -429,11 +445,12 @@ def test_open_laptop_refresh_request_within_limits_creates_new_ticket(
         mock_get_requests.assert_called_once_with("user123")
 
 
-@patch("snow.servicenow.client.requests.post")
-def test_open_laptop_refresh_request_no_existing_requests(
-    mock_post: Mock,
-) -> None:
+async def test_open_laptop_refresh_request_no_existing_requests() -> None:
     """Test creating ticket when user has no existing requests."""
+    # Mock the shared HTTP client
+    mock_post = AsyncMock()
+    http_client = MagicMock(spec=httpx.AsyncClient, post=mock_post)
+
     # Setup test data
     api_token = "test_token"
     laptop_refresh_id = "test_refresh_id"
@@ -462,6 +479,7 @@ def test_open_laptop_refresh_request_no_existing_requests(
         laptop_refresh_id=laptop_refresh_id,
         laptop_request_limits=laptop_request_limits,
         laptop_avoid_duplicates=False,
+        http_client=http_client,
     )
 
     # Mock get_open_laptop_requests_for_user to return no existing requests
@@ -472,7 +490,7 @@ def test_open_laptop_refresh_request_no_existing_requests(
         }
 
         # Call the function
-        result = client.open_laptop_refresh_request(params)
+        result = await client.open_laptop_refresh_request(params)
 
         # Assertions
         assert result["success"] is True
@@ -504,11 +522,12 @@ def test_open_laptop_refresh_request_no_existing_requests(
         mock_get_requests.assert_called_once_with("user123")
 
 
-@patch("snow.servicenow.client.requests.post")
-def test_open_laptop_refresh_request_get_existing_requests_failure(
-    mock_post: Mock,
-) -> None:
+async def test_open_laptop_refresh_request_get_existing_requests_failure() -> None:
     """Test error handling when get_open_laptop_requests_for_user fails."""
+    # Mock the shared HTTP client
+    mock_post = AsyncMock()
+    http_client = MagicMock(spec=httpx.AsyncClient, post=mock_post)
+
     # Setup test data
     api_token = "test_token"
     laptop_refresh_id = "test_refresh_id"
@@ -526,6 +545,7 @@ def test_open_laptop_refresh_request_get_existing_requests_failure(
         laptop_refresh_id=laptop_refresh_id,
         laptop_request_limits=laptop_request_limits,
         laptop_avoid_duplicates=False,
+        http_client=http_client,
     )
 
     # Mock get_open_laptop_requests_for_user to return failure
@@ -536,7 +556,7 @@ def test_open_laptop_refresh_request_get_existing_requests_failure(
         }
 
         # Call the function
-        result = client.open_laptop_refresh_request(params)
+        result = await client.open_laptop_refresh_request(params)
 
         # Assertions
         assert result["success"] is False
@@ -549,12 +569,11 @@ def test_open_laptop_refresh_request_get_existing_requests_failure(
         mock_get_requests.assert_called_once_with("user123")
 
 
-@patch("snow.servicenow.client.requests.post")
-def test_open_laptop_refresh_request_api_failure(
-    mock_post: Mock,
-) -> None:
+async def test_open_laptop_refresh_request_api_failure() -> None:
     """Test error handling when ServiceNow API request fails."""
-    import requests
+    # Mock the shared HTTP client
+    mock_post = AsyncMock()
+    http_client = MagicMock(spec=httpx.AsyncClient, post=mock_post)
 
     # Setup test data
     api_token = "test_token"
@@ -571,7 +590,7 @@ def test_open_laptop_refresh_request_api_failure(
     existing_requests: List[Dict[str, Any]] = []
 
     # Mock API request failure
-    mock_post.side_effect = requests.exceptions.RequestException("Connection error")
+    mock_post.side_effect = httpx.ConnectError("Connection error")
 
     # Create ServiceNowClient instance
     client = ServiceNowClient(
@@ -579,6 +598,7 @@ def test_open_laptop_refresh_request_api_failure(
         laptop_refresh_id=laptop_refresh_id,
         laptop_request_limits=laptop_request_limits,
         laptop_avoid_duplicates=False,
+        http_client=http_client,
     )
 
     # Mock get_open_laptop_requests_for_user to return no existing requests
@@ -589,7 +609,7 @@ def test_open_laptop_refresh_request_api_failure(
         }
 
         # Call the function
-        result = client.open_laptop_refresh_request(params)
+        result = await client.open_laptop_refresh_request(params)
 
         # Assertions
         assert result["success"] is False
@@ -604,11 +624,12 @@ def test_open_laptop_refresh_request_api_failure(
         mock_get_requests.assert_called_once_with("user123")
 
 
-@patch("snow.servicenow.client.requests.post")
-def test_open_laptop_refresh_request_duplicate_avoidance_disabled(
-    mock_post: Mock,
-) -> None:
+async def test_open_laptop_refresh_request_duplicate_avoidance_disabled() -> None:
     """Test creating new ticket when same laptop model request exists but duplicate avoidance is disabled."""
+    # Mock the shared HTTP client
+    mock_post = AsyncMock()
+    http_client = MagicMock(spec=httpx.AsyncClient, post=mock_post)
+
     # Setup test data
     api_token = "test_token"
     laptop_refresh_id = "test_refresh_id"
@@ -644,6 +665,7 @@ def test_open_laptop_refresh_request_duplicate_avoidance_disabled(
         laptop_refresh_id=laptop_refresh_id,
         laptop_request_limits=laptop_request_limits,
         laptop_avoid_duplicates=False,
+        http_client=http_client,
     )
 
     # Mock get_open_laptop_requests_for_user to return existing requests
@@ -654,7 +676,7 @@ def test_open_laptop_refresh_request_duplicate_avoidance_disabled(
         }
 
         # Call the function
-        result = client.open_laptop_refresh_request(params)
+        result = await client.open_laptop_refresh_request(params)
 
         # Assertions - should create new ticket despite duplicate
         assert result["success"] is True
@@ -684,3 +706,228 @@ def test_open_laptop_refresh_request_duplicate_avoidance_disabled(
 
         # Verify get_open_laptop_requests_for_user was called
         mock_get_requests.assert_called_once_with("user123")
+
+
+async def test_clients_share_pooled_http_client() -> None:
+    """ServiceNowClient instances reuse one pooled HTTP client until it is closed."""
+    from snow.servicenow.client import close_http_client, get_http_client
+
+    first = ServiceNowClient(api_token="token_a", laptop_refresh_id="refresh_id")
+    second = ServiceNowClient(api_token="token_b", laptop_refresh_id="refresh_id")
+    try:
+        assert first.http_client is second.http_client
+        assert first.http_client is get_http_client()
+    finally:
+        await close_http_client()
+
+    assert get_http_client() is not first.http_client
+    await close_http_client()
+
+
+async def test_get_user_by_email_over_http() -> None:
+    """GETs send the API key header and parse the Table API result."""
+    seen_requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_requests.append(request)
+        return httpx.Response(
+            200, json={"result": [{"sys_id": "1001", "email": "a@example.com"}]}
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = ServiceNowClient(
+            api_token="test_token",
+            laptop_refresh_id="refresh_id",
+            http_client=http,
+        )
+        result = await client.get_user_by_email("a@example.com")
+
+    assert result["success"] is True
+    assert result["user"]["sys_id"] == "1001"
+    assert seen_requests[0].url.path == "/api/now/table/sys_user"
+    assert seen_requests[0].headers["x-sn-apikey"] == "test_token"
+
+
+async def test_non_json_response_is_handled() -> None:
+    """A non-JSON body (e.g. an HTML error page) is reported, not raised."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text="<html>maintenance</html>")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = ServiceNowClient(
+            api_token="test_token",
+            laptop_refresh_id="refresh_id",
+            http_client=http,
+        )
+        user_result = await client.get_user_by_email("a@example.com")
+        request_result = await client.open_laptop_refresh_request(
+            OpenServiceNowLaptopRefreshRequestParams(
+                who_is_this_request_for="1001", laptop_choices="apple_mac_book_pro_14"
+            )
+        )
+
+    assert user_result["success"] is False
+    assert request_result["success"] is False
+
+
+async def test_get_employee_laptop_info_single_request() -> None:
+    """Laptop info comes from one dot-walked cmdb_ci_computer query."""
+    seen_requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "result": [
+                    {
+                        "sys_id": "2001",
+                        "name": "Alice's Laptop",
+                        "serial_number": "DL7420001",
+                        "model_id": "Dell Latitude 7420",
+                        "purchase_date": "2022-05-01",
+                        "warranty_expiration": "2025-05-01",
+                        "assigned_to.sys_id": "1001",
+                        "assigned_to.name": "Alice Johnson",
+                        "assigned_to.location": "EMEA",
+                    }
+                ]
+            },
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = ServiceNowClient(
+            api_token="test_token",
+            laptop_refresh_id="refresh_id",
+            http_client=http,
+        )
+        result = await client.get_employee_laptop_info("alice@example.com")
+
+    assert len(seen_requests) == 1
+    assert seen_requests[0].url.path == "/api/now/table/cmdb_ci_computer"
+    assert (
+        seen_requests[0].url.params["sysparm_query"]
+        == "assigned_to.email=alice@example.com"
+    )
+    assert "Alice Johnson" in result
+    assert "EMEA" in result
+    assert "DL7420001" in result
+
+
+async def test_get_employee_laptop_info_no_laptop_falls_back() -> None:
+    """Without laptops the user is looked up to report why."""
+    paths: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/api/now/table/sys_user":
+            return httpx.Response(
+                200, json={"result": [{"sys_id": "1001", "name": "Alice Johnson"}]}
+            )
+        return httpx.Response(200, json={"result": []})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = ServiceNowClient(
+            api_token="test_token",
+            laptop_refresh_id="refresh_id",
+            http_client=http,
+        )
+        result = await client.get_employee_laptop_info("alice@example.com")
+
+    assert paths == [
+        "/api/now/table/cmdb_ci_computer",
+        "/api/now/table/sys_user",
+        "/api/now/table/cmdb_ci_computer",
+    ]
+    assert result == (
+        "User Alice Johnson found, but no laptops are assigned to them in ServiceNow."
+    )
+
+
+async def test_get_responses_are_cached_per_api_key() -> None:
+    """Repeated GETs are served from the cache, separately for each API key."""
+    seen_requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_requests.append(request)
+        return httpx.Response(
+            200, json={"result": [{"sys_id": "1001", "name": "Alice Johnson"}]}
+        )
+
+    cache = ResponseCache(ttl=60)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        clients = [
+            ServiceNowClient(
+                api_token=token,
+                laptop_refresh_id="refresh_id",
+                http_client=http,
+                response_cache=cache,
+            )
+            for token in ("token_a", "token_a", "token_b")
+        ]
+        results = [await c.get_user_by_email("a@example.com") for c in clients]
+
+        # Callers get copies, so mutating a result does not poison the cache
+        results[0]["user"]["sys_id"] = "changed"
+        again = await clients[0].get_user_by_email("a@example.com")
+
+    assert [r["user"]["sys_id"] for r in results[1:]] == ["1001", "1001"]
+    assert again["user"]["sys_id"] == "1001"
+    assert len(seen_requests) == 2
+    assert cache.hits == 2
+
+
+async def test_open_laptop_refresh_request_invalidates_user_cache() -> None:
+    """A successful order drops cached open requests for that user only."""
+    requests_by_user: Dict[str, List[Dict[str, Any]]] = {"user123": [], "other": []}
+    get_paths: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            requests_by_user["user123"].append({"number": "RITM0001"})
+            return httpx.Response(200, json={"result": {"number": "REQ0001"}})
+        get_paths.append(request.url.params["sysparm_query"])
+        user = request.url.params["sysparm_query"].split("^")[0].split("=")[1]
+        return httpx.Response(200, json={"result": requests_by_user[user]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = ServiceNowClient(
+            api_token="test_token",
+            laptop_refresh_id="refresh_id",
+            http_client=http,
+            response_cache=ResponseCache(ttl=60),
+        )
+        await client.get_open_laptop_requests_for_user("other")
+        result = await client.open_laptop_refresh_request(
+            OpenServiceNowLaptopRefreshRequestParams(
+                who_is_this_request_for="user123",
+                laptop_choices="apple_mac_book_pro_14_m_3_pro",
+            )
+        )
+        assert result["success"] is True
+        after = await client.get_open_laptop_requests_for_user("user123")
+        await client.get_open_laptop_requests_for_user("other")
+
+    assert after["requests"] == [{"number": "RITM0001"}]
+    # user123 was fetched again after the order; "other" stayed cached
+    assert len(get_paths) == 3
+
+
+def test_parse_date_formats() -> None:
+    """ServiceNow dates parse like the MM/DD-before-DD/MM strptime fallbacks."""
+    from datetime import datetime
+
+    from snow.servicenow.utils import _detected_date_formats, _parse_date
+
+    assert _parse_date("2022-05-01") == datetime(2022, 5, 1)
+    assert _parse_date("05/06/2022") == datetime(2022, 5, 6)
+    assert _parse_date("25/06/2022") == datetime(2022, 6, 25)
+    assert _parse_date("2022-02-30") is None
+    assert _parse_date("13/13/2022") is None
+    assert _parse_date("not a date") is None
+
+    _parse_date("01/31/2024", "test_field")
+    assert _detected_date_formats["test_field"] == "slash"
+    assert _parse_date("2024-01-31", "test_field") == datetime(2024, 1, 31)
+    assert _detected_date_formats["test_field"] == "iso"
@@ -1,9 +1,14 @@
 """Mock employee data for testing purposes."""
 
+import hashlib
 import os
 import random
 from datetime import datetime, timedelta
-from typing import Any, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+EmployeeData = Mapping[str, Mapping[str, Any]]
 
 MOCK_EMPLOYEE_DATA = {
     "alice.johnson@company.com": {
@@ -261,9 +266,13 @@ MOCK_EMPLOYEE_DATA = {
 }
 
 
+@lru_cache(maxsize=None)
 def _generate_user_data_for_email(email: str, employee_id: int) -> Dict[str, Any]:
     """Generate user data for a TEST_USERS email.
 
+    Random values are seeded from a hash of the email, so the same email
+    always gets the same laptop dates and the result can be memoized.
+
     Args:
         email: Email address to generate data for
         employee_id: Unique employee ID to use
@@ -284,8 +293,9 @@ def _generate_user_data_for_email(email: str, employee_id: int) -> Dict[str, Any
     model_id = "macbook_pro_16"
 
     # Generate dates
+    rng = random.Random(hashlib.sha256(email.lower().encode()).digest())
     purchase_date_obj = datetime.now() - timedelta(
-        days=random.randint(365, 1095)
+        days=rng.randint(365, 1095)
     )  # 1-3 years ago
     purchase_date = purchase_date_obj.strftime("%Y-%m-%d")
     warranty_expiry_obj = purchase_date_obj + timedelta(days=1095)  # 3 years warranty
@@ -316,26 +326,36 @@ def _generate_user_data_for_email(email: str, employee_id: int) -> Dict[str, Any
     }
 
 
-def get_employee_data() -> Dict[str, Dict[str, Any]]:
+def get_employee_data() -> EmployeeData:
     """Get employee data, optionally augmented with TEST_USERS.
 
+    The merged data is built once per TEST_USERS value and shared, so the
+    returned mapping and its records are read-only.
+
     Returns:
-        Dictionary of employee data, possibly extended with TEST_USERS
+        Read-only mapping of employee data, possibly extended with TEST_USERS
     """
+    return _build_employee_data(os.getenv("TEST_USERS", ""))
+
+
+@lru_cache(maxsize=8)
+def _build_employee_data(test_users_env: str) -> EmployeeData:
     # Start with base mock data
-    result = MOCK_EMPLOYEE_DATA.copy()
+    result: Dict[str, Mapping[str, Any]] = {
+        email: MappingProxyType(dict(data))
+        for email, data in MOCK_EMPLOYEE_DATA.items()
+    }
 
     # Check for TEST_USERS environment variable
-    test_users_env = os.getenv("TEST_USERS")
     if not test_users_env:
-        return result
+        return MappingProxyType(result)
 
     # Parse comma-separated emails
     test_emails = [
         email.strip() for email in test_users_env.split(",") if email.strip()
     ]
     if not test_emails:
-        return result
+        return MappingProxyType(result)
 
     # Generate data for TEST_USERS emails
     for idx, email in enumerate(test_emails):
@@ -346,6 +366,6 @@ def get_employee_data() -> Dict[str, Dict[str, Any]]:
         # Generate unique employee_id starting from 9001
         employee_id = 9001 + idx
         user_data = _generate_user_data_for_email(email, employee_id)
-        result[email.lower()] = user_data
+        result[email.lower()] = MappingProxyType(user_data)
 
-    return result
+    return MappingProxyType(result)
@@ -4,7 +4,9 @@
 import os
 import sys
 
+import pytest
 from mock_employee_data import MOCK_EMPLOYEE_DATA, get_employee_data
+from mock_employee_data.data import _generate_user_data_for_email
 
 # Add the mock-employee-data package to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -93,6 +95,31 @@ def test_existing_user_not_duplicated() -> None:
     assert "newuser@redhat.com" in result
 
 
+def test_generated_users_are_stable_and_shared() -> None:
+    """Test that TEST_USERS records are deterministic and the data is shared."""
+    os.environ["TEST_USERS"] = "newuser@redhat.com"
+
+    result = get_employee_data()
+
+    assert get_employee_data() is result
+    assert result["newuser@redhat.com"] == _generate_user_data_for_email.__wrapped__(
+        "newuser@redhat.com", 9001
+    )
+
+
+def test_employee_data_is_read_only() -> None:
+    """Test that callers cannot modify the shared employee data."""
+    os.environ["TEST_USERS"] = "newuser@redhat.com"
+
+    result = get_employee_data()
+
+    with pytest.raises(TypeError):
+        result["someone@redhat.com"] = {}  # type: ignore[index]
+    with pytest.raises(TypeError):
+        result["alice.johnson@company.com"]["name"] = "Eve"  # type: ignore[index]
+    assert MOCK_EMPLOYEE_DATA["alice.johnson@company.com"]["name"] == "Alice Johnson"
+
+
 def main() -> int:
     """Run all tests."""
     print("Testing get_employee_data() function with TEST_USERS support")
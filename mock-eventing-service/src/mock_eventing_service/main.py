@@ -4,9 +4,12 @@ import asyncio
 import json
 import os
 import uuid
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Set
 
+import httpx
 from cloudevents.http import CloudEvent
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -22,6 +25,20 @@ logger = configure_logging(SERVICE_NAME)
 
 # Delivery timeout: must exceed agent processing time (AGENT_TIMEOUT=120)
 DELIVERY_TIMEOUT = float(os.getenv("DELIVERY_TIMEOUT", "130"))
+# Connections kept open to subscribers by the shared delivery client
+DELIVERY_MAX_CONNECTIONS = int(os.getenv("DELIVERY_MAX_CONNECTIONS", "100"))
+# Number of recent events kept for GET /events; older events are dropped
+EVENT_HISTORY_SIZE = int(os.getenv("EVENT_HISTORY_SIZE", "1000"))
+# Seconds a per-(subscriber, partition key) worker waits for work before exiting
+PARTITION_IDLE_TIMEOUT = float(os.getenv("PARTITION_IDLE_TIMEOUT", "60"))
+# Back-pressure: events queued per (subscriber, partition key) before the broker
+# answers 429, and events pending per subscriber before it answers 503 (0 = no limit)
+PARTITION_QUEUE_SIZE = int(os.getenv("PARTITION_QUEUE_SIZE", "100"))
+SUBSCRIBER_MAX_PENDING = int(os.getenv("SUBSCRIBER_MAX_PENDING", "1000"))
+# Deliveries sent to subscribers at once across all subscribers and partitions
+MAX_INFLIGHT_DELIVERIES = int(os.getenv("MAX_INFLIGHT_DELIVERIES", "256"))
+# Seconds producers are told to wait before retrying a rejected event
+BACKPRESSURE_RETRY_AFTER = int(os.getenv("BACKPRESSURE_RETRY_AFTER", "1"))
 auto_tracing_run(SERVICE_NAME, logger)
 
 
@@ -33,22 +50,51 @@ class EventSubscription(BaseModel):
     filter_attributes: Dict[str, str] = {}
 
 
+class BackPressureError(Exception):
+    """Raised when a subscriber is too far behind to accept another event."""
+
+    def __init__(self, status_code: int, subscriber_url: str, reason: str) -> None:
+        super().__init__(f"{reason}: {subscriber_url}")
+        self.status_code = status_code
+        self.subscriber_url = subscriber_url
+        self.reason = reason
+
+
 class MockEventingService:
     """Mock Knative Eventing service that simulates broker behavior."""
 
     def __init__(self) -> None:
-        self.subscriptions: List[EventSubscription] = []
-        self.event_history: List[Dict[str, Any]] = []
+        # Subscriptions indexed by event type so publishing skips unrelated ones
+        self._subscriptions_by_type: Dict[str, List[EventSubscription]] = {}
+        # Ring buffer: the oldest events are dropped once the history is full
+        self.event_history: Deque[Dict[str, Any]] = deque(
+            maxlen=max(1, EVENT_HISTORY_SIZE)
+        )
+        # Attempt counts of deliveries still in progress
         self.delivery_attempts: Dict[str, int] = {}
         # Per-(subscriber_url, partition_key) queues for ordered delivery (Kafka-like)
         self._partition_queues: Dict[
             tuple[str, str], asyncio.Queue[tuple[CloudEvent, EventSubscription]]
         ] = {}
         self._partition_workers: Dict[tuple[str, str], asyncio.Task[None]] = {}
+        self._delivery_tasks: Set[asyncio.Task[None]] = set()
+        self._client: Optional[httpx.AsyncClient] = None
+        # Deliveries accepted but not yet finished, per subscriber_url
+        self._pending_by_subscriber: Dict[str, int] = {}
+        self._rejected_by_subscriber: Dict[str, int] = {}
+        self._inflight_limit = asyncio.Semaphore(max(1, MAX_INFLIGHT_DELIVERIES))
+        self._inflight = 0
+
+    @property
+    def subscriptions(self) -> List[EventSubscription]:
+        """All subscriptions, grouped by event type."""
+        return [sub for subs in self._subscriptions_by_type.values() for sub in subs]
 
     def add_subscription(self, subscription: EventSubscription) -> None:
         """Add an event subscription."""
-        self.subscriptions.append(subscription)
+        self._subscriptions_by_type.setdefault(subscription.event_type, []).append(
+            subscription
+        )
         logger.info(
             "Added event subscription",
             event_type=subscription.event_type,
@@ -58,21 +104,144 @@ class MockEventingService:
 
     def remove_subscription(self, event_type: str, subscriber_url: str) -> None:
         """Remove an event subscription."""
-        self.subscriptions = [
+        remaining = [
             sub
-            for sub in self.subscriptions
-            if not (
-                sub.event_type == event_type and sub.subscriber_url == subscriber_url
-            )
+            for sub in self._subscriptions_by_type.get(event_type, [])
+            if sub.subscriber_url != subscriber_url
         ]
+        if remaining:
+            self._subscriptions_by_type[event_type] = remaining
+        else:
+            self._subscriptions_by_type.pop(event_type, None)
         logger.info(
             "Removed event subscription",
             event_type=event_type,
             subscriber_url=subscriber_url,
         )
 
+    def recent_events(self, limit: int) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` of the most recent events, oldest first."""
+        if limit <= 0:
+            return []
+        skip = max(0, len(self.event_history) - limit)
+        return list(islice(self.event_history, skip, None))
+
+    def clear_events(self) -> None:
+        """Clear the event history."""
+        self.event_history.clear()
+
+    async def reset(self) -> None:
+        """Drop subscriptions, history and pending deliveries."""
+        self._subscriptions_by_type.clear()
+        self.event_history.clear()
+        tasks = [*self._partition_workers.values(), *self._delivery_tasks]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._partition_workers.clear()
+        self._partition_queues.clear()
+        self._delivery_tasks.clear()
+        self.delivery_attempts.clear()
+        self._pending_by_subscriber.clear()
+        self._rejected_by_subscriber.clear()
+
+    async def close(self) -> None:
+        """Cancel pending deliveries and close the shared HTTP client."""
+        await self.reset()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared delivery client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=DELIVERY_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=DELIVERY_MAX_CONNECTIONS,
+                    max_keepalive_connections=DELIVERY_MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    def queue_metrics(self) -> Dict[str, Any]:
+        """Return delivery queue depths per subscriber and in-flight deliveries."""
+        subscribers: Dict[str, Dict[str, int]] = {}
+        urls = {*self._pending_by_subscriber, *self._rejected_by_subscriber}
+        for url in urls:
+            subscribers[url] = {
+                "pending": self._pending_by_subscriber.get(url, 0),
+                "partitions": 0,
+                "max_partition_depth": 0,
+                "rejected": self._rejected_by_subscriber.get(url, 0),
+            }
+        for (url, _), queue in self._partition_queues.items():
+            stats = subscribers.setdefault(
+                url,
+                {
+                    "pending": 0,
+                    "partitions": 0,
+                    "max_partition_depth": 0,
+                    "rejected": 0,
+                },
+            )
+            stats["partitions"] += 1
+            stats["max_partition_depth"] = max(
+                stats["max_partition_depth"], queue.qsize()
+            )
+        return {
+            "in_flight": self._inflight,
+            "max_in_flight": MAX_INFLIGHT_DELIVERIES,
+            "partition_queue_size": PARTITION_QUEUE_SIZE,
+            "subscriber_max_pending": SUBSCRIBER_MAX_PENDING,
+            "subscribers": subscribers,
+        }
+
+    def _check_capacity(
+        self, subscriptions: List[EventSubscription], partition_key: str
+    ) -> None:
+        """Reject the event if any matching subscriber has fallen behind.
+
+        Checked for all subscribers before anything is queued, so a rejected
+        event is delivered to none of them and the producer's retry does not
+        duplicate it for the others.
+        """
+        for subscription in subscriptions:
+            url = subscription.subscriber_url
+            error: Optional[BackPressureError] = None
+            queue = self._partition_queues.get((url, partition_key))
+            if (
+                SUBSCRIBER_MAX_PENDING > 0
+                and self._pending_by_subscriber.get(url, 0) >= SUBSCRIBER_MAX_PENDING
+            ):
+                error = BackPressureError(
+                    status.HTTP_503_SERVICE_UNAVAILABLE,
+                    url,
+                    "Subscriber has too many pending deliveries",
+                )
+            elif (
+                partition_key
+                and queue is not None
+                and PARTITION_QUEUE_SIZE > 0
+                and queue.qsize() >= PARTITION_QUEUE_SIZE
+            ):
+                error = BackPressureError(
+                    status.HTTP_429_TOO_MANY_REQUESTS,
+                    url,
+                    "Partition queue is full",
+                )
+            if error is not None:
+                self._rejected_by_subscriber[url] = (
+                    self._rejected_by_subscriber.get(url, 0) + 1
+                )
+                raise error
+
     async def publish_event(self, event: CloudEvent) -> bool:
-        """Publish an event to all matching subscribers."""
+        """Publish an event to all matching subscribers.
+
+        Raises:
+            BackPressureError: If a matching subscriber cannot accept more events.
+        """
         event_type = event.get("type")
         event_id = event.get("id", str(uuid.uuid4()))
 
@@ -85,6 +254,38 @@ class MockEventingService:
             partition_key=partition_key or "(none)",
         )
 
+        # Find matching subscriptions; an event without a type matches none
+        candidates = (
+            self._subscriptions_by_type.get(event_type, []) if event_type else []
+        )
+        matching_subscriptions = [
+            subscription
+            for subscription in candidates
+            if all(
+                event.get(attr_key) == attr_value
+                for attr_key, attr_value in subscription.filter_attributes.items()
+            )
+        ]
+
+        logger.info(
+            "Found matching subscriptions",
+            event_id=event_id,
+            event_type=event_type,
+            subscription_count=len(matching_subscriptions),
+        )
+
+        try:
+            self._check_capacity(matching_subscriptions, partition_key)
+        except BackPressureError as e:
+            logger.warning(
+                "Rejecting event, subscriber is falling behind",
+                event_id=event_id,
+                subscriber_url=e.subscriber_url,
+                reason=e.reason,
+                status_code=e.status_code,
+            )
+            raise
+
         # Store event in history
         event_record = {
             "id": event_id,
@@ -97,37 +298,25 @@ class MockEventingService:
         }
         self.event_history.append(event_record)
 
-        # Find matching subscriptions
-        matching_subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.event_type == event_type:
-                # Check filter attributes if any
-                matches_filter = True
-                for attr_key, attr_value in subscription.filter_attributes.items():
-                    if event.get(attr_key) != attr_value:
-                        matches_filter = False
-                        break
-
-                if matches_filter:
-                    matching_subscriptions.append(subscription)
-
-        logger.info(
-            "Found matching subscriptions",
-            event_id=event_id,
-            event_type=event_type,
-            subscription_count=len(matching_subscriptions),
-        )
-
         # Partition key for ordered delivery (Kafka-like: same key -> same "partition" -> FIFO)
 
         # Deliver to all matching subscribers
         for subscription in matching_subscriptions:
+            url = subscription.subscriber_url
+            self._pending_by_subscriber[url] = (
+                self._pending_by_subscriber.get(url, 0) + 1
+            )
             if partition_key:
                 # Queue for ordered delivery per (subscriber, partition_key)
                 self._enqueue_partitioned_delivery(event, subscription, partition_key)
             else:
                 # No partition key: deliver immediately (backward compat)
-                asyncio.create_task(self._deliver_event_async(event, subscription))
+                task = asyncio.create_task(
+                    self._deliver_event_async(event, subscription)
+                )
+                # Keep a reference so the task is not garbage collected mid-delivery
+                self._delivery_tasks.add(task)
+                task.add_done_callback(self._delivery_tasks.discard)
 
         # Return immediately - events are processed in background
         return True
@@ -146,9 +335,11 @@ class MockEventingService:
 
     async def _partition_delivery_worker(self, key: tuple[str, str]) -> None:
         """Process deliveries for one (subscriber, partition_key) in FIFO order.
-        Cleans up when idle (empty queue for IDLE_TIMEOUT_SEC) to avoid memory leak.
+
+        Partition keys are usually session IDs, so workers are reaped once their
+        queue has been empty for PARTITION_IDLE_TIMEOUT to avoid leaking one
+        task per session.
         """
-        IDLE_TIMEOUT_SEC = 300.0  # 5 min empty -> remove partition
         queue = self._partition_queues.get(key)
         if not queue:
             return
@@ -156,135 +347,162 @@ class MockEventingService:
             while True:
                 try:
                     event, subscription = await asyncio.wait_for(
-                        queue.get(), timeout=IDLE_TIMEOUT_SEC
+                        queue.get(), timeout=PARTITION_IDLE_TIMEOUT
                     )
-                    await self._deliver_event_async(event, subscription)
                 except asyncio.TimeoutError:
-                    # Queue empty for IDLE_TIMEOUT_SEC -> idle partition, clean up
-                    # Re-check: item could have arrived during timeout
+                    # Re-check: item could have arrived during timeout. Nothing
+                    # awaits between this check and the cleanup below, so no
+                    # event can be enqueued onto a queue that is being dropped.
                     if queue.empty():
                         break
                     continue
-                except asyncio.CancelledError:
-                    break
+                try:
+                    await self._deliver_event_async(event, subscription)
                 except Exception as e:
                     logger.error(
                         "Partition delivery worker error",
                         key=key,
                         error=str(e),
                     )
+        except asyncio.CancelledError:
+            pass
         finally:
-            self._partition_queues.pop(key, None)
-            self._partition_workers.pop(key, None)
+            if self._partition_workers.get(key) is asyncio.current_task():
+                self._partition_queues.pop(key, None)
+                self._partition_workers.pop(key, None)
             logger.debug("Partition worker cleaned up (idle or cancelled)", key=key)
 
     async def _deliver_event_async(
         self, event: CloudEvent, subscription: EventSubscription
     ) -> None:
-        """Deliver an event to a specific subscriber asynchronously."""
-        import httpx
+        """Deliver an event to a specific subscriber, retrying transient failures."""
+        from cloudevents.conversion import to_structured
 
         event_id = event.get("id", str(uuid.uuid4()))
         delivery_key = f"{event_id}:{subscription.subscriber_url}"
 
-        # Track delivery attempts
-        self.delivery_attempts[delivery_key] = (
-            self.delivery_attempts.get(delivery_key, 0) + 1
-        )
-        attempt_count = self.delivery_attempts[delivery_key]
-
-        logger.info(
-            "Delivering event to subscriber (async)",
-            event_id=event_id,
-            subscriber_url=subscription.subscriber_url,
-            attempt=attempt_count,
-        )
-
+        base_headers: Dict[str, str] = {}
+        body: Optional[bytes] = None
+        attempt_count = 0
         try:
-            # Convert CloudEvent to HTTP format
-            from cloudevents.conversion import to_structured
-
-            logger.info(
-                "Converting CloudEvent for delivery",
-                event_id=event_id,
-                event_data_preview=(
-                    str(event.get_data())[:200] if event.get_data() else "no_data"
-                ),
-            )
-
-            headers, body = to_structured(event)
-
-            # Add mock broker headers
-            headers["ce-broker"] = "mock-broker"
-            headers["ce-delivery"] = str(attempt_count)
-
-            logger.info(
-                "Sending CloudEvent to subscriber",
-                event_id=event_id,
-                subscriber_url=subscription.subscriber_url,
-                body_length=len(body),
-                body_preview=body[:200] if body else "empty",
-            )
-
-            async with httpx.AsyncClient(timeout=DELIVERY_TIMEOUT) as client:
-                response = await client.post(
-                    subscription.subscriber_url,
-                    headers=headers,
-                    content=body,
-                )
-
-                response.raise_for_status()
+            while True:
+                attempt_count += 1
+                # Track delivery attempts
+                self.delivery_attempts[delivery_key] = attempt_count
 
                 logger.info(
-                    "Event delivered successfully",
+                    "Delivering event to subscriber (async)",
                     event_id=event_id,
                     subscriber_url=subscription.subscriber_url,
-                    status_code=response.status_code,
+                    attempt=attempt_count,
                 )
 
-        except Exception as e:
-            # str(e) can be empty for httpx.TimeoutException etc; include type
-            err_msg = str(e) or f"{type(e).__name__}"
-            logger.error(
-                "Failed to deliver event",
-                event_id=event_id,
-                subscriber_url=subscription.subscriber_url,
-                attempt=attempt_count,
-                error=err_msg,
-                error_type=type(e).__name__,
-            )
+                try:
+                    if body is None:
+                        logger.info(
+                            "Converting CloudEvent for delivery",
+                            event_id=event_id,
+                            event_data_preview=(
+                                str(event.get_data())[:200]
+                                if event.get_data()
+                                else "no_data"
+                            ),
+                        )
+                        # Convert CloudEvent to HTTP format once for all attempts
+                        base_headers, body = to_structured(event)
+
+                    # Add mock broker headers
+                    headers = {
+                        **base_headers,
+                        "ce-broker": "mock-broker",
+                        "ce-delivery": str(attempt_count),
+                    }
+
+                    logger.info(
+                        "Sending CloudEvent to subscriber",
+                        event_id=event_id,
+                        subscriber_url=subscription.subscriber_url,
+                        body_length=len(body),
+                        body_preview=body[:200] if body else "empty",
+                    )
 
-            # Retry on timeout (agent may be slow under load) or 503 (agent
-            # ordering check: "Earlier request still processing - retry later")
-            is_timeout = "timeout" in err_msg.lower() or "Timeout" in type(e).__name__
-            err_response = getattr(e, "response", None)
-            status_code = (
-                getattr(err_response, "status_code", None)
-                if err_response is not None
-                else None
-            )
-            is_retriable_5xx = status_code in (502, 503, 504)
-            max_retries = (
-                10 if is_retriable_5xx else 3
-            )  # Align with Kafka broker (retry: 10)
+                    # Held per attempt, not during backoff, so waiting retries
+                    # do not take slots from other deliveries
+                    async with self._inflight_limit:
+                        self._inflight += 1
+                        try:
+                            response = await self._get_client().post(
+                                subscription.subscriber_url,
+                                headers=headers,
+                                content=body,
+                            )
+                        finally:
+                            self._inflight -= 1
+                    response.raise_for_status()
+
+                    logger.info(
+                        "Event delivered successfully",
+                        event_id=event_id,
+                        subscriber_url=subscription.subscriber_url,
+                        status_code=response.status_code,
+                    )
+                    return
 
-            if attempt_count < max_retries and (is_timeout or is_retriable_5xx):
-                backoff = 2.0 if is_retriable_5xx else 1.0
-                logger.info(
-                    "Retrying delivery",
-                    event_id=event_id,
-                    next_attempt=attempt_count + 1,
-                    reason="timeout" if is_timeout else f"{status_code}",
-                )
-                await asyncio.sleep(backoff)
-                await self._deliver_event_async(event, subscription)
+                except Exception as e:
+                    # str(e) can be empty for httpx.TimeoutException etc; include type
+                    err_msg = str(e) or f"{type(e).__name__}"
+                    logger.error(
+                        "Failed to deliver event",
+                        event_id=event_id,
+                        subscriber_url=subscription.subscriber_url,
+                        attempt=attempt_count,
+                        error=err_msg,
+                        error_type=type(e).__name__,
+                    )
+
+                    # Retry on timeout (agent may be slow under load) or 503 (agent
+                    # ordering check: "Earlier request still processing - retry later")
+                    is_timeout = (
+                        "timeout" in err_msg.lower() or "Timeout" in type(e).__name__
+                    )
+                    err_response = getattr(e, "response", None)
+                    status_code = (
+                        getattr(err_response, "status_code", None)
+                        if err_response is not None
+                        else None
+                    )
+                    is_retriable_5xx = status_code in (502, 503, 504)
+                    max_retries = (
+                        10 if is_retriable_5xx else 3
+                    )  # Align with Kafka broker (retry: 10)
+
+                    if attempt_count >= max_retries or not (
+                        is_timeout or is_retriable_5xx
+                    ):
+                        logger.error(
+                            "Delivery failed after retries",
+                            event_id=event_id,
+                            subscriber_url=subscription.subscriber_url,
+                            attempts=attempt_count,
+                        )
+                        return
+
+                    backoff = 2.0 if is_retriable_5xx else 1.0
+                    logger.info(
+                        "Retrying delivery",
+                        event_id=event_id,
+                        next_attempt=attempt_count + 1,
+                        reason="timeout" if is_timeout else f"{status_code}",
+                    )
+                    await asyncio.sleep(backoff)
+        finally:
+            self.delivery_attempts.pop(delivery_key, None)
+            url = subscription.subscriber_url
+            pending = self._pending_by_subscriber.get(url, 0) - 1
+            if pending > 0:
+                self._pending_by_subscriber[url] = pending
             else:
-                logger.error(
-                    "Delivery failed after retries",
-                    event_id=event_id,
-                    subscriber_url=subscription.subscriber_url,
-                    attempts=attempt_count,
-                )
+                self._pending_by_subscriber.pop(url, None)
 
 
 # Initialize the mock service
@@ -384,6 +602,12 @@ async def startup_event() -> None:
     await initialize_default_subscriptions()
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Stop pending deliveries and close subscriber connections."""
+    await mock_service.close()
+
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -509,7 +733,16 @@ async def broker_endpoint(
             )
 
         # Publish the event
-        success = await mock_service.publish_event(event)
+        try:
+            success = await mock_service.publish_event(event)
+        except BackPressureError as e:
+            # Knative/Kafka brokers signal a lagging subscriber the same way;
+            # producers are expected to back off and retry
+            raise HTTPException(
+                status_code=e.status_code,
+                detail=str(e),
+                headers={"Retry-After": str(BACKPRESSURE_RETRY_AFTER)},
+            )
 
         if success:
             return {"status": "accepted", "message": "Event published successfully"}
@@ -519,6 +752,8 @@ async def broker_endpoint(
                 detail="Failed to publish event",
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Failed to process broker request", error=str(e))
         raise HTTPException(
@@ -557,12 +792,16 @@ async def list_subscriptions() -> Dict[str, Any]:
     }
 
 
+@app.get("/metrics/queues")
+async def queue_metrics() -> Dict[str, Any]:
+    """Delivery queue depth per subscriber and in-flight deliveries."""
+    return mock_service.queue_metrics()
+
+
 @app.get("/events")
 async def list_events(limit: int = 100) -> Dict[str, Any]:
     """List recent events."""
-    recent_events = (
-        mock_service.event_history[-limit:] if mock_service.event_history else []
-    )
+    recent_events = mock_service.recent_events(limit)
     return {
         "events": recent_events,
         "count": len(recent_events),
@@ -573,22 +812,14 @@ async def list_events(limit: int = 100) -> Dict[str, Any]:
 @app.delete("/events")
 async def clear_events() -> dict[str, str]:
     """Clear event history."""
-    mock_service.event_history.clear()
-    mock_service.delivery_attempts.clear()
+    mock_service.clear_events()
     return {"status": "cleared", "message": "Event history cleared"}
 
 
 @app.post("/reset")
 async def reset_service() -> dict[str, str]:
     """Reset the mock service to initial state."""
-    mock_service.subscriptions.clear()
-    mock_service.event_history.clear()
-    mock_service.delivery_attempts.clear()
-    # Cancel partition delivery workers
-    for task in mock_service._partition_workers.values():
-        task.cancel()
-    mock_service._partition_workers.clear()
-    mock_service._partition_queues.clear()
+    await mock_service.reset()
     return {"status": "reset", "message": "Mock service reset to initial state"}
 
 
@@ -0,0 +1 @@
+"""Tests for mock eventing service."""
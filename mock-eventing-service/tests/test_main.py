@@ -0,0 +1,157 @@
+"""Tests for the mock eventing service broker."""
+
+import asyncio
+import json
+from typing import List
+from unittest.mock import patch
+
+import httpx
+import pytest
+from cloudevents.http import CloudEvent
+from fastapi.testclient import TestClient
+from mock_eventing_service import main
+from mock_eventing_service.main import (
+    BackPressureError,
+    EventSubscription,
+    MockEventingService,
+)
+
+SUBSCRIBER_URL = "http://subscriber.example/events"
+
+
+def _event(event_id: str, **attributes: str) -> CloudEvent:
+    return CloudEvent(
+        {"id": event_id, "type": "test.event", "source": "tests", **attributes},
+        {"value": event_id},
+    )
+
+
+def _service(handler: httpx.MockTransport) -> MockEventingService:
+    service = MockEventingService()
+    service._client = httpx.AsyncClient(transport=handler)
+    service.add_subscription(
+        EventSubscription(event_type="test.event", subscriber_url=SUBSCRIBER_URL)
+    )
+    return service
+
+
+async def test_history_is_bounded_and_subscriptions_indexed() -> None:
+    """History keeps only the newest events and unrelated types are skipped."""
+    with patch.object(main, "EVENT_HISTORY_SIZE", 3):
+        service = MockEventingService()
+    service.add_subscription(
+        EventSubscription(event_type="other.event", subscriber_url=SUBSCRIBER_URL)
+    )
+
+    for i in range(5):
+        await service.publish_event(_event(f"evt-{i}"))
+
+    assert [e["id"] for e in service.recent_events(10)] == ["evt-2", "evt-3", "evt-4"]
+    assert [e["id"] for e in service.recent_events(1)] == ["evt-4"]
+    assert not service._delivery_tasks
+
+    service.remove_subscription("other.event", SUBSCRIBER_URL)
+    assert service.subscriptions == []
+    await service.close()
+
+
+async def test_retries_iteratively_on_one_client() -> None:
+    """Retriable 503s are retried with the shared client until delivered."""
+    deliveries: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        deliveries.append(request.headers["ce-delivery"])
+        return httpx.Response(503 if len(deliveries) < 3 else 202)
+
+    service = _service(httpx.MockTransport(handler))
+    client = service._client
+
+    with patch.object(asyncio, "sleep", return_value=None):
+        await service._deliver_event_async(_event("evt-1"), service.subscriptions[0])
+
+    assert deliveries == ["1", "2", "3"]
+    assert service._client is client
+    assert service.delivery_attempts == {}
+    await service.close()
+
+
+async def test_idle_partition_workers_are_reaped() -> None:
+    """Partition workers deliver in order and exit once idle."""
+    delivered: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        delivered.append(json.loads(request.content)["id"])
+        return httpx.Response(202)
+
+    service = _service(httpx.MockTransport(handler))
+
+    with patch.object(main, "PARTITION_IDLE_TIMEOUT", 0.05):
+        for i in range(3):
+            await service.publish_event(_event(f"evt-{i}", partitionkey="session-1"))
+        assert len(service._partition_workers) == 1
+        worker = next(iter(service._partition_workers.values()))
+        await asyncio.wait_for(worker, timeout=1)
+
+    assert delivered == ["evt-0", "evt-1", "evt-2"]
+    assert service._partition_workers == {}
+    assert service._partition_queues == {}
+    await service.close()
+
+
+async def test_full_partition_queue_rejects_event() -> None:
+    """A full partition queue rejects the event with 429 and counts it."""
+    service = _service(httpx.MockTransport(lambda request: httpx.Response(202)))
+
+    with patch.object(main, "PARTITION_QUEUE_SIZE", 1):
+        await service.publish_event(_event("evt-0", partitionkey="session-1"))
+        with pytest.raises(BackPressureError) as exc_info:
+            await service.publish_event(_event("evt-1", partitionkey="session-1"))
+        # Other partitions of the same subscriber are unaffected
+        await service.publish_event(_event("evt-2", partitionkey="session-2"))
+
+    assert exc_info.value.status_code == 429
+    assert [e["id"] for e in service.recent_events(10)] == ["evt-0", "evt-2"]
+    metrics = service.queue_metrics()["subscribers"][SUBSCRIBER_URL]
+    assert metrics == {
+        "pending": 2,
+        "partitions": 2,
+        "max_partition_depth": 1,
+        "rejected": 1,
+    }
+    await service.close()
+
+
+async def test_lagging_subscriber_rejects_event() -> None:
+    """Too many pending deliveries reject the event with 503 until they finish."""
+    service = _service(httpx.MockTransport(lambda request: httpx.Response(202)))
+
+    with patch.object(main, "SUBSCRIBER_MAX_PENDING", 2):
+        await service.publish_event(_event("evt-0"))
+        await service.publish_event(_event("evt-1"))
+        with pytest.raises(BackPressureError) as exc_info:
+            await service.publish_event(_event("evt-2"))
+        assert exc_info.value.status_code == 503
+
+        await asyncio.gather(*service._delivery_tasks)
+        assert service.queue_metrics()["subscribers"][SUBSCRIBER_URL]["pending"] == 0
+        await service.publish_event(_event("evt-3"))
+
+    await service.close()
+
+
+def test_broker_endpoint_returns_backpressure_status() -> None:
+    """The broker answers a rejected event with its status and Retry-After."""
+    error = BackPressureError(503, SUBSCRIBER_URL, "Subscriber is behind")
+    client = TestClient(main.app)
+
+    with patch.object(main.mock_service, "publish_event", side_effect=error):
+        response = client.post(
+            "/default/default",
+            content=json.dumps(
+                {"specversion": "1.0", "id": "evt-1", "type": "t", "source": "s"}
+            ),
+            headers={"content-type": "application/cloudevents+json"},
+        )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
@@ -1,14 +1,98 @@
 """Mock data for ServiceNow API responses."""
 
+import itertools
+import os
 import random
-from datetime import datetime
-from typing import Any, Dict, List
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Mapping, Tuple
 
 from mock_employee_data import get_employee_data
 
+# Number of synthetic employees generated in addition to the mock employee data,
+# and the seed that makes them identical across restarts and replicas
+MOCK_SN_EMPLOYEE_COUNT = int(os.getenv("MOCK_SN_EMPLOYEE_COUNT", "0"))
+MOCK_SN_SEED = int(os.getenv("MOCK_SN_SEED", "0"))
+
+_FIRST_NAMES = (
+    "Aisha Carlos Chen Daniel Elena Fatima Hiro Ingrid James Kofi "
+    "Laura Mateo Mei Nadia Olga Priya Rahul Sofia Tomas Yuki"
+).split()
+_LAST_NAMES = (
+    "Andersen Brown Costa Dubois Fischer Gupta Hansen Ivanova Kim Lopez "
+    "Mueller Nakamura Okafor Patel Rossi Santos Silva Tanaka Wang Williams"
+).split()
+_LOCATIONS = ["NA", "EMEA", "APAC", "LATAM"]
+# (laptop_model, model_id)
+_LAPTOP_MODELS = [
+    ("Latitude 7420", "latitude_7420"),
+    ("MacBook Pro 14-inch", "macbook_pro_14"),
+    ("ThinkPad X1 Carbon", "thinkpad_x1_carbon"),
+    ("EliteBook 840 G7", "elitebook_840_g7"),
+    ("Surface Laptop 4", "surface_laptop_4"),
+]
+# Purchase dates are relative to a fixed day so the dataset does not drift
+_SYNTHETIC_REFERENCE_DATE = date(2025, 1, 1)
+_WARRANTY_DAYS = 1095
+
+
+def generate_employee_data(count: int, seed: int = 0) -> Dict[str, Dict[str, Any]]:
+    """Generate a deterministic synthetic employee directory.
+
+    The same count and seed always yield the same employees, so capacity tests
+    can run against a production-sized directory and still look up known users
+    (emails look like ``<first>.<last>.<n>@company.com``, numbered from 0).
+
+    Args:
+        count: Number of employees to generate
+        seed: Seed for the random generator
+
+    Returns:
+        Dictionary of employee data keyed by lowercase email
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    employees: Dict[str, Dict[str, Any]] = {}
+    for n in range(count):
+        first = rng.choice(_FIRST_NAMES)
+        last = rng.choice(_LAST_NAMES)
+        user_name = f"{first}.{last}.{n}".lower()
+        email = f"{user_name}@company.com"
+        laptop_model, model_id = rng.choice(_LAPTOP_MODELS)
+        purchased = _SYNTHETIC_REFERENCE_DATE - timedelta(days=rng.randint(0, 1825))
+        warranty_expiry = purchased + timedelta(days=_WARRANTY_DAYS)
+        employees[email] = {
+            "employee_id": str(100000 + n),
+            "sys_id": f"{rng.getrandbits(128):032x}",
+            "name": f"{first} {last}",
+            "email": email,
+            "user_name": user_name,
+            "location": rng.choice(_LOCATIONS),
+            "active": "true",
+            "laptop_model": laptop_model,
+            "laptop_serial_number": f"SYN{n:08d}",
+            "purchase_date": purchased.isoformat(),
+            "warranty_expiry": warranty_expiry.isoformat(),
+            "warranty_status": "Active" if today < warranty_expiry else "Expired",
+            "asset_tag": f"ASSET-SYN-{n:08d}",
+            "model_id": model_id,
+            "install_status": "1",
+            "operational_status": "1",
+        }
+    return employees
+
+
+def _load_employee_data() -> Dict[str, Mapping[str, Any]]:
+    employees: Dict[str, Mapping[str, Any]] = dict(
+        generate_employee_data(MOCK_SN_EMPLOYEE_COUNT, MOCK_SN_SEED)
+    )
+    # Hand-written employees take precedence over generated ones
+    employees.update(get_employee_data())
+    return employees
+
+
 # Cache employee data at module level to ensure consistency
 # across multiple function calls during a test session
-EMPLOYEE_DATA = get_employee_data()
+EMPLOYEE_DATA = _load_employee_data()
 
 
 def generate_ticket_number() -> str:
@@ -59,16 +143,43 @@ def find_computers_by_user_sys_id(user_sys_id: str) -> List[Dict[str, Any]]:
     if not user_sys_id:
         return []
 
-    # Find the user data by sys_id
-    user_data = None
-    for email, data in EMPLOYEE_DATA.items():
-        if data["sys_id"] == user_sys_id:
-            user_data = data
-            break
+    return list(COMPUTERS_BY_USER_SYS_ID.get(user_sys_id, []))
+
+
+def find_computers_by_user_email(email: str) -> List[Dict[str, Any]]:
+    """Find computers whose assigned user has the given email.
 
+    Mirrors a dot-walked ServiceNow query (``assigned_to.email=...``): each
+    record also carries the assigned user's fields as ``assigned_to.<field>``
+    so callers get user and laptop details in one request.
+
+    Args:
+        email: Email address of the assigned user
+
+    Returns:
+        List of computer data dictionaries
+    """
+    if not email:
+        return []
+
+    user_data = EMPLOYEE_DATA.get(email.lower())
     if not user_data:
         return []
 
+    return [
+        {
+            **computer,
+            "assigned_to.sys_id": user_data["sys_id"],
+            "assigned_to.name": user_data["name"],
+            "assigned_to.email": user_data["email"],
+            "assigned_to.location": user_data["location"],
+        }
+        for computer in COMPUTERS_BY_USER_SYS_ID.get(user_data["sys_id"], [])
+    ]
+
+
+def _computers_for_user(user_data: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    user_sys_id = user_data["sys_id"]
     # Return ServiceNow-style computer response
     return [
         {
@@ -89,6 +200,104 @@ def find_computers_by_user_sys_id(user_sys_id: str) -> List[Dict[str, Any]]:
     ]
 
 
+# sys_id -> assigned computers, built once at load time
+COMPUTERS_BY_USER_SYS_ID: Dict[str, List[Dict[str, Any]]] = {
+    user_data["sys_id"]: _computers_for_user(user_data)
+    for user_data in EMPLOYEE_DATA.values()
+}
+
+# In-memory sc_req_item table: sys_id -> request item, indexed by the user the
+# item was requested for
+REQUEST_ITEMS: Dict[str, Dict[str, Any]] = {}
+REQUEST_ITEMS_BY_USER: Dict[str, List[Dict[str, Any]]] = {}
+_request_item_numbers = itertools.count(10001)
+
+
+def _parse_encoded_query(query: str) -> List[Tuple[str, str, str]]:
+    """Parse a ServiceNow encoded query into (field, operator, value) terms.
+
+    Only ``field=value`` and ``fieldINa,b`` terms joined by ``^`` are supported,
+    which is what the MCP server sends.
+    """
+    terms = []
+    for term in query.split("^"):
+        if not term:
+            continue
+        field, sep, value = term.partition("=")
+        if sep:
+            terms.append((field, "=", value))
+            continue
+        field, sep, value = term.partition("IN")
+        if sep:
+            terms.append((field, "IN", value))
+    return terms
+
+
+def _matches(item: Dict[str, Any], terms: List[Tuple[str, str, str]]) -> bool:
+    for field, operator, value in terms:
+        actual = str(item.get(field, ""))
+        if operator == "=" and actual != value:
+            return False
+        if operator == "IN" and actual not in value.split(","):
+            return False
+    return True
+
+
+def find_request_items(query: str, fields: str = "") -> List[Dict[str, Any]]:
+    """Find request items matching an encoded query.
+
+    Args:
+        query: ServiceNow encoded query (sysparm_query)
+        fields: Comma-separated fields to return (sysparm_fields); all if empty
+
+    Returns:
+        List of request item dictionaries
+    """
+    terms = _parse_encoded_query(query)
+    user_sys_id = next(
+        (
+            value
+            for field, operator, value in terms
+            if field == "who_is_this_request_for" and operator == "="
+        ),
+        None,
+    )
+    candidates = (
+        REQUEST_ITEMS_BY_USER.get(user_sys_id, [])
+        if user_sys_id is not None
+        else REQUEST_ITEMS.values()
+    )
+    selected = [name for name in fields.split(",") if name]
+    return [
+        {name: item.get(name, "") for name in selected} if selected else dict(item)
+        for item in candidates
+        if _matches(item, terms)
+    ]
+
+
+def update_request_item(sys_id: str, updates: Dict[str, Any]) -> Dict[str, Any] | None:
+    """Update fields of a request item, e.g. its state.
+
+    Args:
+        sys_id: Request item sys_id
+        updates: Fields to set
+
+    Returns:
+        The updated request item if found, None otherwise
+    """
+    item = REQUEST_ITEMS.get(sys_id)
+    if item is None:
+        return None
+    item.update({k: str(v) for k, v in updates.items() if k != "sys_id"})
+    return dict(item)
+
+
+def clear_request_items() -> None:
+    """Drop all request items."""
+    REQUEST_ITEMS.clear()
+    REQUEST_ITEMS_BY_USER.clear()
+
+
 def create_laptop_refresh_request(
     laptop_refresh_id: str, laptop_choices: str, who_is_this_request_for: str
 ) -> Dict[str, Any]:
@@ -107,6 +316,21 @@ def create_laptop_refresh_request(
     # Generate a mock sys_id for the request
     request_sys_id = f"req_{random.randint(100000, 999999)}"
 
+    # Record the request item so later sc_req_item queries see it
+    item_number = next(_request_item_numbers)
+    item = {
+        "sys_id": f"ritm_{item_number}",
+        "number": f"RITM{item_number:07d}",
+        "state": "1",  # Open
+        "cat_item": laptop_refresh_id,
+        "who_is_this_request_for": who_is_this_request_for,
+        "variables.laptop_choices": laptop_choices,
+        "request.number": ticket_number,
+        "request.sys_id": request_sys_id,
+    }
+    REQUEST_ITEMS[item["sys_id"]] = item
+    REQUEST_ITEMS_BY_USER.setdefault(who_is_this_request_for, []).append(item)
+
     # ServiceNow-compatible response format
     return {
         "result": {
@@ -0,0 +1,200 @@
+"""Latency, error and throttling profiles for the mock ServiceNow API.
+
+Profiles are configured per endpoint with the ``MOCK_SN_FAULT_PROFILE``
+environment variable, a JSON object (or a path to a JSON file) keyed by table
+name (``sys_user``, ``cmdb_ci_computer``, ``sc_req_item``), ``order_now`` or
+``default`` for everything else::
+
+    {
+      "default": {"latency": {"distribution": "fixed", "ms": 20}},
+      "sys_user": {
+        "latency": {"distribution": "lognormal", "median_ms": 80, "p99_ms": 900},
+        "error_rate": 0.02,
+        "error_statuses": [429, 503],
+        "retry_after": 2
+      }
+    }
+
+Supported latency distributions are ``fixed`` (``ms``), ``normal``
+(``mean_ms``, ``p99_ms``) and ``lognormal`` (``median_ms``, ``p99_ms``).
+"""
+
+import asyncio
+import json
+import math
+import os
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# z-score of the 99th percentile of the standard normal distribution
+_Z_P99 = 2.3263
+
+
+@dataclass
+class LatencyDistribution:
+    """Response delay distribution, in milliseconds."""
+
+    distribution: str = "fixed"
+    ms: float = 0.0
+    mean_ms: float = 0.0
+    median_ms: float = 0.0
+    p99_ms: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.distribution not in ("fixed", "normal", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+        if self.distribution == "lognormal" and (
+            self.median_ms <= 0 or self.p99_ms < self.median_ms
+        ):
+            raise ValueError("lognormal latency needs 0 < median_ms <= p99_ms")
+        if self.distribution == "normal" and self.p99_ms < self.mean_ms:
+            raise ValueError("normal latency needs mean_ms <= p99_ms")
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a delay in seconds."""
+        if self.distribution == "normal":
+            sigma = (self.p99_ms - self.mean_ms) / _Z_P99
+            delay_ms = rng.gauss(self.mean_ms, sigma)
+        elif self.distribution == "lognormal":
+            sigma = math.log(self.p99_ms / self.median_ms) / _Z_P99
+            delay_ms = rng.lognormvariate(math.log(self.median_ms), sigma)
+        else:
+            delay_ms = self.ms
+        return max(0.0, delay_ms) / 1000
+
+
+@dataclass
+class EndpointProfile:
+    """Latency and injected errors for one endpoint."""
+
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    error_rate: float = 0.0
+    error_statuses: List[int] = field(default_factory=lambda: [503])
+    retry_after: int = 1
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EndpointProfile":
+        """Build a profile from its JSON representation."""
+        data = dict(data)
+        latency = LatencyDistribution(**data.pop("latency", {}))
+        profile = cls(latency=latency, **data)
+        if not 0.0 <= profile.error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        if not profile.error_statuses:
+            raise ValueError("error_statuses must not be empty")
+        return profile
+
+
+def load_profiles(value: Optional[str]) -> Dict[str, EndpointProfile]:
+    """Parse endpoint profiles from JSON or from a JSON file path.
+
+    Args:
+        value: JSON object, path to a JSON file, or None for no profiles
+
+    Returns:
+        Profiles keyed by endpoint name
+    """
+    if not value:
+        return {}
+    if not value.lstrip().startswith("{"):
+        with open(value) as f:
+            value = f.read()
+    return {
+        name: EndpointProfile.from_dict(spec)
+        for name, spec in json.loads(value).items()
+    }
+
+
+def endpoint_name(path: str) -> str:
+    """Map a request path to the endpoint name its profile is keyed by."""
+    if path.startswith("/api/now/table/"):
+        return path[len("/api/now/table/") :].split("/", 1)[0]
+    if path.endswith("/order_now"):
+        return "order_now"
+    return "default"
+
+
+class Throttled(Exception):
+    """Raised when the request queue is full, like ServiceNow's semaphores."""
+
+
+class FaultInjector:
+    """Apply endpoint profiles and semaphore-style throttling to requests."""
+
+    def __init__(
+        self,
+        profiles: Dict[str, EndpointProfile],
+        max_concurrency: int = 0,
+        max_queued: int = 0,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            profiles: Endpoint profiles keyed by endpoint name
+            max_concurrency: Requests processed at once; 0 for no limit
+            max_queued: Requests waiting for a slot before new ones are
+                rejected with 429
+            seed: Seed for latency and error sampling, for reproducible runs
+        """
+        self.profiles = profiles
+        self.max_concurrency = max_concurrency
+        self.max_queued = max(0, max_queued)
+        self.rng = random.Random(seed)
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+        )
+        self._queued = 0
+        self.active = 0
+        self.rejected = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any profile or limit is configured."""
+        return bool(self.profiles) or self._semaphore is not None
+
+    def profile_for(self, path: str) -> Optional[EndpointProfile]:
+        """Return the profile for a request path, if one applies."""
+        return self.profiles.get(endpoint_name(path)) or self.profiles.get("default")
+
+    def sample_error(self, profile: EndpointProfile) -> Optional[int]:
+        """Return a status code to fail the request with, or None."""
+        if profile.error_rate and self.rng.random() < profile.error_rate:
+            return self.rng.choice(profile.error_statuses)
+        return None
+
+    async def acquire(self) -> None:
+        """Wait for a processing slot.
+
+        Raises:
+            Throttled: If ``max_queued`` requests are already waiting.
+        """
+        if self._semaphore is None:
+            self.active += 1
+            return
+        if self._semaphore.locked() and self._queued >= self.max_queued:
+            self.rejected += 1
+            raise Throttled()
+        self._queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+        self.active += 1
+
+    def release(self) -> None:
+        """Free the slot taken by ``acquire``."""
+        self.active -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+def get_fault_injector() -> FaultInjector:
+    """Build the fault injector from environment variables."""
+    seed = os.getenv("MOCK_SN_FAULT_SEED")
+    return FaultInjector(
+        load_profiles(os.getenv("MOCK_SN_FAULT_PROFILE")),
+        max_concurrency=int(os.getenv("MOCK_SN_MAX_CONCURRENCY", "0")),
+        max_queued=int(os.getenv("MOCK_SN_MAX_QUEUED", "50")),
+        seed=int(seed) if seed is not None else None,
+    )
@@ -1,18 +1,24 @@
 """Mock ServiceNow server implementation."""
 
+import asyncio
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 
-from fastapi import Depends, FastAPI, HTTPException, Request, Security
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, Security
+from fastapi.responses import JSONResponse
 from fastapi.security import APIKeyHeader
 from pydantic import BaseModel
 from shared_models import configure_logging
 
 from .data import (
     create_laptop_refresh_request,
+    find_computers_by_user_email,
     find_computers_by_user_sys_id,
+    find_request_items,
     find_user_by_email,
+    update_request_item,
 )
+from .faults import Throttled, get_fault_injector
 
 # Configure logging
 logger = configure_logging(__name__)
@@ -26,6 +32,52 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+# Latency, error and throttling profiles (all disabled by default)
+fault_injector = get_fault_injector()
+
+
+def _error_response(status_code: int, message: str, retry_after: int) -> Response:
+    """Build a ServiceNow-style error response."""
+    return JSONResponse(
+        status_code=status_code,
+        content={"error": {"message": message, "detail": None}, "status": "failure"},
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+@app.middleware("http")
+async def inject_faults(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Delay, fail or throttle API requests according to the fault profiles."""
+    if not fault_injector.enabled or not request.url.path.startswith("/api/"):
+        return await call_next(request)
+
+    profile = fault_injector.profile_for(request.url.path)
+    retry_after = profile.retry_after if profile else 1
+    try:
+        await fault_injector.acquire()
+    except Throttled:
+        logger.info("Throttling request", path=request.url.path)
+        return _error_response(
+            429, "Too many requests - semaphore queue full", retry_after
+        )
+
+    try:
+        if profile is None:
+            return await call_next(request)
+        await asyncio.sleep(profile.latency.sample(fault_injector.rng))
+        status_code = fault_injector.sample_error(profile)
+        if status_code is not None:
+            logger.info(
+                "Injecting error", path=request.url.path, status_code=status_code
+            )
+            return _error_response(status_code, "Injected fault", retry_after)
+        return await call_next(request)
+    finally:
+        fault_injector.release()
+
+
 # API Key authentication (optional for mock server)
 api_key_header = APIKeyHeader(name="x-sn-apikey", auto_error=False)
 
@@ -162,7 +214,8 @@ async def get_computers(
     """Get computers from the cmdb_ci_computer table.
 
     This endpoint mimics ServiceNow's Table API for cmdb_ci_computer.
-    Supports filtering by assigned_to via sysparm_query parameter.
+    Supports filtering by assigned_to (sys_id) or the dot-walked
+    assigned_to.email via sysparm_query parameter.
     """
     # Parse query parameters
     query_params = dict(request.query_params)
@@ -170,6 +223,17 @@ async def get_computers(
 
     sysparm_query = query_params.get("sysparm_query", "")
 
+    # Dot-walked lookup by the assigned user's email (format: assigned_to.email=email)
+    if sysparm_query.startswith("assigned_to.email="):
+        email = sysparm_query[18:]  # Remove "assigned_to.email=" prefix
+        computers = find_computers_by_user_email(email)
+        logger.info(
+            "Found computers for user email",
+            computer_count=len(computers),
+            email=email,
+        )
+        return {"result": computers}
+
     # Parse assigned_to user sys_id from query (format: assigned_to=sys_id)
     user_sys_id = None
     if sysparm_query.startswith("assigned_to="):
@@ -200,16 +264,42 @@ async def get_request_items(
     """Get request items from the sc_req_item table.
 
     This endpoint mimics ServiceNow's Table API for sc_req_item.
-    For simplicity, it always returns an empty result set.
+    Returns the items created through order_now that match the encoded
+    sysparm_query, limited to sysparm_fields if given.
     """
-    # Parse query parameters for logging
+    # Parse query parameters
     query_params = dict(request.query_params)
     logger.debug("Request items query parameters", query_params=query_params)
 
-    logger.info("Request items endpoint called - returning empty result")
+    items = find_request_items(
+        query_params.get("sysparm_query", ""),
+        query_params.get("sysparm_fields", ""),
+    )
+    if "sysparm_limit" in query_params:
+        items = items[: int(query_params["sysparm_limit"])]
+
+    logger.info("Found request items", item_count=len(items))
+
+    # Return ServiceNow-style response
+    return {"result": items}
+
+
+@app.patch("/api/now/table/sc_req_item/{sys_id}")
+async def update_request_item_endpoint(
+    sys_id: str,
+    updates: Dict[str, Any],
+    api_key: Optional[str] = Depends(get_api_key),
+) -> Dict[str, Any]:
+    """Update a request item, e.g. set state to close it.
+
+    This endpoint mimics ServiceNow's Table API record update.
+    """
+    item = update_request_item(sys_id, updates)
+    if item is None:
+        raise HTTPException(status_code=404, detail="Record not found")
 
-    # Return empty result as requested
-    return {"result": []}
+    logger.info("Updated request item", sys_id=sys_id, fields=list(updates))
+    return {"result": item}
 
 
 @app.exception_handler(Exception)
@@ -0,0 +1,86 @@
+"""Tests for mock ServiceNow latency, error and throttling profiles."""
+
+import asyncio
+import random
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from mock_servicenow import server
+from mock_servicenow.faults import (
+    FaultInjector,
+    LatencyDistribution,
+    Throttled,
+    endpoint_name,
+    load_profiles,
+)
+
+
+def test_lognormal_latency_matches_p99_target() -> None:
+    """Test that sampled latencies follow the configured median and p99."""
+    latency = LatencyDistribution(distribution="lognormal", median_ms=50, p99_ms=500)
+    rng = random.Random(1)
+    samples = sorted(latency.sample(rng) for _ in range(20000))
+
+    assert samples[10000] == pytest.approx(0.050, rel=0.05)
+    assert samples[19800] == pytest.approx(0.500, rel=0.1)
+
+
+def test_invalid_profile_is_rejected() -> None:
+    """Test that inconsistent profiles fail at startup."""
+    with pytest.raises(ValueError):
+        load_profiles('{"sys_user": {"latency": {"distribution": "uniform"}}}')
+    with pytest.raises(ValueError):
+        load_profiles('{"sys_user": {"error_rate": 1.5}}')
+
+
+def test_endpoint_name() -> None:
+    """Test mapping request paths to profile names."""
+    assert endpoint_name("/api/now/table/sys_user") == "sys_user"
+    assert endpoint_name("/api/now/table/sc_req_item/ritm_1") == "sc_req_item"
+    assert endpoint_name("/api/sn_sc/servicecatalog/items/x/order_now") == "order_now"
+
+
+def test_injected_errors_carry_retry_after() -> None:
+    """Test that profiled endpoints fail with the configured status codes."""
+    injector = FaultInjector(
+        load_profiles(
+            '{"sys_user": {"error_rate": 1.0, "error_statuses": [429],'
+            ' "retry_after": 3}}'
+        )
+    )
+    client = TestClient(server.app)
+
+    with patch.object(server, "fault_injector", injector):
+        failed = client.get(
+            "/api/now/table/sys_user",
+            params={"sysparm_query": "email=alice.johnson@company.com"},
+        )
+        unprofiled = client.get(
+            "/api/now/table/cmdb_ci_computer",
+            params={"sysparm_query": "assigned_to=1001"},
+        )
+
+    assert failed.status_code == 429
+    assert failed.headers["retry-after"] == "3"
+    assert failed.json()["status"] == "failure"
+    assert unprofiled.status_code == 200
+    assert injector.active == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_throttled() -> None:
+    """Test that requests beyond the concurrency and queue limits are rejected."""
+    injector = FaultInjector({}, max_concurrency=1, max_queued=1)
+
+    await injector.acquire()
+    waiting = asyncio.create_task(injector.acquire())
+    await asyncio.sleep(0)
+    with pytest.raises(Throttled):
+        await injector.acquire()
+
+    injector.release()
+    await waiting
+    assert injector.active == 1
+    assert injector.rejected == 1
+    injector.release()
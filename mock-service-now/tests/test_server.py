@@ -1,6 +1,7 @@
 """Tests for mock ServiceNow server."""
 
 from fastapi.testclient import TestClient
+from mock_servicenow.data import clear_request_items, generate_employee_data
 from mock_servicenow.server import app
 
 client = TestClient(app)
@@ -79,6 +80,31 @@ def test_get_computers_by_user_sys_id() -> None:
     assert computer["model_id"]["display_value"] == "Latitude 7420"
 
 
+def test_get_computers_by_user_email() -> None:
+    """Test dot-walked computer lookup by assigned user email."""
+    response = client.get(
+        "/api/now/table/cmdb_ci_computer",
+        params={
+            "sysparm_query": "assigned_to.email=alice.johnson@company.com",
+            "sysparm_display_value": "true",
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["result"]) == 1
+
+    computer = data["result"][0]
+    assert computer["serial_number"] == "DL7420001"
+    assert computer["assigned_to.sys_id"] == "1001"
+    assert computer["assigned_to.name"] == "Alice Johnson"
+
+    response = client.get(
+        "/api/now/table/cmdb_ci_computer",
+        params={"sysparm_query": "assigned_to.email=nobody@company.com"},
+    )
+    assert response.json()["result"] == []
+
+
 def test_create_laptop_refresh_request() -> None:
     """Test creating a laptop refresh request."""
     request_data = {
@@ -140,3 +166,56 @@ def test_api_key_optional() -> None:
         headers={"x-sn-apikey": "test-key"},
     )
     assert response.status_code == 200
+
+
+def test_request_items_reflect_orders() -> None:
+    """Test that ordered laptops show up as open request items until closed."""
+    clear_request_items()
+    order_url = "/api/sn_sc/servicecatalog/items/test_laptop_refresh_id/order_now"
+    for choice in ("apple_mac_book_air_m_3", "lenovo_think_pad_t_14_s_gen_5"):
+        client.post(
+            order_url,
+            json={
+                "variables": {
+                    "laptop_choices": choice,
+                    "who_is_this_request_for": "1002",
+                }
+            },
+        )
+    query = {
+        "sysparm_query": "who_is_this_request_for=1002^stateIN1,2"
+        "^cat_item=test_laptop_refresh_id",
+        "sysparm_fields": "sys_id,number,variables.laptop_choices,state,request.number",
+    }
+
+    items = client.get("/api/now/table/sc_req_item", params=query).json()["result"]
+    assert [item["variables.laptop_choices"] for item in items] == [
+        "apple_mac_book_air_m_3",
+        "lenovo_think_pad_t_14_s_gen_5",
+    ]
+    assert all(item["request.number"].startswith("REQ") for item in items)
+
+    response = client.patch(
+        f"/api/now/table/sc_req_item/{items[0]['sys_id']}", json={"state": "3"}
+    )
+    assert response.status_code == 200
+    items = client.get("/api/now/table/sc_req_item", params=query).json()["result"]
+    assert len(items) == 1
+
+    other_user = {**query, "sysparm_query": "who_is_this_request_for=1001"}
+    assert client.get("/api/now/table/sc_req_item", params=other_user).json() == {
+        "result": []
+    }
+    clear_request_items()
+
+
+def test_generate_employee_data_is_deterministic() -> None:
+    """Test that the synthetic directory depends only on count and seed."""
+    employees = generate_employee_data(1000, seed=7)
+
+    assert employees == generate_employee_data(1000, seed=7)
+    assert employees != generate_employee_data(1000, seed=8)
+    assert len(employees) == 1000
+    assert len({user["sys_id"] for user in employees.values()}) == 1000
+    email, user = next(iter(employees.items()))
+    assert email == user["email"] and email.endswith(".0@company.com")
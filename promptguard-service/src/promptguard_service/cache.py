@@ -0,0 +1,108 @@
+"""Content-hash LRU cache of classification results."""
+
+import asyncio
+import hashlib
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+R = TypeVar("R")
+
+
+def content_key(model_id: str, text: str) -> str:
+    """Hash of the model and the normalized text, used as the cache key."""
+    normalized = unicodedata.normalize("NFC", text).strip()
+    digest = hashlib.sha256()
+    digest.update(model_id.encode())
+    digest.update(b"\0")
+    digest.update(normalized.encode())
+    return digest.hexdigest()
+
+
+class ResultCache(Generic[R]):
+    """Bounded LRU of results keyed by content hash.
+
+    Only hashes are stored, not the classified text. Concurrent lookups of a
+    key that is still being computed share that computation, so e.g. the same
+    text passing the input and output shields at once is classified once.
+    With ``ttl`` > 0, entries expire that many seconds after being cached.
+    """
+
+    def __init__(self, max_size: int = 4096, ttl: float = 0) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        # key -> (expiry on the monotonic clock, or None, result)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], R]]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Future[R]"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[R]:
+        """Return the cached result, marking it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def set(self, key: str, result: R) -> None:
+        """Cache a result, evicting the least recently used entry if full."""
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else None
+        self._entries[key] = (expires_at, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[R]]) -> R:
+        """Return the cached result or compute it, sharing one computation per key."""
+        while True:
+            result = self.get(key)
+            if result is not None:
+                self.hits += 1
+                return result
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                # Shield so a disconnecting client does not cancel the shared
+                # computation
+                result = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not inflight.cancelled() or (task and task.cancelling()):
+                    raise  # this waiter was cancelled
+                # The owner was cancelled, not this waiter: compute it again
+                continue
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        future: "asyncio.Future[R]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await compute()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so an unawaited failure is not logged by asyncio
+                future.exception()
+            raise
+        else:
+            self.set(key, result)
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
@@ -0,0 +1,166 @@
+"""ONNX Runtime backend with dynamic int8 quantization for CPU inference.
+
+Requires the optional ``onnxruntime`` and ``onnx`` packages. The classifier is
+exported once and cached on disk; run this module to export at image build time:
+
+    python -m promptguard_service.onnx_backend
+"""
+
+import importlib.util
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from shared_models import configure_logging
+
+logger = configure_logging("promptguard-service")
+
+FP32_MODEL_FILE = "model.onnx"
+INT8_MODEL_FILE = "model.int8.onnx"
+
+BACKEND_TORCH = "torch"
+BACKEND_ONNX = "onnx"
+BACKENDS = (BACKEND_TORCH, BACKEND_ONNX)
+
+
+def resolve_backend(requested: str) -> str:
+    """Return the backend to serve, falling back to torch when unavailable.
+
+    ``onnx`` needs the optional ``onnxruntime`` package; without it, or for an
+    unknown value, the transformers model is served instead of failing startup.
+    """
+    backend = requested.strip().lower()
+    if backend not in BACKENDS:
+        logger.warning(
+            "Unknown PROMPTGUARD_BACKEND, using torch",
+            configured=requested,
+            supported=list(BACKENDS),
+        )
+        return BACKEND_TORCH
+    if backend == BACKEND_ONNX and importlib.util.find_spec("onnxruntime") is None:
+        logger.warning("onnxruntime is not installed, falling back to torch backend")
+        return BACKEND_TORCH
+    return backend
+
+
+def default_onnx_dir(model_id: str) -> Path:
+    """Directory the exported model for ``model_id`` is cached in."""
+    base = os.getenv(
+        "PROMPTGUARD_ONNX_DIR", os.path.expanduser("~/.cache/promptguard/onnx")
+    )
+    return Path(base) / model_id.replace("/", "--")
+
+
+def export_onnx_model(
+    model_id: str,
+    output_dir: Path,
+    hf_token: Optional[str] = None,
+    quantize: bool = True,
+) -> Path:
+    """Export the classifier to ONNX, optionally int8-quantized, if not cached.
+
+    Args:
+        model_id: Hugging Face model identifier
+        output_dir: Directory to write the ONNX files to
+        hf_token: Hugging Face token for gated models
+        quantize: Apply dynamic int8 quantization to the exported model
+
+    Returns:
+        Path to the ONNX model to serve
+    """
+    fp32_path = output_dir / FP32_MODEL_FILE
+    int8_path = output_dir / INT8_MODEL_FILE
+    target = int8_path if quantize else fp32_path
+    if target.exists():
+        return target
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if not fp32_path.exists():
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        logger.info("Exporting PromptGuard model to ONNX", model_id=model_id)
+        tokenizer = AutoTokenizer.from_pretrained(model_id, token=hf_token)
+        model = AutoModelForSequenceClassification.from_pretrained(
+            model_id, token=hf_token
+        ).eval()
+        sample = tokenizer(
+            ["example input"], return_tensors="pt", return_token_type_ids=False
+        )
+        tmp_path = fp32_path.with_suffix(".tmp")
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                (sample["input_ids"], sample["attention_mask"]),
+                str(tmp_path),
+                input_names=["input_ids", "attention_mask"],
+                output_names=["logits"],
+                dynamic_axes={
+                    "input_ids": {0: "batch", 1: "sequence"},
+                    "attention_mask": {0: "batch", 1: "sequence"},
+                    "logits": {0: "batch"},
+                },
+                opset_version=17,
+                dynamo=False,
+            )
+        # Rename once complete so a crashed export is never picked up
+        os.replace(tmp_path, fp32_path)
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        logger.info("Quantizing ONNX model to int8", model_id=model_id)
+        tmp_path = int8_path.with_suffix(".tmp")
+        quantize_dynamic(str(fp32_path), str(tmp_path), weight_type=QuantType.QInt8)
+        os.replace(tmp_path, int8_path)
+
+    logger.info("ONNX model ready", path=str(target))
+    return target
+
+
+class OnnxSequenceClassifier:
+    """Sequence classifier served through an ONNX Runtime CPU session."""
+
+    def __init__(self, model_path: Path, intra_op_threads: int = 0) -> None:
+        """
+        Args:
+            model_path: Path to the exported ONNX model
+            intra_op_threads: Threads per operator; 0 lets ONNX Runtime decide
+        """
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = max(0, intra_op_threads)
+        # Batches run one at a time on the inference thread
+        options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(
+            str(model_path), options, providers=["CPUExecutionProvider"]
+        )
+
+    def predict_proba(
+        self, input_ids: np.ndarray, attention_mask: np.ndarray
+    ) -> np.ndarray:
+        """Return class probabilities with shape (batch, num_labels)."""
+        (logits,) = self.session.run(
+            ["logits"],
+            {
+                "input_ids": input_ids.astype(np.int64),
+                "attention_mask": attention_mask.astype(np.int64),
+            },
+        )
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=-1, keepdims=True)
+
+
+if __name__ == "__main__":
+    model_id = os.getenv("PROMPTGUARD_MODEL_ID", "meta-llama/Llama-Prompt-Guard-2-86M")
+    export_onnx_model(
+        model_id,
+        default_onnx_dir(model_id),
+        hf_token=os.getenv("HF_TOKEN"),
+        quantize=os.getenv("PROMPTGUARD_ONNX_QUANTIZE", "true").lower() == "true",
+    )
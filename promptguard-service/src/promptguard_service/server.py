@@ -1,8 +1,9 @@
 import os
 from contextlib import asynccontextmanager
 from functools import lru_cache
-from typing import List
+from typing import List, NamedTuple, Optional
 
+import numpy as np
 import torch
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,6 +13,17 @@ from tracing_config.auto_tracing import run as auto_tracing_run
 from transformers import AutoModelForSequenceClassification, AutoTokenizer
 
 from . import __version__
+from .batching import MicroBatcher
+from .cache import ResultCache, content_key
+from .onnx_backend import (
+    BACKEND_ONNX,
+    BACKEND_TORCH,
+    OnnxSequenceClassifier,
+    default_onnx_dir,
+    export_onnx_model,
+    resolve_backend,
+)
+from .windowing import UNSAFE_LABEL, classify_windows, split_windows
 
 # Configure logging and tracing
 SERVICE_NAME = "promptguard-service"
@@ -19,6 +31,23 @@ logger = configure_logging(SERVICE_NAME)
 auto_tracing_run(SERVICE_NAME, logger)
 
 MODEL_ID = os.getenv("PROMPTGUARD_MODEL_ID", "meta-llama/Llama-Prompt-Guard-2-86M")
+MAX_BATCH_SIZE = int(os.getenv("PROMPTGUARD_MAX_BATCH_SIZE", "16"))
+BATCH_WAIT_MS = float(os.getenv("PROMPTGUARD_BATCH_WAIT_MS", "5"))
+CACHE_SIZE = int(os.getenv("PROMPTGUARD_CACHE_SIZE", "4096"))
+CACHE_TTL = float(os.getenv("PROMPTGUARD_CACHE_TTL", "0"))
+# Longer inputs are classified as overlapping windows of MAX_LENGTH tokens
+MAX_LENGTH = int(os.getenv("PROMPTGUARD_MAX_LENGTH", "512"))
+WINDOW_OVERLAP = int(os.getenv("PROMPTGUARD_WINDOW_OVERLAP", "64"))
+MAX_WINDOWS_PER_PASS = max(1, int(os.getenv("PROMPTGUARD_MAX_WINDOWS_PER_PASS", "32")))
+# Per-input window limit so one huge paste cannot hold the single inference
+# thread; larger inputs are flagged unsafe. 0 (the default) disables the limit
+MAX_WINDOWS = max(0, int(os.getenv("PROMPTGUARD_MAX_WINDOWS", "0")))
+# Remaining windows of an input are skipped once one is this confidently unsafe
+EARLY_EXIT_CONFIDENCE = float(os.getenv("PROMPTGUARD_EARLY_EXIT_CONFIDENCE", "0.9"))
+# "torch" serves the transformers model; "onnx" serves an ONNX Runtime export
+BACKEND = resolve_backend(os.getenv("PROMPTGUARD_BACKEND", BACKEND_TORCH))
+ONNX_QUANTIZE = os.getenv("PROMPTGUARD_ONNX_QUANTIZE", "true").lower() == "true"
+ONNX_THREADS = int(os.getenv("PROMPTGUARD_ONNX_THREADS", "0"))
 
 
 class ChatMessage(BaseModel):
@@ -30,6 +59,12 @@ class ChatCompletionRequest(BaseModel):
     messages: List[ChatMessage]
 
 
+class Classification(NamedTuple):
+    prediction: int
+    confidence: float
+    prompt_tokens: int
+
+
 def _parse_llama_guard_template(content: str) -> str:
     """Extract user message from Llama Guard template."""
     if "<BEGIN CONVERSATION>" not in content:
@@ -54,6 +89,22 @@ def _parse_llama_guard_template(content: str) -> str:
 def load_model():
     """Load model once at startup."""
     hf_token = os.getenv("HF_TOKEN")
+
+    if BACKEND == BACKEND_ONNX:
+        logger.info(
+            "Loading PromptGuard model with ONNX Runtime",
+            model_id=MODEL_ID,
+            quantize=ONNX_QUANTIZE,
+            intra_op_threads=ONNX_THREADS,
+        )
+        tokenizer = AutoTokenizer.from_pretrained(MODEL_ID, token=hf_token)
+        model_path = export_onnx_model(
+            MODEL_ID, default_onnx_dir(MODEL_ID), hf_token, quantize=ONNX_QUANTIZE
+        )
+        model = OnnxSequenceClassifier(model_path, intra_op_threads=ONNX_THREADS)
+        logger.info("Model loaded successfully", path=str(model_path))
+        return model, tokenizer, torch.device("cpu")
+
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
     logger.info("Loading PromptGuard model", model_id=MODEL_ID, device=str(device))
@@ -65,11 +116,90 @@ def load_model():
     return model, tokenizer, device
 
 
+def _predict_proba(windows: List[List[int]]) -> np.ndarray:
+    """Return class probabilities for token windows in one padded forward pass."""
+    model, tokenizer, device = load_model()
+
+    if BACKEND == BACKEND_ONNX:
+        inputs = tokenizer.pad({"input_ids": windows}, return_tensors="np")
+        return model.predict_proba(inputs["input_ids"], inputs["attention_mask"])
+
+    inputs = tokenizer.pad({"input_ids": windows}, return_tensors="pt").to(device)
+    with torch.no_grad():
+        logits = model(**inputs).logits
+        return torch.softmax(logits, dim=-1).cpu().numpy()
+
+
+def classify_batch(texts: List[str]) -> List[Classification]:
+    """Classify texts on the inference thread.
+
+    Inputs longer than MAX_LENGTH tokens are split into overlapping windows
+    instead of being truncated, so an injection at the end of a long message
+    is still seen. With MAX_WINDOWS set, inputs needing more windows are
+    flagged unsafe. See ``classify_windows`` for batching and early exit.
+    """
+    _, tokenizer, _ = load_model()
+    token_ids = tokenizer(texts, add_special_tokens=False)["input_ids"]
+
+    special_tokens = tokenizer.num_special_tokens_to_add(pair=False)
+    windows = [
+        [
+            tokenizer.build_inputs_with_special_tokens(window)
+            for window in split_windows(
+                ids, MAX_LENGTH - special_tokens, WINDOW_OVERLAP
+            )
+        ]
+        for ids in token_ids
+    ]
+    results = classify_windows(
+        windows,
+        _predict_proba,
+        MAX_WINDOWS_PER_PASS,
+        EARLY_EXIT_CONFIDENCE,
+        MAX_WINDOWS,
+    )
+    return [
+        Classification(prediction, confidence, len(ids) + special_tokens)
+        for (prediction, confidence), ids in zip(results, token_ids)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _completion_tokens(result: str) -> int:
+    """Token count of a response label; the label set is fixed, so count once."""
+    _, tokenizer, _ = load_model()
+    return len(tokenizer(result)["input_ids"])
+
+
+_result_cache: ResultCache[Classification] = ResultCache(
+    max_size=CACHE_SIZE, ttl=CACHE_TTL
+)
+_batcher: Optional[MicroBatcher[str, Classification]] = None
+
+
+def get_batcher() -> MicroBatcher[str, Classification]:
+    """Return the running inference queue, starting it on first use."""
+    global _batcher
+    if _batcher is None:
+        _batcher = MicroBatcher(
+            classify_batch,
+            max_batch_size=MAX_BATCH_SIZE,
+            max_wait=BATCH_WAIT_MS / 1000,
+        )
+    _batcher.start()
+    return _batcher
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Lifespan for model preloading."""
+    """Lifespan for model preloading and the inference queue."""
+    global _batcher
     load_model()
+    get_batcher()
     yield
+    if _batcher is not None:
+        await _batcher.stop()
+        _batcher = None
 
 
 app = FastAPI(
@@ -113,8 +243,6 @@ async def models():
 async def chat_completions(request: ChatCompletionRequest):
     """Llama Guard protocol endpoint for prompt injection detection."""
     try:
-        model, tokenizer, device = load_model()
-
         # Extract user message
         user_msg = next(
             (m.content for m in reversed(request.messages) if m.role == "user"), ""
@@ -133,28 +261,25 @@ async def chat_completions(request: ChatCompletionRequest):
                 detail="Empty message after template parsing",
             )
 
-        # Run inference
-        inputs = tokenizer(
-            user_msg, return_tensors="pt", truncation=True, max_length=512
-        ).to(device)
-        prompt_tokens = inputs["input_ids"].shape[1]
-
-        with torch.no_grad():
-            logits = model(**inputs).logits
-            probabilities = torch.softmax(logits, dim=-1)
-            prediction = torch.argmax(probabilities, dim=-1).item()
-            confidence = probabilities[0][prediction].item()
+        # Run inference, batched with concurrent requests, unless the same
+        # text was already classified
+        prediction, confidence, prompt_tokens = await _result_cache.get_or_compute(
+            content_key(MODEL_ID, user_msg),
+            lambda: get_batcher().submit(user_msg),
+        )
 
         # Translate PromptGuard output to Llama Guard format: "unsafe\nS9" or "safe"
         # S9 maps prompt injection attacks to Llama Guard's category system to catch the malicious intent.
-        result = "unsafe\nS9" if prediction == 1 else "safe"
-        completion_tokens = tokenizer(result, return_tensors="pt")["input_ids"].shape[1]
+        result = "unsafe\nS9" if prediction == UNSAFE_LABEL else "safe"
+        completion_tokens = _completion_tokens(result)
 
         logger.info(
             "Classification result",
             result=result,
             confidence=round(confidence, 4),
             message_length=len(user_msg),
+            cache_hits=_result_cache.hits,
+            cache_misses=_result_cache.misses,
         )
 
         return {
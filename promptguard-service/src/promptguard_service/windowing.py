@@ -0,0 +1,87 @@
+"""Sliding-window classification of inputs longer than the model's max length."""
+
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from shared_models import configure_logging
+
+logger = configure_logging("promptguard-service")
+
+SAFE_LABEL = 0
+UNSAFE_LABEL = 1
+
+
+def split_windows(
+    token_ids: List[int], window_size: int, overlap: int
+) -> List[List[int]]:
+    """Split token ids into windows of ``window_size`` sharing ``overlap`` tokens."""
+    stride = max(1, window_size - overlap)
+    starts = range(0, max(len(token_ids) - overlap, 1), stride)
+    return [token_ids[start : start + window_size] for start in starts]
+
+
+def classify_windows(
+    windows: Sequence[Sequence[List[int]]],
+    predict_proba: Callable[[List[List[int]]], np.ndarray],
+    max_windows_per_pass: int,
+    early_exit_confidence: float,
+    max_windows: int = 0,
+) -> List[Tuple[int, float]]:
+    """Classify each input from its windows, returning (prediction, confidence).
+
+    Windows of all inputs are batched into ``predict_proba`` calls of up to
+    ``max_windows_per_pass`` windows, and an input's remaining windows are
+    skipped once one of them is unsafe with ``early_exit_confidence``. An
+    input is unsafe if any window is; otherwise it is safe with the lowest
+    window confidence.
+
+    With ``max_windows`` > 0, an input needing more windows is reported unsafe
+    without being classified: it is too large to check within the limit, and
+    classifying only some of its windows could miss an injection.
+    """
+    over_limit = [0 < max_windows < len(w) for w in windows]
+    for input_windows, over in zip(windows, over_limit):
+        if over:
+            logger.warning(
+                "Input exceeds window limit, flagging as unsafe",
+                windows=len(input_windows),
+                max_windows=max_windows,
+            )
+
+    # (input index, window) pairs, interleaved so every input's first windows
+    # are classified before any input's later ones
+    pending = []
+    for depth in range(max((len(w) for w in windows), default=0)):
+        for index, input_windows in enumerate(windows):
+            if depth < len(input_windows) and not over_limit[index]:
+                pending.append((index, input_windows[depth]))
+
+    unsafe_confidence: List[Optional[float]] = [
+        1.0 if over else None for over in over_limit
+    ]
+    safe_confidence = [1.0] * len(windows)
+    done = [False] * len(windows)
+
+    while pending:
+        chunk = pending[:max_windows_per_pass]
+        pending = pending[max_windows_per_pass:]
+        probabilities = predict_proba([window for _, window in chunk])
+
+        for (index, _), probs in zip(chunk, probabilities):
+            prediction = int(probs.argmax())
+            confidence = float(probs[prediction])
+            if prediction == UNSAFE_LABEL:
+                unsafe_confidence[index] = max(
+                    unsafe_confidence[index] or 0, confidence
+                )
+                if confidence >= early_exit_confidence:
+                    done[index] = True
+            else:
+                safe_confidence[index] = min(safe_confidence[index], confidence)
+
+        pending = [(index, window) for index, window in pending if not done[index]]
+
+    return [
+        (UNSAFE_LABEL, unsafe) if unsafe is not None else (SAFE_LABEL, safe)
+        for unsafe, safe in zip(unsafe_confidence, safe_confidence)
+    ]
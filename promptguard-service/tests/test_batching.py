@@ -0,0 +1,107 @@
+"""Tests for micro-batching of inference requests."""
+
+import asyncio
+import threading
+from typing import List
+
+import pytest
+from promptguard_service.batching import MicroBatcher
+
+
+class RecordingModel:
+    """Batch function that records batches and the thread they ran on."""
+
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+        self.threads: List[str] = []
+
+    def __call__(self, items: List[str]) -> List[str]:
+        self.batches.append(list(items))
+        self.threads.append(threading.current_thread().name)
+        return [item.upper() for item in items]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_a_batch() -> None:
+    """Requests arriving within max_wait run in one batch on the worker thread."""
+    model = RecordingModel()
+    batcher: MicroBatcher[str, str] = MicroBatcher(model, max_wait=0.05)
+    batcher.start()
+    try:
+        results = await asyncio.gather(*(batcher.submit(t) for t in "abc"))
+    finally:
+        await batcher.stop()
+
+    assert list(results) == ["A", "B", "C"]
+    assert model.batches == [["a", "b", "c"]]
+    assert model.threads[0].startswith("promptguard-inference")
+
+
+@pytest.mark.asyncio
+async def test_batch_size_is_bounded() -> None:
+    """Batches never exceed max_batch_size; the rest form the next batch."""
+    model = RecordingModel()
+    batcher: MicroBatcher[str, str] = MicroBatcher(
+        model, max_batch_size=2, max_wait=0.05
+    )
+    batcher.start()
+    try:
+        results = await asyncio.gather(*(batcher.submit(t) for t in "abcde"))
+    finally:
+        await batcher.stop()
+
+    assert list(results) == ["A", "B", "C", "D", "E"]
+    assert model.batches == [["a", "b"], ["c", "d"], ["e"]]
+
+
+@pytest.mark.asyncio
+async def test_lone_request_flushed_after_max_wait() -> None:
+    """A single request is not held back waiting for a full batch."""
+    model = RecordingModel()
+    batcher: MicroBatcher[str, str] = MicroBatcher(
+        model, max_batch_size=16, max_wait=0.01
+    )
+    batcher.start()
+    try:
+        assert await asyncio.wait_for(batcher.submit("x"), timeout=1) == "X"
+    finally:
+        await batcher.stop()
+
+    assert model.batches == [["x"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_error_propagates_to_every_request() -> None:
+    """A failed batch fails all its requests; later batches still run."""
+    calls = 0
+
+    def flaky(items: List[str]) -> List[str]:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ValueError("model failure")
+        return items
+
+    batcher: MicroBatcher[str, str] = MicroBatcher(flaky, max_wait=0.05)
+    batcher.start()
+    try:
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+        assert await batcher.submit("c") == "c"
+    finally:
+        await batcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_submit_requires_running_queue() -> None:
+    """Submitting before start or after stop fails fast."""
+    batcher: MicroBatcher[str, str] = MicroBatcher(RecordingModel())
+    with pytest.raises(RuntimeError):
+        await batcher.submit("a")
+
+    batcher.start()
+    await batcher.stop()
+    with pytest.raises(RuntimeError):
+        await batcher.submit("a")
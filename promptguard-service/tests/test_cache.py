@@ -0,0 +1,136 @@
+"""Tests for the content-hash classification cache."""
+
+import asyncio
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from promptguard_service.cache import ResultCache, content_key
+
+
+def test_content_key_normalizes_text() -> None:
+    """Keys ignore surrounding whitespace and Unicode form, not the model."""
+    assert content_key("m", " café ") == content_key("m", "café")
+    assert content_key("m", "text") != content_key("other", "text")
+
+
+def test_lru_eviction() -> None:
+    """The least recently used entry is evicted when full."""
+    cache: ResultCache[str] = ResultCache(max_size=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"  # "b" is now least recently used
+    cache.set("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert len(cache) == 2
+
+
+def test_ttl_expiry() -> None:
+    """Entries expire ``ttl`` seconds after being cached."""
+    cache: ResultCache[str] = ResultCache(ttl=10)
+    with patch("promptguard_service.cache.time.monotonic", return_value=100.0):
+        cache.set("a", "A")
+    with patch("promptguard_service.cache.time.monotonic", return_value=109.0):
+        assert cache.get("a") == "A"
+    with patch("promptguard_service.cache.time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_zero_size_disables_cache() -> None:
+    """max_size 0 stores nothing."""
+    cache: ResultCache[str] = ResultCache(max_size=0)
+    cache.set("a", "A")
+    assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_computation() -> None:
+    """Concurrent misses for a key compute once; later lookups are hits."""
+    cache: ResultCache[str] = ResultCache()
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in "abc"))
+    assert list(results) == ["result"] * 3
+    assert await cache.get_or_compute("k", compute) == "result"
+
+    assert calls == 1
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_failure_is_shared_and_not_cached() -> None:
+    """Waiters see the owner's error, and the next lookup computes again."""
+    cache: ResultCache[str] = ResultCache()
+    attempts: List[int] = []
+
+    async def compute() -> str:
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise ValueError("model failure")
+        return "result"
+
+    results = await asyncio.gather(
+        cache.get_or_compute("k", compute),
+        cache.get_or_compute("k", compute),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    assert await cache.get_or_compute("k", compute) == "result"
+
+
+@pytest.mark.asyncio
+async def test_waiters_recompute_when_owner_is_cancelled() -> None:
+    """Cancelling the owner does not cancel requests waiting on its result."""
+    cache: ResultCache[str] = ResultCache()
+    started = asyncio.Event()
+
+    async def slow() -> str:
+        started.set()
+        await asyncio.sleep(10)
+        return "slow"
+
+    async def fast() -> str:
+        return "fast"
+
+    owner = asyncio.create_task(cache.get_or_compute("k", slow))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_compute("k", fast))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    assert await waiter == "fast"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_owner() -> None:
+    """A waiter going away leaves the shared computation running."""
+    cache: ResultCache[str] = ResultCache()
+    release = asyncio.Event()
+
+    async def compute() -> str:
+        await release.wait()
+        return "result"
+
+    owner = asyncio.create_task(cache.get_or_compute("k", compute))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_compute("k", compute))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    release.set()
+    assert await owner == "result"
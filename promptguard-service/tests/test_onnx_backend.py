@@ -0,0 +1,90 @@
+"""Tests for ONNX Runtime backend selection and model export caching."""
+
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from promptguard_service.onnx_backend import (
+    FP32_MODEL_FILE,
+    INT8_MODEL_FILE,
+    OnnxSequenceClassifier,
+    default_onnx_dir,
+    export_onnx_model,
+    resolve_backend,
+)
+
+
+class TestResolveBackend:
+    """Tests for resolve_backend."""
+
+    def test_torch_is_default(self) -> None:
+        """The transformers backend is served unless onnx is requested."""
+        assert resolve_backend("torch") == "torch"
+
+    def test_onnx_when_runtime_installed(self) -> None:
+        """onnx is selected (case-insensitively) when onnxruntime is importable."""
+        with patch("importlib.util.find_spec", return_value=MagicMock()):
+            assert resolve_backend(" ONNX ") == "onnx"
+
+    def test_onnx_falls_back_without_runtime(self) -> None:
+        """Without onnxruntime the service starts on the torch backend."""
+        with patch("importlib.util.find_spec", return_value=None):
+            assert resolve_backend("onnx") == "torch"
+
+    def test_unknown_backend_falls_back(self) -> None:
+        """An unknown value is logged and served with torch."""
+        assert resolve_backend("tensorrt") == "torch"
+
+
+class TestExportOnnxModel:
+    """Tests for export_onnx_model caching."""
+
+    @pytest.mark.parametrize(
+        "quantize,expected", [(True, INT8_MODEL_FILE), (False, FP32_MODEL_FILE)]
+    )
+    def test_cached_export_is_reused(
+        self, tmp_path: Path, quantize: bool, expected: str
+    ) -> None:
+        """An existing export is returned without exporting or quantizing again."""
+        (tmp_path / FP32_MODEL_FILE).write_bytes(b"fp32")
+        (tmp_path / INT8_MODEL_FILE).write_bytes(b"int8")
+
+        assert export_onnx_model("org/model", tmp_path, quantize=quantize) == (
+            tmp_path / expected
+        )
+
+    def test_export_dir_per_model(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Exports are cached per model under PROMPTGUARD_ONNX_DIR."""
+        monkeypatch.setenv("PROMPTGUARD_ONNX_DIR", "/models/onnx")
+        assert default_onnx_dir("meta-llama/Prompt-Guard") == Path(
+            "/models/onnx/meta-llama--Prompt-Guard"
+        )
+
+
+class FakeSession:
+    """Stands in for an onnxruntime.InferenceSession returning fixed logits."""
+
+    def __init__(self, logits: np.ndarray) -> None:
+        self.logits = logits
+        self.feeds: List[Dict[str, Any]] = []
+
+    def run(self, output_names: List[str], feeds: Dict[str, Any]) -> List[np.ndarray]:
+        self.feeds.append(feeds)
+        return [self.logits]
+
+
+def test_predict_proba_applies_softmax() -> None:
+    """Logits are converted to probabilities and inputs passed as int64."""
+    classifier = OnnxSequenceClassifier.__new__(OnnxSequenceClassifier)
+    session = FakeSession(np.array([[0.0, 0.0], [1000.0, 0.0]]))
+    classifier.session = session
+
+    probs = classifier.predict_proba(
+        np.array([[1, 2], [3, 4]], dtype=np.int32), np.ones((2, 2), dtype=np.int32)
+    )
+
+    np.testing.assert_allclose(probs, [[0.5, 0.5], [1.0, 0.0]])
+    assert session.feeds[0]["input_ids"].dtype == np.int64
+    assert session.feeds[0]["attention_mask"].dtype == np.int64
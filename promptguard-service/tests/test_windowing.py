@@ -0,0 +1,102 @@
+"""Tests for sliding-window classification of long inputs."""
+
+from typing import Callable, List
+
+import numpy as np
+from promptguard_service.windowing import (
+    SAFE_LABEL,
+    UNSAFE_LABEL,
+    classify_windows,
+    split_windows,
+)
+
+
+class TestSplitWindows:
+    """Tests for split_windows."""
+
+    def test_short_input_is_one_window(self) -> None:
+        """Inputs up to the window size are not split."""
+        assert split_windows(list(range(10)), 10, 3) == [list(range(10))]
+        assert split_windows([], 10, 3) == [[]]
+
+    def test_windows_overlap_and_cover_the_end(self) -> None:
+        """Consecutive windows share ``overlap`` tokens and the last reaches the end."""
+        windows = split_windows(list(range(25)), 10, 3)
+
+        assert [w[0] for w in windows] == [0, 7, 14, 21]
+        for previous, current in zip(windows, windows[1:]):
+            assert previous[-3:] == current[:3]
+        assert windows[-1][-1] == 24
+
+
+def _predictor(
+    unsafe: float, calls: List[List[List[int]]]
+) -> Callable[[List[List[int]]], np.ndarray]:
+    """Fake model: windows containing token 666 are unsafe with ``unsafe``."""
+
+    def predict_proba(windows: List[List[int]]) -> np.ndarray:
+        calls.append(windows)
+        return np.array(
+            [[1 - unsafe, unsafe] if 666 in w else [0.8, 0.2] for w in windows]
+        )
+
+    return predict_proba
+
+
+class TestClassifyWindows:
+    """Tests for classify_windows."""
+
+    def test_unsafe_if_any_window_is(self) -> None:
+        """An input is unsafe if any window is, otherwise safe."""
+        calls: List[List[List[int]]] = []
+        results = classify_windows(
+            [[[1], [2]], [[3], [666]]], _predictor(0.7, calls), 32, 0.9
+        )
+
+        assert results[0] == (SAFE_LABEL, 0.8)
+        assert results[1][0] == UNSAFE_LABEL
+        assert len(calls) == 1  # all windows in one pass
+
+    def test_early_exit_skips_remaining_windows(self) -> None:
+        """A confidently unsafe window stops classification of the rest of its input."""
+        calls: List[List[List[int]]] = []
+        windows = [[[666], [1], [2], [3]], [[4], [5], [6], [7]]]
+
+        results = classify_windows(windows, _predictor(0.95, calls), 2, 0.9)
+
+        assert results[0] == (UNSAFE_LABEL, 0.95)
+        assert results[1] == (SAFE_LABEL, 0.8)
+        # First pass holds each input's first window; input 0 then drops out
+        assert calls[0] == [[666], [4]]
+        assert [w for call in calls for w in call] == [[666], [4], [5], [6], [7]]
+
+    def test_low_confidence_unsafe_does_not_exit(self) -> None:
+        """Unsafe windows below the early-exit confidence do not skip the rest."""
+        calls: List[List[List[int]]] = []
+
+        classify_windows([[[666], [1], [2]]], _predictor(0.6, calls), 1, 0.9)
+
+        assert len(calls) == 3
+
+    def test_injection_in_middle_window_is_found(self) -> None:
+        """Without a window limit every window of a long input is classified."""
+        token_ids = list(range(100))
+        token_ids[55] = 666
+        windows = split_windows(token_ids, 10, 0)
+        calls: List[List[List[int]]] = []
+
+        results = classify_windows([windows], _predictor(0.95, calls), 32, 0.9)
+
+        assert results == [(UNSAFE_LABEL, 0.95)]
+
+    def test_input_over_window_limit_is_unsafe(self) -> None:
+        """Inputs over ``max_windows`` are flagged unsafe without classification."""
+        long_input = split_windows(list(range(100)), 10, 0)
+        calls: List[List[List[int]]] = []
+
+        results = classify_windows(
+            [long_input, [[1]]], _predictor(0.95, calls), 32, 0.9, max_windows=5
+        )
+
+        assert results == [(UNSAFE_LABEL, 1.0), (SAFE_LABEL, 0.8)]
+        assert calls == [[[1]]]
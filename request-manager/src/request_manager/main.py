@@ -19,6 +19,7 @@ from shared_models import (
     CloudEventHandler,
     CloudEventSender,
     EventTypes,
+    QueryTrackingMiddleware,
     configure_logging,
     create_cloudevent_response,
     create_health_check_endpoint,
@@ -178,6 +179,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Record database queries and pool waits per request
+app.add_middleware(QueryTrackingMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
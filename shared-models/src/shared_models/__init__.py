@@ -23,6 +23,9 @@ from .database import (
     get_db_utc_now,
 )
 
+# Export database metrics
+from .db_metrics import QueryTrackingMiddleware, track_queries
+
 # Export CloudEvent utilities
 from .events import (
     CloudEventBuilder,
@@ -118,6 +121,8 @@ __all__ = [
     "get_db_session",
     "get_db_session_dependency",
     "get_db_utc_now",
+    "QueryTrackingMiddleware",
+    "track_queries",
     "acquire_agent_session_lock",
     "release_agent_session_lock",
     "session_id_to_lock_key",
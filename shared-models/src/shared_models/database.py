@@ -1,6 +1,7 @@
 """Unified database utilities for all services."""
 
 import os
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from typing import Any, AsyncGenerator, Dict, List, Optional, Type, TypeVar, cast
@@ -12,6 +13,15 @@ from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
+from .db_metrics import (
+    TimedAsyncAdaptedQueuePool,
+    TimedAsyncCursor,
+    TimedCursor,
+    instrument_engine,
+    record_checkout_wait,
+    register_pool_stats,
+)
+
 logger = structlog.get_logger()
 
 T = TypeVar("T", bound=DeclarativeBase)
@@ -38,6 +48,24 @@ class DatabaseConfig:
         self.sync_pool_min_size = int(os.getenv("DB_SYNC_POOL_MIN_SIZE", "1"))
         self.sync_pool_max_size = int(os.getenv("DB_SYNC_POOL_MAX_SIZE", "5"))
         self.sync_pool_timeout = int(os.getenv("DB_SYNC_POOL_TIMEOUT", "30"))
+        self.sync_pool_max_idle = float(os.getenv("DB_SYNC_POOL_MAX_IDLE", "600"))
+
+        # Async connection pool settings (for AsyncPostgresSaver/LangGraph).
+        # Sizes and timeout default to the sync pool settings.
+        self.async_pool_min_size = int(
+            os.getenv("DB_ASYNC_POOL_MIN_SIZE", str(self.sync_pool_min_size))
+        )
+        self.async_pool_max_size = int(
+            os.getenv("DB_ASYNC_POOL_MAX_SIZE", str(self.sync_pool_max_size))
+        )
+        self.async_pool_timeout = int(
+            os.getenv("DB_ASYNC_POOL_TIMEOUT", str(self.sync_pool_timeout))
+        )
+        self.async_pool_max_idle = float(os.getenv("DB_ASYNC_POOL_MAX_IDLE", "600"))
+        # Open the async pool and wait for min_size connections at startup
+        self.async_pool_prewarm = (
+            os.getenv("DB_ASYNC_POOL_PREWARM", "false").lower() == "true"
+        )
 
         # PostgreSQL session timeouts (ms). statement_timeout must exceed SESSION_LOCK_WAIT_TIMEOUT
         # so lock operations are not cancelled (request-manager override sets this for lock polling).
@@ -100,6 +128,7 @@ class DatabaseManager:
         self.engine = create_async_engine(
             self.config.connection_string,
             echo=self.config.echo_sql,
+            poolclass=TimedAsyncAdaptedQueuePool,  # Records checkout wait time
             pool_pre_ping=True,  # Verify connections before use
             pool_recycle=self.config.pool_recycle,  # Recycle connections periodically
             pool_size=self.config.pool_size,
@@ -118,6 +147,9 @@ class DatabaseManager:
             },
         )
 
+        # Time every statement for query count/duration metrics
+        instrument_engine(self.engine.sync_engine)
+
         # Create session maker
         self.async_session = async_sessionmaker(
             self.engine,
@@ -131,6 +163,34 @@ class DatabaseManager:
         # Create async connection pool for AsyncPostgresSaver
         self._async_pool: Optional[psycopg_pool.AsyncConnectionPool] = None
 
+        register_pool_stats(self._pool_stats)
+
+    def _pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """Connection counts by state for each pool, for metrics."""
+        pool = self.engine.pool
+        stats = {
+            "sqlalchemy": {
+                "in_use": pool.checkedout(),  # type: ignore[attr-defined]
+                "idle": pool.checkedin(),  # type: ignore[attr-defined]
+                "max": self.config.pool_size + self.config.max_overflow,
+            }
+        }
+        for name, checkpoint_pool in (
+            ("psycopg_sync", self._sync_pool),
+            ("psycopg_async", self._async_pool),
+        ):
+            if checkpoint_pool is not None:
+                pool_stats = checkpoint_pool.get_stats()
+                size = pool_stats.get("pool_size", 0)
+                idle = pool_stats.get("pool_available", 0)
+                stats[name] = {
+                    "in_use": size - idle,
+                    "idle": idle,
+                    "waiting": pool_stats.get("requests_waiting", 0),
+                    "max": checkpoint_pool.max_size,
+                }
+        return stats
+
     async def log_database_config(self) -> None:
         """Log database configuration and test connection at startup."""
         try:
@@ -180,15 +240,18 @@ class DatabaseManager:
                 kwargs={
                     "row_factory": psycopg.rows.dict_row,
                     "autocommit": True,
+                    "cursor_factory": TimedCursor,
                 },
                 check=psycopg_pool.ConnectionPool.check_connection,  # Validate connections
                 timeout=self.config.sync_pool_timeout,  # Configurable timeout
+                max_idle=self.config.sync_pool_max_idle,  # Close idle connections above min_size
             )
             logger.debug(
                 "Created sync connection pool for PostgresSaver",
                 min_size=self.config.sync_pool_min_size,
                 max_size=self.config.sync_pool_max_size,
                 timeout=self.config.sync_pool_timeout,
+                max_idle=self.config.sync_pool_max_idle,
             )
 
         return self._sync_pool
@@ -207,9 +270,16 @@ class DatabaseManager:
                 database=self.config.database,
             )
 
-        # Type ignore needed because psycopg_pool returns Connection[tuple[Any, ...]]
-        # but we configure it with row_factory=psycopg.rows.dict_row
-        return pool.getconn()  # type: ignore[return-value]
+        start = time.perf_counter()
+        failed = True
+        try:
+            # Type ignore needed because psycopg_pool returns Connection[tuple[Any, ...]]
+            # but we configure it with row_factory=psycopg.rows.dict_row
+            conn = pool.getconn()
+            failed = False
+            return conn  # type: ignore[return-value]
+        finally:
+            record_checkout_wait(time.perf_counter() - start, "psycopg_sync", failed)
 
     def put_sync_connection(self, conn: psycopg.Connection[dict[str, Any]]) -> None:
         """Return a sync connection to the pool."""
@@ -226,23 +296,53 @@ class DatabaseManager:
 
             self._async_pool = psycopg_pool.AsyncConnectionPool(
                 conn_string,
-                min_size=self.config.sync_pool_min_size,
-                max_size=self.config.sync_pool_max_size,
+                min_size=self.config.async_pool_min_size,
+                max_size=self.config.async_pool_max_size,
                 kwargs={
                     "row_factory": psycopg.rows.dict_row,
                     "autocommit": True,
+                    "cursor_factory": TimedAsyncCursor,
                 },
-                timeout=self.config.sync_pool_timeout,
+                timeout=self.config.async_pool_timeout,
+                max_idle=self.config.async_pool_max_idle,
             )
             logger.debug(
                 "Created async connection pool for AsyncPostgresSaver",
-                min_size=self.config.sync_pool_min_size,
-                max_size=self.config.sync_pool_max_size,
-                timeout=self.config.sync_pool_timeout,
+                min_size=self.config.async_pool_min_size,
+                max_size=self.config.async_pool_max_size,
+                timeout=self.config.async_pool_timeout,
+                max_idle=self.config.async_pool_max_idle,
             )
 
         return self._async_pool
 
+    async def prewarm_async_pool(self) -> None:
+        """Open the async pool and wait until min_size connections are ready.
+
+        Avoids paying connection setup on the first requests after startup.
+        Failure is logged and not fatal. psycopg_pool closes a pool that does
+        not fill in time, so it is dropped and the next checkout creates a
+        fresh one.
+        """
+        pool = self._get_async_pool()
+        start = time.perf_counter()
+        try:
+            await pool.open(wait=True, timeout=self.config.async_pool_timeout)
+            logger.info(
+                "Async connection pool pre-warmed",
+                min_size=self.config.async_pool_min_size,
+                duration_ms=round((time.perf_counter() - start) * 1000, 1),
+            )
+        except Exception as e:
+            if self._async_pool is pool:
+                await pool.close()
+                self._async_pool = None
+            logger.warning(
+                "Async connection pool pre-warm failed",
+                min_size=self.config.async_pool_min_size,
+                error=str(e),
+            )
+
     async def get_async_connection(self) -> Any:
         """Get an asynchronous connection for LangGraph AsyncPostgresSaver.
 
@@ -257,7 +357,14 @@ class DatabaseManager:
                 database=self.config.database,
             )
 
-        return await pool.getconn()
+        start = time.perf_counter()
+        failed = True
+        try:
+            conn = await pool.getconn()
+            failed = False
+            return conn
+        finally:
+            record_checkout_wait(time.perf_counter() - start, "psycopg_async", failed)
 
     async def put_async_connection(self, conn: Any) -> None:
         """Return an async connection to the pool."""
@@ -0,0 +1,304 @@
+"""Database query and connection pool metrics for observability.
+
+Uses OpenTelemetry metrics API. When a MeterProvider is configured (e.g.
+tracing-config's OTLP exporter via OTEL_EXPORTER_OTLP_ENDPOINT), these metrics
+are exported. Otherwise no-ops via NoOpMeterProvider, and when the
+opentelemetry package is not installed recording is skipped entirely.
+
+Pools are labelled ``sqlalchemy`` (the async engine), ``psycopg_sync`` and
+``psycopg_async`` (the LangGraph checkpointer pools). Queries run while a
+``track_queries`` scope is active - one per HTTP request with
+``QueryTrackingMiddleware`` - are also summed per request, so N+1 patterns and
+pool waits show up per endpoint.
+"""
+
+import functools
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+import psycopg
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+T = TypeVar("T")
+
+# Pool stats providers: each returns {pool_name: {state: connections}}
+_pool_stats_providers: List[Callable[[], Optional[Dict[str, Dict[str, int]]]]] = []
+
+
+def _suppress_metrics_errors(func: Callable[..., T]) -> Callable[..., T]:
+    """Suppress exceptions in metrics recording (no-op if MeterProvider not configured)."""
+
+    @functools.wraps(func)
+    def wrapper(*args: object, **kwargs: object) -> T | None:
+        try:
+            return func(*args, **kwargs)
+        except Exception:  # noqa: BLE001
+            return None
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _observe_pool_connections(options: Any) -> Iterator[Any]:
+    """Yield connection counts by pool and state for the observable gauge."""
+    for provider in list(_pool_stats_providers):
+        try:
+            stats = provider()
+        except Exception:  # noqa: BLE001
+            continue
+        for pool, states in (stats or {}).items():
+            for state, value in states.items():
+                yield Observation(value, {"pool": pool, "state": state})
+
+
+try:
+    from opentelemetry import metrics
+    from opentelemetry.metrics import Counter, Histogram, Observation
+
+    _meter = metrics.get_meter(
+        "shared-models.database",
+        version="0.1.0",
+    )
+    _query_duration: Optional[Histogram] = _meter.create_histogram(
+        name="db_query_duration_seconds",
+        description="Time to execute one database statement",
+        unit="s",
+    )
+    _request_queries: Optional[Histogram] = _meter.create_histogram(
+        name="db_request_queries",
+        description="Database statements executed per request",
+        unit="1",
+    )
+    _request_query_duration: Optional[Histogram] = _meter.create_histogram(
+        name="db_request_query_duration_seconds",
+        description="Total time in database statements per request",
+        unit="s",
+    )
+    _request_pool_wait: Optional[Histogram] = _meter.create_histogram(
+        name="db_request_pool_wait_seconds",
+        description="Total time waiting for pooled connections per request",
+        unit="s",
+    )
+    _checkout_wait: Optional[Histogram] = _meter.create_histogram(
+        name="db_pool_checkout_wait_seconds",
+        description="Time waiting to check a connection out of a pool",
+        unit="s",
+    )
+    _checkout_timeout_total: Optional[Counter] = _meter.create_counter(
+        name="db_pool_checkout_timeout_total",
+        description="Connection checkouts that failed or timed out",
+        unit="1",
+    )
+    _meter.create_observable_gauge(
+        name="db_pool_connections",
+        callbacks=[_observe_pool_connections],
+        description="Pool connections by state (in_use, idle, waiting, max)",
+        unit="1",
+    )
+except Exception:  # noqa: BLE001
+    _query_duration = None
+    _request_queries = None
+    _request_query_duration = None
+    _request_pool_wait = None
+    _checkout_wait = None
+    _checkout_timeout_total = None
+
+
+@dataclass
+class QueryStats:
+    """Database work done within one ``track_queries`` scope."""
+
+    queries: int = 0
+    query_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "db_query_stats", default=None
+)
+
+
+@contextmanager
+def track_queries(operation: str) -> Iterator[QueryStats]:
+    """Sum statements and pool waits in this context and record them on exit.
+
+    Tasks started inside the scope share its stats, so work they finish
+    before the scope ends is included.
+
+    Args:
+        operation: Low-cardinality label for the unit of work, e.g. a route
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+        record_request_stats(stats, operation)
+
+
+@_suppress_metrics_errors
+def record_query(seconds: float, pool: str) -> None:
+    """Record one executed statement."""
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += seconds
+    if _query_duration is not None:
+        _query_duration.record(seconds, {"pool": pool})
+
+
+@_suppress_metrics_errors
+def record_checkout_wait(seconds: float, pool: str, failed: bool = False) -> None:
+    """Record time spent waiting for a pooled connection."""
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.pool_wait_seconds += seconds
+    if _checkout_wait is not None:
+        _checkout_wait.record(seconds, {"pool": pool})
+    if failed and _checkout_timeout_total is not None:
+        _checkout_timeout_total.add(1, {"pool": pool})
+
+
+@_suppress_metrics_errors
+def record_request_stats(stats: QueryStats, operation: str) -> None:
+    """Record per-request totals."""
+    attributes = {"operation": operation}
+    if _request_queries is not None:
+        _request_queries.record(stats.queries, attributes)
+    if _request_query_duration is not None:
+        _request_query_duration.record(stats.query_seconds, attributes)
+    if _request_pool_wait is not None:
+        _request_pool_wait.record(stats.pool_wait_seconds, attributes)
+
+
+def register_pool_stats(
+    provider: Callable[[], Optional[Dict[str, Dict[str, int]]]],
+) -> None:
+    """Report pool connection counts from ``provider`` on each metrics export.
+
+    Bound methods are held weakly so a discarded DatabaseManager stops
+    reporting instead of being kept alive.
+    """
+    if hasattr(provider, "__self__"):
+        method = weakref.WeakMethod(provider)
+
+        def weak_provider() -> Optional[Dict[str, Dict[str, int]]]:
+            bound = method()
+            if bound is None:
+                _pool_stats_providers.remove(weak_provider)
+                return None
+            return bound()
+
+        _pool_stats_providers.append(weak_provider)
+    else:
+        _pool_stats_providers.append(provider)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """SQLAlchemy async queue pool that records checkout wait time."""
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        failed = True
+        try:
+            connection = super()._do_get()
+            failed = False
+            return connection
+        finally:
+            record_checkout_wait(time.perf_counter() - start, "sqlalchemy", failed)
+
+
+def instrument_engine(engine: Engine, pool: str = "sqlalchemy") -> None:
+    """Time every statement executed through a SQLAlchemy engine.
+
+    For an AsyncEngine pass ``engine.sync_engine``.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        conn: Any, cursor: Any, statement: Any, parameters: Any, context: Any, many: Any
+    ) -> None:
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        conn: Any, cursor: Any, statement: Any, parameters: Any, context: Any, many: Any
+    ) -> None:
+        start_times = conn.info.get("query_start_times")
+        if start_times:
+            record_query(time.perf_counter() - start_times.pop(), pool)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context: Any) -> None:
+        conn = exception_context.connection
+        start_times = conn.info.get("query_start_times") if conn is not None else None
+        if start_times:
+            record_query(time.perf_counter() - start_times.pop(), pool)
+
+
+class TimedCursor(psycopg.Cursor[Any]):
+    """psycopg cursor that records statement time (sync checkpointer pool)."""
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return super().execute(*args, **kwargs)
+        finally:
+            record_query(time.perf_counter() - start, "psycopg_sync")
+
+    def executemany(self, *args: Any, **kwargs: Any) -> None:
+        start = time.perf_counter()
+        try:
+            super().executemany(*args, **kwargs)
+        finally:
+            record_query(time.perf_counter() - start, "psycopg_sync")
+
+
+class TimedAsyncCursor(psycopg.AsyncCursor[Any]):
+    """psycopg cursor that records statement time (async checkpointer pool)."""
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return await super().execute(*args, **kwargs)
+        finally:
+            record_query(time.perf_counter() - start, "psycopg_async")
+
+    async def executemany(self, *args: Any, **kwargs: Any) -> None:
+        start = time.perf_counter()
+        try:
+            await super().executemany(*args, **kwargs)
+        finally:
+            record_query(time.perf_counter() - start, "psycopg_async")
+
+
+class QueryTrackingMiddleware:
+    """ASGI middleware that wraps each HTTP request in ``track_queries``.
+
+    The operation label is the matched route template (e.g.
+    ``POST /api/v1/requests/{request_id}``), so it stays low-cardinality.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_stats.reset(token)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            record_request_stats(stats, f"{scope['method']} {path}")
@@ -6,12 +6,15 @@ import os
 import random
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import structlog
 from cloudevents.conversion import to_structured
 from cloudevents.http import CloudEvent
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = structlog.get_logger()
 
 
@@ -212,9 +215,23 @@ class CloudEventBuilder:
 class CloudEventSender:
     """Sender for CloudEvents to brokers with retry on transient failures."""
 
-    def __init__(self, broker_url: str, service_name: str):
+    def __init__(
+        self,
+        broker_url: str,
+        service_name: str,
+        http_client: Optional["httpx.AsyncClient"] = None,
+    ):
+        """Create a sender.
+
+        Args:
+            broker_url: Broker endpoint events are POSTed to.
+            service_name: Used as the CloudEvent source.
+            http_client: Optional long-lived client to reuse pooled connections.
+                When None, a short-lived client is opened per send.
+        """
         self.broker_url = broker_url
         self.service_name = service_name
+        self.http_client = http_client
         self.builder = CloudEventBuilder(service_name, service_name)
         self.max_retries = int(os.getenv("EVENT_MAX_RETRIES", "3"))
         self.base_delay = float(os.getenv("EVENT_BASE_DELAY", "1.0"))
@@ -323,27 +340,35 @@ class CloudEventSender:
                     max_attempts=effective_retries + 1,
                 )
 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
+                if self.http_client is not None:
+                    response = await self.http_client.post(
                         self.broker_url,
                         headers=headers,
                         content=data,
                         timeout=30.0,
                     )
-                    logger.debug(
-                        "HTTP response received",
-                        status_code=response.status_code,
-                        broker_url=self.broker_url,
-                    )
-                    response.raise_for_status()
+                else:
+                    async with httpx.AsyncClient() as client:
+                        response = await client.post(
+                            self.broker_url,
+                            headers=headers,
+                            content=data,
+                            timeout=30.0,
+                        )
+                logger.debug(
+                    "HTTP response received",
+                    status_code=response.status_code,
+                    broker_url=self.broker_url,
+                )
+                response.raise_for_status()
 
-                    logger.debug(
-                        "CloudEvent sent successfully",
-                        event_type=event["type"],
-                        event_id=event["id"],
-                        status_code=response.status_code,
-                    )
-                    return True
+                logger.debug(
+                    "CloudEvent sent successfully",
+                    event_type=event["type"],
+                    event_id=event["id"],
+                    status_code=response.status_code,
+                )
+                return True
 
             except Exception as e:
                 last_error = e
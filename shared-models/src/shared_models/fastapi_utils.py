@@ -146,6 +146,9 @@ async def create_shared_lifespan(
         # Log database configuration and test connection
         await db_manager.log_database_config()
 
+        if db_manager.config.async_pool_prewarm:
+            await db_manager.prewarm_async_pool()
+
     except Exception as e:
         logger.error("Failed to verify database migration", error=str(e))
         raise
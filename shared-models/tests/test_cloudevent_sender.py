@@ -74,3 +74,23 @@ class TestCloudEventSenderMaxRetries:
 
         assert result is False
         assert len(post_calls) == 4  # 1 + 3 retries
+
+
+class TestCloudEventSenderSharedClient:
+    """Tests for the optional injected http_client."""
+
+    @pytest.mark.asyncio
+    async def test_uses_injected_client(self) -> None:
+        """When http_client is provided, no per-call AsyncClient is created."""
+        resp = MagicMock(status_code=202, raise_for_status=MagicMock())
+        shared = MagicMock(post=AsyncMock(return_value=resp))
+
+        with patch("httpx.AsyncClient") as client_cls:
+            sender = CloudEventSender(
+                "http://broker.example/", "test-service", http_client=shared
+            )
+            result = await sender.send_request_event({"content": "test"})
+
+        assert result is True
+        shared.post.assert_awaited_once()
+        client_cls.assert_not_called()
@@ -0,0 +1,59 @@
+"""Tests for checkpointer connection pool configuration."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from shared_models import DatabaseManager
+from shared_models.database import DatabaseConfig
+
+
+def test_async_pool_defaults_to_sync_settings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Async pool sizes fall back to the sync pool settings unless overridden."""
+    monkeypatch.setenv("DB_SYNC_POOL_MIN_SIZE", "2")
+    monkeypatch.setenv("DB_SYNC_POOL_MAX_SIZE", "6")
+    monkeypatch.setenv("DB_ASYNC_POOL_MAX_SIZE", "10")
+    config = DatabaseConfig()
+
+    assert config.async_pool_min_size == 2
+    assert config.async_pool_max_size == 10
+    assert config.async_pool_timeout == config.sync_pool_timeout
+    assert config.async_pool_max_idle == 600
+    assert config.async_pool_prewarm is False
+
+
+async def test_prewarm_waits_for_async_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pre-warming opens the async pool with its own settings and waits for it."""
+    monkeypatch.setenv("DB_ASYNC_POOL_MIN_SIZE", "3")
+    monkeypatch.setenv("DB_ASYNC_POOL_TIMEOUT", "12")
+    manager = DatabaseManager()
+
+    with patch("psycopg_pool.AsyncConnectionPool") as pool_class:
+        pool_class.return_value.open = AsyncMock()
+        await manager.prewarm_async_pool()
+
+    assert pool_class.call_args.kwargs["min_size"] == 3
+    assert pool_class.call_args.kwargs["timeout"] == 12
+    pool_class.return_value.open.assert_awaited_once_with(wait=True, timeout=12)
+
+
+async def test_prewarm_failure_is_not_fatal() -> None:
+    """A pool that cannot fill in time is replaced on the next checkout."""
+    manager = DatabaseManager()
+    failed_pool = MagicMock()
+    failed_pool.open = AsyncMock(side_effect=TimeoutError)
+    failed_pool.close = AsyncMock()
+    fresh_pool = MagicMock()
+    fresh_pool.getconn = AsyncMock(return_value="connection")
+
+    with patch(
+        "psycopg_pool.AsyncConnectionPool", side_effect=[failed_pool, fresh_pool]
+    ):
+        await manager.prewarm_async_pool()
+        assert manager._async_pool is None
+        failed_pool.close.assert_awaited_once()
+
+        assert await manager.get_async_connection() == "connection"
+
+    assert manager._async_pool is fresh_pool
@@ -0,0 +1,101 @@
+"""Tests for database query and connection pool metrics."""
+
+import gc
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from shared_models import (
+    DatabaseManager,
+    QueryTrackingMiddleware,
+    db_metrics,
+    track_queries,
+)
+from shared_models.db_metrics import (
+    TimedAsyncAdaptedQueuePool,
+    instrument_engine,
+    record_query,
+    register_pool_stats,
+)
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+
+def test_engine_statements_counted_per_scope() -> None:
+    """Statements, including failed ones, are summed into the active scope."""
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+
+    with patch("shared_models.db_metrics.record_request_stats") as record:
+        with track_queries("test") as stats:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+                with pytest.raises(OperationalError):
+                    conn.execute(text("SELECT * FROM missing_table"))
+
+    assert stats.queries == 3
+    assert stats.query_seconds > 0
+    record.assert_called_once_with(stats, "test")
+
+
+def test_queries_outside_scope_not_counted() -> None:
+    """Without a track_queries scope only the per-statement histogram is fed."""
+    with track_queries("outer") as stats:
+        pass
+    record_query(0.01, "sqlalchemy")
+    assert stats.queries == 0
+
+
+def test_middleware_labels_by_route_template() -> None:
+    """Per-request stats are labelled by method and route template."""
+    app = FastAPI()
+    app.add_middleware(QueryTrackingMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str) -> dict[str, str]:
+        record_query(0.001, "sqlalchemy")
+        record_query(0.002, "psycopg_async")
+        return {"id": item_id}
+
+    with patch("shared_models.db_metrics.record_request_stats") as record:
+        response = TestClient(app).get("/items/42")
+
+    assert response.status_code == 200
+    stats, operation = record.call_args.args
+    assert operation == "GET /items/{item_id}"
+    assert stats.queries == 2
+
+
+def test_database_manager_reports_pool_stats() -> None:
+    """DatabaseManager uses the timed pool and reports connection counts."""
+    manager = DatabaseManager()
+
+    assert isinstance(manager.engine.pool, TimedAsyncAdaptedQueuePool)
+    stats = manager._pool_stats()
+    assert stats["sqlalchemy"]["in_use"] == 0
+    assert stats["sqlalchemy"]["max"] == (
+        manager.config.pool_size + manager.config.max_overflow
+    )
+    # Checkpointer pools are created lazily
+    assert "psycopg_async" not in stats
+
+
+def test_discarded_manager_stops_reporting() -> None:
+    """Pool stats providers are held weakly."""
+
+    class Provider:
+        def stats(self) -> dict[str, dict[str, int]]:
+            return {"test": {"in_use": 1}}
+
+    provider = Provider()
+    before = len(db_metrics._pool_stats_providers)
+    register_pool_stats(provider.stats)
+    assert db_metrics._pool_stats_providers[-1]() == {"test": {"in_use": 1}}
+
+    weak_provider = db_metrics._pool_stats_providers[-1]
+    del provider
+    gc.collect()
+    assert weak_provider() is None
+    assert len(db_metrics._pool_stats_providers) == before
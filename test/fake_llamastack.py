@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Deterministic fake LlamaStack server for load testing and offline benchmarks.
+
+Implements the parts of the LlamaStack API agent-service uses - responses,
+moderations, models, files and vector_stores - in memory, so the full
+LangGraph flow can run on a laptop with no GPU and no network. Routes are
+served both under /v1 (llama-stack-client) and under /v1/openai/v1 (OpenAI
+client).
+
+Replies are scripted: rules are tried against the input messages, most recent
+message first, and the first rule whose pattern matches decides the reply.
+Without a matching rule the default reply is used. A built-in rule answers
+"Respond with only ...: A, B, or C" prompts (intent classifiers and
+validators) with the first option that is not RETURN_TO_ROUTER, so flows move
+forward instead of bouncing back to the router.
+
+Rules come from FAKE_LLAMASTACK_SCRIPT, a JSON list (or a path to a JSON file)
+tried before the built-in rule:
+
+    [
+      {"pattern": "laptop options", "reply": "VALID", "latency_ms": 200},
+      {"pattern": "(?i)eligib", "reply": "ELIGIBLE", "output_tokens": 1},
+      {"pattern": "ticket (INC\\\\d+)", "reply": "Your ticket is \\\\1"}
+    ]
+
+``reply`` may refer to groups of ``pattern``. ``latency_ms`` and
+``output_tokens`` override the defaults below for that rule.
+
+Environment:
+  FAKE_LLAMASTACK_MODEL          Model id served (default: fake/llm)
+  FAKE_LLAMASTACK_REPLY          Reply when no rule matches
+  FAKE_LLAMASTACK_SCRIPT         Scripted reply rules (see above)
+  FAKE_LLAMASTACK_LATENCY_MS     Fixed delay per response (default: 0)
+  FAKE_LLAMASTACK_MS_PER_TOKEN   Extra delay per output token (default: 0)
+  FAKE_LLAMASTACK_FLAG_PATTERN   Regex; moderation inputs matching it are flagged
+
+Usage:
+  python test/fake_llamastack.py --port 8321
+"""
+
+import argparse
+import asyncio
+import email.parser
+import email.policy
+import itertools
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, FastAPI, HTTPException, Request
+
+MODEL_ID = os.environ.get("FAKE_LLAMASTACK_MODEL", "fake/llm")
+REPLY_TEXT = os.environ.get(
+    "FAKE_LLAMASTACK_REPLY", "Thanks, I can help you with your laptop refresh."
+)
+LATENCY_MS = float(os.environ.get("FAKE_LLAMASTACK_LATENCY_MS", "0"))
+MS_PER_TOKEN = float(os.environ.get("FAKE_LLAMASTACK_MS_PER_TOKEN", "0"))
+FLAG_PATTERN = os.environ.get("FAKE_LLAMASTACK_FLAG_PATTERN")
+
+
+@dataclass
+class Rule:
+    """A scripted reply for inputs matching a pattern."""
+
+    pattern: str
+    reply: str
+    latency_ms: Optional[float] = None
+    output_tokens: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        self.regex = re.compile(self.pattern)
+
+
+# Answer "Respond with only ...: A, B, or C" with the first non-router option
+CHOICE_RULE = Rule(
+    r"Respond with (?:only|exactly)[^:\n]*:\s*(?:RETURN_TO_ROUTER,\s*)?([A-Z][A-Z_]*)",
+    r"\1",
+)
+DEFAULT_RULE = Rule("", REPLY_TEXT)
+
+
+def load_rules(value: Optional[str]) -> List[Rule]:
+    """Parse scripted rules from JSON or a JSON file path, then the built-ins."""
+    rules: List[Rule] = []
+    if value:
+        if not value.lstrip().startswith("["):
+            with open(value) as f:
+                value = f.read()
+        rules = [Rule(**spec) for spec in json.loads(value)]
+    return rules + [CHOICE_RULE]
+
+
+RULES = load_rules(os.environ.get("FAKE_LLAMASTACK_SCRIPT"))
+
+_ids = itertools.count(1)
+# In-memory state for the files and vector_stores APIs
+FILES: Dict[str, Dict[str, Any]] = {}
+VECTOR_STORES: Dict[str, Dict[str, Any]] = {}
+VECTOR_STORE_FILES: Dict[str, Dict[str, Dict[str, Any]]] = {}
+FILE_BATCHES: Dict[str, Dict[str, Any]] = {}
+
+router = APIRouter()
+
+
+def _new_id(prefix: str) -> str:
+    return f"{prefix}-{next(_ids)}"
+
+
+def _text(value: Any) -> str:
+    """Flatten message content into plain text."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return "\n".join(_text(item) for item in value)
+    if isinstance(value, dict):
+        return _text(value.get("content", value.get("text", "")))
+    return ""
+
+
+def _count_tokens(value: Any) -> int:
+    """Rough whitespace token count of a responses API input."""
+    return len(_text(value).split())
+
+
+def choose_reply(input_value: Any) -> Tuple[str, Rule]:
+    """Pick the reply for a responses API input.
+
+    Returns:
+        The reply text and the rule that produced it
+    """
+    messages = input_value if isinstance(input_value, list) else [input_value]
+    for message in reversed(messages):
+        text = _text(message)
+        for rule in RULES:
+            match = rule.regex.search(text)
+            if match:
+                return match.expand(rule.reply), rule
+    return REPLY_TEXT, DEFAULT_RULE
+
+
+@router.get("/models")
+async def list_models() -> Dict[str, Any]:
+    """List the single fake LLM."""
+    return {
+        "object": "list",
+        "data": [
+            {
+                "id": MODEL_ID,
+                "identifier": MODEL_ID,
+                "object": "model",
+                "created": 0,
+                "owned_by": "fake",
+                "model_type": "llm",
+                "custom_metadata": {"model_type": "llm"},
+            }
+        ],
+    }
+
+
+@router.post("/responses")
+async def create_response(request: Request) -> Dict[str, Any]:
+    """Return the scripted reply as a completed response."""
+    body = await request.json()
+    reply, rule = choose_reply(body.get("input", ""))
+    input_tokens = _count_tokens(body.get("input", ""))
+    output_tokens = (
+        rule.output_tokens if rule.output_tokens is not None else len(reply.split())
+    )
+    latency_ms = rule.latency_ms if rule.latency_ms is not None else LATENCY_MS
+    latency_ms += MS_PER_TOKEN * output_tokens
+    if latency_ms:
+        await asyncio.sleep(latency_ms / 1000)
+    response_id = next(_ids)
+    return {
+        "id": f"resp_{response_id}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "model": body.get("model", MODEL_ID),
+        "status": "completed",
+        "output": [
+            {
+                "type": "message",
+                "id": f"msg_{response_id}",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": reply, "annotations": []}],
+            }
+        ],
+        "parallel_tool_calls": False,
+        "temperature": body.get("temperature"),
+        "usage": {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        },
+    }
+
+
+@router.post("/moderations")
+async def create_moderation(request: Request) -> Dict[str, Any]:
+    """Flag inputs matching FAKE_LLAMASTACK_FLAG_PATTERN, pass everything else."""
+    body = await request.json()
+    inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+    results = []
+    for item in inputs:
+        flagged = bool(FLAG_PATTERN and re.search(FLAG_PATTERN, _text(item)))
+        results.append(
+            {
+                "flagged": flagged,
+                "categories": {"violence": flagged},
+                "category_scores": {"violence": 1.0 if flagged else 0.0},
+            }
+        )
+    return {
+        "id": f"modr_{next(_ids)}",
+        "model": body.get("model", ""),
+        "results": results,
+    }
+
+
+def _page(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Single-page list response in the OpenAI cursor format."""
+    return {
+        "object": "list",
+        "data": items,
+        "first_id": items[0]["id"] if items else None,
+        "last_id": items[-1]["id"] if items else None,
+        "has_more": False,
+    }
+
+
+def _parse_multipart(content_type: str, body: bytes) -> Dict[str, Tuple[str, bytes]]:
+    """Parse a multipart/form-data body into {name: (filename, data)}."""
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        fields[name] = (part.get_filename() or "", part.get_payload(decode=True))
+    return fields
+
+
+def _get_or_404(store: Dict[str, Dict[str, Any]], key: str) -> Dict[str, Any]:
+    if key not in store:
+        raise HTTPException(status_code=404, detail=f"{key} not found")
+    return store[key]
+
+
+def _file_counts(count: int) -> Dict[str, int]:
+    return {
+        "completed": count,
+        "failed": 0,
+        "in_progress": 0,
+        "cancelled": 0,
+        "total": count,
+    }
+
+
+@router.post("/files")
+async def create_file(request: Request) -> Dict[str, Any]:
+    """Store an uploaded file's metadata; content is discarded."""
+    fields = _parse_multipart(
+        request.headers.get("content-type", ""), await request.body()
+    )
+    filename, data = fields.get("file", ("", b""))
+    purpose = fields.get("purpose", ("", b"assistants"))[1].decode()
+    file = {
+        "id": _new_id("file"),
+        "object": "file",
+        "bytes": len(data),
+        "created_at": int(time.time()),
+        "expires_at": None,
+        "filename": filename,
+        "purpose": purpose,
+    }
+    FILES[file["id"]] = file
+    return file
+
+
+@router.get("/files")
+async def list_files() -> Dict[str, Any]:
+    """List uploaded files."""
+    return _page(list(FILES.values()))
+
+
+@router.get("/files/{file_id}")
+async def retrieve_file(file_id: str) -> Dict[str, Any]:
+    """Get an uploaded file's metadata."""
+    return _get_or_404(FILES, file_id)
+
+
+@router.delete("/files/{file_id}")
+async def delete_file(file_id: str) -> Dict[str, Any]:
+    """Delete an uploaded file."""
+    _get_or_404(FILES, file_id)
+    del FILES[file_id]
+    return {"id": file_id, "object": "file", "deleted": True}
+
+
+def _attach_file(
+    vector_store_id: str, file_id: str, attributes: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Attach a file to a vector store; indexing completes immediately."""
+    file = _get_or_404(FILES, file_id)
+    vs_file = {
+        "id": file_id,
+        "object": "vector_store.file",
+        "created_at": int(time.time()),
+        "vector_store_id": vector_store_id,
+        "status": "completed",
+        "usage_bytes": file["bytes"],
+        "attributes": attributes or {},
+        "chunking_strategy": {"type": "auto"},
+        "last_error": None,
+    }
+    VECTOR_STORE_FILES[vector_store_id][file_id] = vs_file
+    return vs_file
+
+
+@router.post("/vector_stores")
+async def create_vector_store(request: Request) -> Dict[str, Any]:
+    """Create a vector store, attaching any file_ids given."""
+    body = await request.json()
+    vector_store_id = _new_id("vs")
+    VECTOR_STORES[vector_store_id] = {
+        "id": vector_store_id,
+        "object": "vector_store",
+        "created_at": int(time.time()),
+        "name": body.get("name"),
+        "metadata": body.get("metadata") or {},
+        "status": "completed",
+        "usage_bytes": 0,
+        "expires_at": None,
+        "last_active_at": None,
+    }
+    VECTOR_STORE_FILES[vector_store_id] = {}
+    for file_id in body.get("file_ids") or []:
+        _attach_file(vector_store_id, file_id, None)
+    return await retrieve_vector_store(vector_store_id)
+
+
+@router.get("/vector_stores")
+async def list_vector_stores() -> Dict[str, Any]:
+    """List vector stores."""
+    return _page([await retrieve_vector_store(vs_id) for vs_id in VECTOR_STORES])
+
+
+@router.get("/vector_stores/{vector_store_id}")
+async def retrieve_vector_store(vector_store_id: str) -> Dict[str, Any]:
+    """Get a vector store."""
+    vector_store = _get_or_404(VECTOR_STORES, vector_store_id)
+    count = len(VECTOR_STORE_FILES[vector_store_id])
+    return {**vector_store, "file_counts": _file_counts(count)}
+
+
+@router.delete("/vector_stores/{vector_store_id}")
+async def delete_vector_store(vector_store_id: str) -> Dict[str, Any]:
+    """Delete a vector store."""
+    _get_or_404(VECTOR_STORES, vector_store_id)
+    del VECTOR_STORES[vector_store_id]
+    del VECTOR_STORE_FILES[vector_store_id]
+    return {"id": vector_store_id, "object": "vector_store.deleted", "deleted": True}
+
+
+@router.post("/vector_stores/{vector_store_id}/search")
+async def search_vector_store(vector_store_id: str, request: Request) -> Dict[str, Any]:
+    """Return no results; retrieval quality is out of scope for benchmarks."""
+    _get_or_404(VECTOR_STORES, vector_store_id)
+    body = await request.json()
+    return {
+        "object": "vector_store.search_results.page",
+        "search_query": body.get("query", ""),
+        "data": [],
+        "has_more": False,
+        "next_page": None,
+    }
+
+
+@router.post("/vector_stores/{vector_store_id}/files")
+async def create_vector_store_file(
+    vector_store_id: str, request: Request
+) -> Dict[str, Any]:
+    """Attach a file to a vector store."""
+    _get_or_404(VECTOR_STORES, vector_store_id)
+    body = await request.json()
+    return _attach_file(vector_store_id, body["file_id"], body.get("attributes"))
+
+
+@router.get("/vector_stores/{vector_store_id}/files")
+async def list_vector_store_files(vector_store_id: str) -> Dict[str, Any]:
+    """List the files in a vector store."""
+    _get_or_404(VECTOR_STORES, vector_store_id)
+    return _page(list(VECTOR_STORE_FILES[vector_store_id].values()))
+
+
+@router.get("/vector_stores/{vector_store_id}/files/{file_id}")
+async def retrieve_vector_store_file(
+    vector_store_id: str, file_id: str
+) -> Dict[str, Any]:
+    """Get a file in a vector store."""
+    _get_or_404(VECTOR_STORES, vector_store_id)
+    return _get_or_404(VECTOR_STORE_FILES[vector_store_id], file_id)
+
+
+@router.post("/vector_stores/{vector_store_id}/files/{file_id}")
+async def update_vector_store_file(
+    vector_store_id: str, file_id: str, request: Request
+) -> Dict[str, Any]:
+    """Replace a vector store file's attributes."""
+    vs_file = await retrieve_vector_store_file(vector_store_id, file_id)
+    vs_file["attributes"] = (await request.json()).get("attributes") or {}
+    return vs_file
+
+
+@router.delete("/vector_stores/{vector_store_id}/files/{file_id}")
+async def delete_vector_store_file(
+    vector_store_id: str, file_id: str
+) -> Dict[str, Any]:
+    """Detach a file from a vector store."""
+    await retrieve_vector_store_file(vector_store_id, file_id)
+    del VECTOR_STORE_FILES[vector_store_id][file_id]
+    return {"id": file_id, "object": "vector_store.file.deleted", "deleted": True}
+
+
+@router.post("/vector_stores/{vector_store_id}/file_batches")
+async def create_file_batch(vector_store_id: str, request: Request) -> Dict[str, Any]:
+    """Attach several files at once; the batch completes immediately."""
+    _get_or_404(VECTOR_STORES, vector_store_id)
+    body = await request.json()
+    for file_id in body["file_ids"]:
+        _attach_file(vector_store_id, file_id, body.get("attributes"))
+    batch = {
+        "id": _new_id("vsfb"),
+        "object": "vector_store.file_batch",
+        "created_at": int(time.time()),
+        "vector_store_id": vector_store_id,
+        "status": "completed",
+        "file_counts": _file_counts(len(body["file_ids"])),
+    }
+    FILE_BATCHES[batch["id"]] = batch
+    return batch
+
+
+@router.get("/vector_stores/{vector_store_id}/file_batches/{batch_id}")
+async def retrieve_file_batch(vector_store_id: str, batch_id: str) -> Dict[str, Any]:
+    """Get a file batch."""
+    return _get_or_404(FILE_BATCHES, batch_id)
+
+
+app = FastAPI(title="Fake LlamaStack")
+app.include_router(router, prefix="/v1")
+app.include_router(router, prefix="/v1/openai/v1")
+
+
+@app.get("/v1/health")
+async def health() -> Dict[str, str]:
+    """Health check endpoint."""
+    return {"status": "OK"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Fake LlamaStack server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8321)
+    args = parser.parse_args()
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
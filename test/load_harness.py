@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+End-to-end load-testing harness.
+
+Starts request-manager, agent-service, integration-dispatcher, the mock
+eventing service, mock ServiceNow and a deterministic fake LlamaStack as local
+processes against a local Postgres, then drives an open-loop arrival rate
+through /api/v1/requests/generic and reports latency percentiles, throughput,
+error rate and database round trips per turn.
+
+Arrivals follow a seeded Poisson process and are sent whether or not earlier
+requests have finished, so a saturated system shows up as growing latency and
+errors instead of a silently lower request rate.
+
+Requires uv and a Postgres reachable through the usual POSTGRES_* variables
+(POSTGRES_HOST defaults to localhost here). Database round trips are counted
+with pg_stat_statements when the extension is installed, otherwise committed
+and rolled back transactions are counted instead.
+
+Usage:
+  python test/load_harness.py --rate 5 --duration 60 --users 50
+  python test/load_harness.py --no-start --request-manager-url http://localhost:8080
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Prefix of the cluster URLs in mock-eventing-service's default subscriptions
+SERVICE_NAME = "loadtest"
+NAMESPACE = "local"
+
+
+class Service(NamedTuple):
+    """A local process started by the harness."""
+
+    name: str
+    project_dir: str
+    command: List[str]
+    port_offset: int
+    health_path: str
+
+
+def _uvicorn(app: str) -> List[str]:
+    return ["python", "-m", "uvicorn", app, "--host", "127.0.0.1", "--port", "{port}"]
+
+
+# Started in order; each must be healthy before the next starts
+SERVICES = [
+    Service(
+        "fake-llamastack",
+        "mock-service-now",
+        ["python", str(REPO_ROOT / "test" / "fake_llamastack.py"), "--port", "{port}"],
+        0,
+        "/v1/health",
+    ),
+    Service(
+        "mock-servicenow",
+        "mock-service-now",
+        _uvicorn("mock_servicenow.server:app"),
+        1,
+        "/health",
+    ),
+    Service(
+        "mock-eventing",
+        "mock-eventing-service",
+        _uvicorn("mock_eventing_service.main:app"),
+        2,
+        "/health",
+    ),
+    Service(
+        "agent-service",
+        "agent-service",
+        _uvicorn("agent_service.main:app"),
+        3,
+        "/health",
+    ),
+    Service(
+        "integration-dispatcher",
+        "integration-dispatcher",
+        _uvicorn("integration_dispatcher.main:app"),
+        4,
+        "/health",
+    ),
+    Service(
+        "request-manager",
+        "request-manager",
+        _uvicorn("request_manager.main:app"),
+        5,
+        "/health",
+    ),
+]
+
+
+class Result(NamedTuple):
+    """Outcome of one request."""
+
+    latency: float
+    ok: bool
+    error: Optional[str]
+
+
+def service_url(base_port: int, name: str) -> str:
+    """Local URL of a harness-managed service."""
+    service = next(s for s in SERVICES if s.name == name)
+    return f"http://127.0.0.1:{base_port + service.port_offset}"
+
+
+def service_env(base_port: int) -> Dict[str, str]:
+    """Environment shared by all services, pointing them at each other."""
+    env = dict(os.environ)
+    env.setdefault("POSTGRES_HOST", "localhost")
+    env.setdefault("LOG_LEVEL", "WARNING")
+    llamastack_port = base_port + SERVICES[0].port_offset
+    env.update(
+        {
+            "SERVICE_NAME": SERVICE_NAME,
+            "NAMESPACE": NAMESPACE,
+            "BROKER_URL": f"{service_url(base_port, 'mock-eventing')}/{NAMESPACE}/default",
+            "LLAMASTACK_SERVICE_HOST": "127.0.0.1",
+            "LLAMASTACK_CLIENT_PORT": str(llamastack_port),
+            "SERVICENOW_INSTANCE_URL": service_url(base_port, "mock-servicenow"),
+        }
+    )
+    # Tracing would measure the exporter too
+    env.pop("OTEL_EXPORTER_OTLP_ENDPOINT", None)
+    return env
+
+
+async def wait_healthy(url: str, process: subprocess.Popen, timeout: float) -> None:
+    """Wait until a service answers its health check."""
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(timeout=2.0) as client:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"{url} exited with code {process.returncode}")
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise TimeoutError(f"{url} not healthy after {timeout}s")
+
+
+async def start_services(
+    base_port: int, log_dir: Path, startup_timeout: float
+) -> List[subprocess.Popen]:
+    """Run migrations and start all services, returning their processes."""
+    env = service_env(base_port)
+    print("Running database migrations...")
+    subprocess.run(
+        ["uv", "run", "--directory", "agent-service", "python"]
+        + [str(REPO_ROOT / "shared-models" / "scripts" / "migrate.py")],
+        cwd=REPO_ROOT,
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+    processes: List[subprocess.Popen] = []
+    try:
+        for service in SERVICES:
+            port = base_port + service.port_offset
+            command = [part.format(port=port) for part in service.command]
+            log_file = open(log_dir / f"{service.name}.log", "w")
+            print(f"Starting {service.name} on port {port}...")
+            process = subprocess.Popen(
+                ["uv", "run", "--directory", service.project_dir] + command,
+                cwd=REPO_ROOT,
+                env=env,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            )
+            processes.append(process)
+            await wait_healthy(
+                f"http://127.0.0.1:{port}{service.health_path}",
+                process,
+                startup_timeout,
+            )
+        await route_subscriptions_locally(base_port)
+    except BaseException:
+        stop_services(processes)
+        raise
+    return processes
+
+
+def stop_services(processes: List[subprocess.Popen]) -> None:
+    """Stop services in reverse start order."""
+    for process in reversed(processes):
+        process.terminate()
+    for process in reversed(processes):
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+async def route_subscriptions_locally(base_port: int) -> None:
+    """Point the mock broker's default subscriptions at the local services."""
+    eventing_url = service_url(base_port, "mock-eventing")
+    replacements = {
+        f"http://{SERVICE_NAME}-{name}.{NAMESPACE}.svc.cluster.local": service_url(
+            base_port, name
+        )
+        for name in ("request-manager", "agent-service", "integration-dispatcher")
+    }
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        response = await client.get(f"{eventing_url}/subscriptions")
+        response.raise_for_status()
+        subscriptions = response.json()["subscriptions"]
+        (await client.post(f"{eventing_url}/reset")).raise_for_status()
+        for subscription in subscriptions:
+            url = subscription["subscriber_url"]
+            for cluster_url, local_url in replacements.items():
+                url = url.replace(cluster_url, local_url)
+            response = await client.post(
+                f"{eventing_url}/subscriptions",
+                json={**subscription, "subscriber_url": url},
+            )
+            response.raise_for_status()
+
+
+def db_round_trip_counter() -> Tuple[str, Any]:
+    """Return a metric name and a function reading its current value.
+
+    Returns ("", None) if the database cannot be reached.
+    """
+    import psycopg
+
+    conninfo = (
+        f"host={os.environ.get('POSTGRES_HOST', 'localhost')} "
+        f"port={os.environ.get('POSTGRES_PORT', '5432')} "
+        f"dbname={os.environ.get('POSTGRES_DB', 'llama_agents')} "
+        f"user={os.environ.get('POSTGRES_USER', 'pgvector')} "
+        f"password={os.environ.get('POSTGRES_PASSWORD', 'pgvector')}"
+    )
+    try:
+        conn = psycopg.connect(conninfo, autocommit=True, connect_timeout=5)
+    except psycopg.Error as e:
+        print(f"WARNING: DB stats unavailable: {e}", file=sys.stderr)
+        return "", None
+
+    has_statements = conn.execute(
+        "SELECT 1 FROM pg_extension WHERE extname = 'pg_stat_statements'"
+    ).fetchone()
+    if has_statements:
+        query = (
+            "SELECT coalesce(sum(calls), 0) FROM pg_stat_statements "
+            "WHERE dbid = (SELECT oid FROM pg_database "
+            "WHERE datname = current_database())"
+        )
+        name = "db_statements_per_turn"
+    else:
+        query = (
+            "SELECT xact_commit + xact_rollback FROM pg_stat_database "
+            "WHERE datname = current_database()"
+        )
+        name = "db_transactions_per_turn"
+
+    def read() -> int:
+        if not has_statements:
+            # Statistics are cached per transaction; take a fresh snapshot
+            conn.execute("SELECT pg_stat_clear_snapshot()")
+        row = conn.execute(query).fetchone()
+        return int(row[0]) if row else 0
+
+    return name, read
+
+
+async def send_request(
+    client: httpx.AsyncClient, url: str, user_id: str, content: str
+) -> Result:
+    """Send one request and time it."""
+    start = time.perf_counter()
+    try:
+        response = await client.post(
+            f"{url}/api/v1/requests/generic",
+            json={
+                "integration_type": "CLI",
+                "user_id": user_id,
+                "content": content,
+                "request_type": "message",
+            },
+        )
+        latency = time.perf_counter() - start
+        if response.status_code >= 400:
+            return Result(latency, False, f"HTTP {response.status_code}")
+        body = response.json()
+        if isinstance(body, dict) and body.get("error"):
+            return Result(latency, False, "error response")
+        return Result(latency, True, None)
+    except httpx.HTTPError as e:
+        return Result(time.perf_counter() - start, False, type(e).__name__)
+
+
+async def run_load(
+    url: str,
+    rate: float,
+    duration: float,
+    users: List[str],
+    timeout: float,
+    seed: int,
+) -> Tuple[List[Result], float]:
+    """Send requests at an open-loop Poisson arrival rate.
+
+    Returns:
+        Results of all requests and the wall-clock time until the last finished
+    """
+    rng = random.Random(seed)
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=100)
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+        tasks: List["asyncio.Task[Result]"] = []
+        start = time.perf_counter()
+        next_arrival = start
+        while next_arrival - start < duration:
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            user_id = rng.choice(users)
+            content = f"I need a new laptop (request {len(tasks) + 1})"
+            tasks.append(
+                asyncio.create_task(send_request(client, url, user_id, content))
+            )
+            next_arrival += rng.expovariate(rate)
+        results = await asyncio.gather(*tasks)
+        return list(results), time.perf_counter() - start
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(
+    results: List[Result], elapsed: float, db_metric: str, db_delta: Optional[int]
+) -> Dict[str, Any]:
+    """Build the report from request results."""
+    ok_latencies = sorted(r.latency for r in results if r.ok)
+    errors: Dict[str, int] = {}
+    for result in results:
+        if not result.ok:
+            key = result.error or "unknown"
+            errors[key] = errors.get(key, 0) + 1
+    report: Dict[str, Any] = {
+        "requests": len(results),
+        "succeeded": len(ok_latencies),
+        "error_rate": (
+            (len(results) - len(ok_latencies)) / len(results) if results else 0.0
+        ),
+        "errors": errors,
+        "throughput_rps": len(ok_latencies) / elapsed if elapsed else 0.0,
+        "latency_p50_s": percentile(ok_latencies, 50),
+        "latency_p95_s": percentile(ok_latencies, 95),
+        "latency_p99_s": percentile(ok_latencies, 99),
+        "latency_max_s": ok_latencies[-1] if ok_latencies else 0.0,
+    }
+    if db_metric and db_delta is not None and results:
+        report[db_metric] = db_delta / len(results)
+    return report
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    processes: List[subprocess.Popen] = []
+    url = args.request_manager_url
+    if not args.no_start:
+        log_dir = Path(args.log_dir or tempfile.mkdtemp(prefix="load-harness-"))
+        log_dir.mkdir(parents=True, exist_ok=True)
+        print(f"Service logs: {log_dir}")
+        processes = await start_services(args.base_port, log_dir, args.startup_timeout)
+        url = service_url(args.base_port, "request-manager")
+
+    try:
+        rng = random.Random(args.seed)
+        users = [
+            str(uuid.UUID(int=rng.getrandbits(128), version=4))
+            for _ in range(args.users)
+        ]
+
+        print(f"Warming up with {args.warmup} request(s)...")
+        async with httpx.AsyncClient(timeout=args.timeout) as client:
+            for i in range(args.warmup):
+                await send_request(client, url, users[i % len(users)], "Hello")
+
+        db_metric, read_db = ("", None) if args.no_db_stats else db_round_trip_counter()
+        db_before = read_db() if read_db else None
+
+        print(
+            f"Sending {args.rate} req/s for {args.duration}s "
+            f"across {args.users} users..."
+        )
+        results, elapsed = await run_load(
+            url, args.rate, args.duration, users, args.timeout, args.seed
+        )
+
+        db_delta = read_db() - db_before if read_db and db_before is not None else None
+        report = {
+            "config": {
+                "rate": args.rate,
+                "duration": args.duration,
+                "users": args.users,
+                "seed": args.seed,
+            },
+            **summarize(results, elapsed, db_metric, db_delta),
+        }
+    finally:
+        stop_services(processes)
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    return 0 if report["succeeded"] else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="End-to-end load-testing harness")
+    parser.add_argument(
+        "--rate", type=float, default=2.0, help="Arrival rate in requests/second"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60.0, help="Seconds to send requests for"
+    )
+    parser.add_argument(
+        "--users", type=int, default=50, help="Distinct users requests come from"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=3, help="Requests sent before measuring"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=150.0, help="Per-request timeout in seconds"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for arrivals")
+    parser.add_argument(
+        "--base-port",
+        type=int,
+        default=18300,
+        help="First of the consecutive ports the services listen on",
+    )
+    parser.add_argument(
+        "--startup-timeout",
+        type=float,
+        default=120.0,
+        help="Seconds to wait for each service to become healthy",
+    )
+    parser.add_argument("--log-dir", help="Directory for service logs")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument(
+        "--no-start",
+        action="store_true",
+        help="Use already running services at --request-manager-url",
+    )
+    parser.add_argument(
+        "--request-manager-url",
+        default=os.environ.get("REQUEST_MANAGER_URL", "http://localhost:8080"),
+        help="Request Manager URL when using --no-start",
+    )
+    parser.add_argument(
+        "--no-db-stats", action="store_true", help="Skip database round-trip counts"
+    )
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())